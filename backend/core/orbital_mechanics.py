@@ -21,6 +21,11 @@ from utils.constants import (
 )
 
 
+def _clip_unit(x: float) -> float:
+    """Clamp to [-1, 1] before acos to absorb rounding error."""
+    return -1.0 if x < -1.0 else (1.0 if x > 1.0 else x)
+
+
 def state_vectors_to_elements(
     r: np.ndarray, v: np.ndarray
 ) -> dict[str, float]:
@@ -34,21 +39,30 @@ def state_vectors_to_elements(
         Dictionary with orbital elements and derived quantities.
     """
     mu = MU_EARTH
-    r_mag = np.linalg.norm(r)
-    v_mag = np.linalg.norm(v)
-
-    # Specific angular momentum
-    h = np.cross(r, v)
-    h_mag = np.linalg.norm(h)
+    # Plain floats + math.*: on 3-vectors NumPy's per-call overhead
+    # dominates the handful of FLOPs involved.
+    rx, ry, rz = float(r[0]), float(r[1]), float(r[2])
+    vx, vy, vz = float(v[0]), float(v[1]), float(v[2])
+    r_mag = math.sqrt(rx * rx + ry * ry + rz * rz)
+    v_mag = math.sqrt(vx * vx + vy * vy + vz * vz)
+    r_dot_v = rx * vx + ry * vy + rz * vz
+
+    # Specific angular momentum (r x v)
+    hx = ry * vz - rz * vy
+    hy = rz * vx - rx * vz
+    hz = rx * vy - ry * vx
+    h_mag = math.sqrt(hx * hx + hy * hy + hz * hz)
 
     # Node vector (k_hat x h)
-    k_hat = np.array([0.0, 0.0, 1.0])
-    n = np.cross(k_hat, h)
-    n_mag = np.linalg.norm(n)
+    nx, ny = -hy, hx
+    n_mag = math.sqrt(nx * nx + ny * ny)
 
     # Eccentricity vector
-    e_vec = ((v_mag ** 2 - mu / r_mag) * r - np.dot(r, v) * v) / mu
-    ecc = np.linalg.norm(e_vec)
+    c_r = v_mag * v_mag - mu / r_mag
+    ex = (c_r * rx - r_dot_v * vx) / mu
+    ey = (c_r * ry - r_dot_v * vy) / mu
+    ez = (c_r * rz - r_dot_v * vz) / mu
+    ecc = math.sqrt(ex * ex + ey * ey + ez * ez)
 
     # Specific energy
     energy = v_mag ** 2 / 2.0 - mu / r_mag
@@ -60,27 +74,25 @@ def state_vectors_to_elements(
         sma = float("inf")
 
     # Inclination
-    inc_rad = math.acos(np.clip(h[2] / h_mag, -1.0, 1.0))
+    inc_rad = math.acos(_clip_unit(hz / h_mag))
 
     # RAAN (Right Ascension of Ascending Node)
     if n_mag > 1e-10:
-        raan_rad = math.acos(np.clip(n[0] / n_mag, -1.0, 1.0))
-        if n[1] < 0:
+        raan_rad = math.acos(_clip_unit(nx / n_mag))
+        if ny < 0:
             raan_rad = TWO_PI - raan_rad
     else:
         raan_rad = 0.0
 
     # Argument of perigee
     if n_mag > 1e-10 and ecc > 1e-10:
-        aop_rad = math.acos(
-            np.clip(np.dot(n, e_vec) / (n_mag * ecc), -1.0, 1.0)
-        )
-        if e_vec[2] < 0:
+        aop_rad = math.acos(_clip_unit((nx * ex + ny * ey) / (n_mag * ecc)))
+        if ez < 0:
             aop_rad = TWO_PI - aop_rad
     elif ecc > 1e-10:
         # Equatorial orbit: measure from x-axis
-        aop_rad = math.acos(np.clip(e_vec[0] / ecc, -1.0, 1.0))
-        if e_vec[1] < 0:
+        aop_rad = math.acos(_clip_unit(ex / ecc))
+        if ey < 0:
             aop_rad = TWO_PI - aop_rad
     else:
         aop_rad = 0.0
@@ -88,21 +100,19 @@ def state_vectors_to_elements(
     # True anomaly
     if ecc > 1e-10:
         ta_rad = math.acos(
-            np.clip(np.dot(e_vec, r) / (ecc * r_mag), -1.0, 1.0)
+            _clip_unit((ex * rx + ey * ry + ez * rz) / (ecc * r_mag))
         )
-        if np.dot(r, v) < 0:
+        if r_dot_v < 0:
             ta_rad = TWO_PI - ta_rad
     elif n_mag > 1e-10:
         # Circular non-equatorial: measure from ascending node
-        ta_rad = math.acos(
-            np.clip(np.dot(n, r) / (n_mag * r_mag), -1.0, 1.0)
-        )
-        if r[2] < 0:
+        ta_rad = math.acos(_clip_unit((nx * rx + ny * ry) / (n_mag * r_mag)))
+        if rz < 0:
             ta_rad = TWO_PI - ta_rad
     else:
         # Circular equatorial: measure from x-axis
-        ta_rad = math.acos(np.clip(r[0] / r_mag, -1.0, 1.0))
-        if r[1] < 0:
+        ta_rad = math.acos(_clip_unit(rx / r_mag))
+        if ry < 0:
             ta_rad = TWO_PI - ta_rad
 
     # Derived quantities
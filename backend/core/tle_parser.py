@@ -9,17 +9,48 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import pickle
+import tempfile
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from utils.constants import CELESTRAK_GROUPS, SECONDS_PER_DAY
 from utils.downloader import DownloadResult, DownloadStatus, Downloader
 from utils.time_utils import tle_epoch_to_datetime
 
 logger = logging.getLogger(__name__)
 
+# Bump when TLEData changes shape so stale parsed caches are ignored
+PARSED_CACHE_VERSION = 1
+
+# Single metadata index for all cached groups (inside tle_cache/)
+CACHE_INDEX_NAME = "cache_index.json"
+
+
+def _replace_atomically(path: Path, data: bytes) -> None:
+    """Write data to path through a uniquely named temp file and a rename.
+
+    Readers never see a partial file, and concurrent writers of the same
+    path never share a temp file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class TLEParseError(Exception):
     """Raised when TLE data cannot be parsed."""
@@ -99,23 +130,35 @@ class TLECacheEntry:
     fetched_at: datetime
     tle_count: int
 
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now(timezone.utc) - self.fetched_at).total_seconds()
+
     @property
     def is_expired(self) -> bool:
-        age = (datetime.now(timezone.utc) - self.fetched_at).total_seconds()
-        return age > SECONDS_PER_DAY
+        return self.age_seconds > SECONDS_PER_DAY
 
 
 def validate_checksum(line: str) -> bool:
     """Validate TLE line checksum (last digit)."""
     if len(line) < 69:
         return False
-    checksum = 0
-    for ch in line[:68]:
-        if ch.isdigit():
-            checksum += int(ch)
-        elif ch == "-":
-            checksum += 1
-    return (checksum % 10) == int(line[68])
+    row = np.frombuffer(line[:69].encode("ascii", "replace"), dtype=np.uint8)
+    return bool(_checksums_valid(row[np.newaxis, :])[0])
+
+
+def _checksums_valid(buf: np.ndarray) -> np.ndarray:
+    """Checksum validity for each row of an (N, >=69) uint8 TLE line buffer.
+
+    Digits count their value and '-' counts 1; computed without branches
+    as masked byte arithmetic over all rows at once.
+    """
+    body = buf[:, :68]
+    is_digit = (body >= ord("0")) & (body <= ord("9"))
+    digit_sum = np.where(is_digit, body - ord("0"), 0).sum(axis=1, dtype=np.int64)
+    minus_count = np.count_nonzero(body == ord("-"), axis=1)
+    check = buf[:, 68].astype(np.int64) - ord("0")
+    return ((digit_sum + minus_count) % 10) == check
 
 
 def _parse_modified_exponent(field_str: str) -> float:
@@ -123,6 +166,20 @@ def _parse_modified_exponent(field_str: str) -> float:
 
     Examples: ' 00000-0' -> 0.0, ' 38792-4' -> 3.8792e-5, '-11606-4' -> -1.1606e-5
     """
+    # Fast path: the standard fixed ``SMMMMMSE`` layout, read by column
+    if (
+        len(field_str) == 8
+        and field_str[0] in " +-"
+        and field_str[1:6].isdigit()
+        and field_str[6] in "+-"
+        and field_str[7].isdigit()
+    ):
+        mantissa = int(field_str[1:6])
+        if mantissa == 0:
+            return 0.0
+        value = (mantissa / 1e5) * 10.0 ** int(field_str[6:8])
+        return -value if field_str[0] == "-" else value
+
     s = field_str.strip()
     if not s or s == "0" or all(c in "0 +-" for c in s):
         return 0.0
@@ -247,7 +304,8 @@ def parse_tle_text(text: str) -> list[TLEData]:
     Handles both 2-line format (no name) and 3-line format (name + 2 lines).
     """
     lines = [line.rstrip() for line in text.strip().splitlines() if line.strip()]
-    results: list[TLEData] = []
+    # (line index, name, line1, line2) for each TLE set found
+    entries: list[tuple[int, str, str, str]] = []
     i = 0
 
     while i < len(lines):
@@ -255,31 +313,185 @@ def parse_tle_text(text: str) -> list[TLEData]:
         if lines[i].startswith("1 ") and len(lines[i]) >= 69:
             # 2-line format (no name)
             if i + 1 < len(lines) and lines[i + 1].startswith("2 "):
-                try:
-                    cat_num = lines[i][2:7].strip()
-                    tle = parse_tle_lines(f"SAT-{cat_num}", lines[i], lines[i + 1])
-                    results.append(tle)
-                except TLEParseError as e:
-                    logger.warning("Skipping bad TLE at line %d: %s", i, e)
+                cat_num = lines[i][2:7].strip()
+                entries.append((i, f"SAT-{cat_num}", lines[i], lines[i + 1]))
                 i += 2
             else:
                 i += 1
         elif i + 2 < len(lines) and lines[i + 1].startswith("1 ") and lines[i + 2].startswith("2 "):
             # 3-line format (name + line1 + line2)
-            try:
-                tle = parse_tle_lines(lines[i], lines[i + 1], lines[i + 2])
-                results.append(tle)
-            except TLEParseError as e:
-                logger.warning("Skipping bad TLE at line %d: %s", i, e)
+            entries.append((i, lines[i], lines[i + 1], lines[i + 2]))
             i += 3
         else:
             i += 1
 
-    return results
+    return _parse_tle_entries(entries)
+
+
+def _parse_tle_entries(
+    entries: list[tuple[int, str, str, str]],
+) -> list[TLEData]:
+    """Parse collected TLE sets, column-wise where possible.
+
+    Well-formed sets go through _parse_tle_columns in one batch; anything
+    else (short or non-ASCII lines, or a batch with a malformed field)
+    falls back to parse_tle_lines per set, which logs and skips bad ones.
+    """
+    parsed: list[Optional[TLEData]] = [None] * len(entries)
+    fast: list[int] = []
+    for k, (_, _, line1, line2) in enumerate(entries):
+        if len(line1.strip()) >= 69 and len(line2.strip()) >= 69 and (line1 + line2).isascii():
+            fast.append(k)
+
+    if fast:
+        try:
+            batch = _parse_tle_columns([entries[k] for k in fast])
+        except (ValueError, IndexError) as e:
+            logger.debug("Column-wise TLE parse failed, parsing one by one: %s", e)
+            fast = []
+        else:
+            for k, tle in zip(fast, batch):
+                parsed[k] = tle
+
+    done = set(fast)
+    for k, (line_no, name, line1, line2) in enumerate(entries):
+        if k in done:
+            continue
+        try:
+            parsed[k] = parse_tle_lines(name, line1, line2)
+        except TLEParseError as e:
+            logger.warning("Skipping bad TLE at line %d: %s", line_no, e)
+
+    return [tle for tle in parsed if tle is not None]
+
+
+def _byte_column(buf: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Fixed-width field [start:stop) of every row as a stripped bytes array."""
+    col = np.ascontiguousarray(buf[:, start:stop]).view(f"S{stop - start}").ravel()
+    return np.char.strip(col)
+
+
+def _column_floats(col: np.ndarray, blank: Optional[float] = None) -> np.ndarray:
+    if blank is not None:
+        col = np.where(col == b"", b"0", col)
+    return col.astype(np.float64)
+
+
+def _column_ints(col: np.ndarray, blank: Optional[int] = None) -> np.ndarray:
+    if blank is not None:
+        col = np.where(col == b"", b"0", col)
+    return col.astype(np.int64)
+
+
+_POW10 = np.array([10.0 ** e for e in range(-9, 10)])
+
+
+def _column_modified_exponent(buf: np.ndarray, start: int) -> list[float]:
+    """Vectorized _parse_modified_exponent for the 8-char field at ``start``.
+
+    Handles the standard ``SMMMMMSE`` layout column-wise; other layouts
+    go through _parse_modified_exponent.
+    """
+    raw = buf[:, start:start + 8]
+    digits = (raw >= ord("0")) & (raw <= ord("9"))
+    standard = (
+        np.isin(raw[:, 0], (ord(" "), ord("+"), ord("-")))
+        & digits[:, 1:6].all(axis=1)
+        & np.isin(raw[:, 6], (ord("+"), ord("-")))
+        & digits[:, 7]
+    )
+
+    mantissa = (raw[:, 1:6].astype(np.int64) - ord("0")) @ np.array(
+        [10000, 1000, 100, 10, 1]
+    )
+    exponent = raw[:, 7].astype(np.int64) - ord("0")
+    exponent = np.where(raw[:, 6] == ord("-"), -exponent, exponent)
+    sign = np.where(raw[:, 0] == ord("-"), -1.0, 1.0)
+    # Python's 10.0 ** e, looked up, so values match the scalar parser bit-for-bit
+    values = sign * (mantissa / 1e5) * _POW10[exponent + 9]
+    values[mantissa == 0] = 0.0
+
+    result = values.tolist()
+    for k in np.flatnonzero(~standard).tolist():
+        result[k] = _parse_modified_exponent(raw[k].tobytes().decode("ascii"))
+    return result
+
+
+def _parse_tle_columns(
+    entries: list[tuple[int, str, str, str]],
+) -> list[TLEData]:
+    """Parse many well-formed TLE sets at once by fixed-column slicing.
+
+    Field-for-field equivalent to parse_tle_lines, but each numeric field
+    is converted for all sets in one NumPy call instead of per line.
+    """
+    names = [name.strip() for _, name, _, _ in entries]
+    lines1 = [line1.strip() for _, _, line1, _ in entries]
+    lines2 = [line2.strip() for _, _, _, line2 in entries]
+
+    n = len(entries)
+    buf1 = np.frombuffer("".join(l[:69] for l in lines1).encode("ascii"), dtype=np.uint8).reshape(n, 69)
+    buf2 = np.frombuffer("".join(l[:69] for l in lines2).encode("ascii"), dtype=np.uint8).reshape(n, 69)
+
+    for k in np.flatnonzero(~_checksums_valid(buf1)).tolist():
+        logger.warning("Line 1 checksum failed for %s", names[k])
+    for k in np.flatnonzero(~_checksums_valid(buf2)).tolist():
+        logger.warning("Line 2 checksum failed for %s", names[k])
+
+    catalog_numbers = _column_ints(_byte_column(buf1, 2, 7)).tolist()
+    classifications = [c or "U" for c in np.char.decode(_byte_column(buf1, 7, 8), "ascii").tolist()]
+    intl_designators = np.char.decode(_byte_column(buf1, 9, 17), "ascii").tolist()
+    epoch_years = _column_ints(_byte_column(buf1, 18, 20)).tolist()
+    epoch_days = _column_floats(_byte_column(buf1, 20, 32)).tolist()
+    mm_dots = _column_floats(_byte_column(buf1, 33, 43), blank=0.0).tolist()
+    mm_ddots = _column_modified_exponent(buf1, 44)
+    bstars = _column_modified_exponent(buf1, 53)
+    ephemeris_types = _column_ints(_byte_column(buf1, 62, 63), blank=0).tolist()
+    element_set_numbers = _column_ints(_byte_column(buf1, 64, 68), blank=0).tolist()
+
+    inclinations = _column_floats(_byte_column(buf2, 8, 16)).tolist()
+    raans = _column_floats(_byte_column(buf2, 17, 25)).tolist()
+    # Eccentricity has implied leading decimal point
+    eccentricities = np.char.add(b"0.", _byte_column(buf2, 26, 33)).astype(np.float64).tolist()
+    arg_perigees = _column_floats(_byte_column(buf2, 34, 42)).tolist()
+    mean_anomalies = _column_floats(_byte_column(buf2, 43, 51)).tolist()
+    mean_motions = _column_floats(_byte_column(buf2, 52, 63)).tolist()
+    revolution_numbers = _column_ints(_byte_column(buf2, 63, 68), blank=0).tolist()
+
+    return [
+        TLEData(
+            name=names[k],
+            catalog_number=catalog_numbers[k],
+            classification=classifications[k],
+            international_designator=intl_designators[k],
+            epoch_year=epoch_years[k],
+            epoch_day=epoch_days[k],
+            epoch_datetime=tle_epoch_to_datetime(epoch_years[k], epoch_days[k]),
+            mean_motion_dot=mm_dots[k],
+            mean_motion_ddot=mm_ddots[k],
+            bstar=bstars[k],
+            inclination=inclinations[k],
+            raan=raans[k],
+            eccentricity=eccentricities[k],
+            arg_perigee=arg_perigees[k],
+            mean_anomaly=mean_anomalies[k],
+            mean_motion=mean_motions[k],
+            revolution_number=revolution_numbers[k],
+            element_set_number=element_set_numbers[k],
+            ephemeris_type=ephemeris_types[k],
+            line1=lines1[k],
+            line2=lines2[k],
+        )
+        for k in range(n)
+    ]
 
 
 class TLEManager:
-    """Manages TLE loading, parsing, and caching."""
+    """Manages TLE loading, parsing, and caching.
+
+    Safe to share between worker threads; one instance per data directory
+    keeps parsed files in memory and reuses the downloader's HTTP session.
+    """
 
     def __init__(self, data_dir: Path, downloader: Optional[Downloader] = None):
         self._data_dir = data_dir
@@ -287,30 +499,62 @@ class TLEManager:
         self._cache_dir = data_dir / "tle_cache"
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._cache_meta: dict[str, TLECacheEntry] = {}
+        self._meta_lock = threading.Lock()
+        # Parsed cache files kept in memory: path -> (signature, tles)
+        self._parsed: dict[Path, tuple[tuple[int, int], list[TLEData]]] = {}
         self._load_cache_metadata()
 
     def load_from_file(self, filepath: Path) -> list[TLEData]:
-        """Parse all TLEs from a local file."""
+        """Parse all TLEs from a local file.
+
+        Files in the TLE cache keep a pickled copy of their parse result
+        alongside, and the parse is also held in memory by this manager;
+        both are reused while the file's size and mtime are unchanged
+        (e.g. after a 304 Not Modified refresh).
+        """
         logger.info("Loading TLEs from file: %s", filepath)
+        cacheable = filepath.parent == self._cache_dir
+        if cacheable:
+            try:
+                signature = self._file_signature(filepath)
+            except OSError as e:
+                logger.error("Failed to read TLE file %s: %s", filepath, e)
+                return []
+            memo = self._parsed.get(filepath)
+            if memo is not None and memo[0] == signature:
+                return list(memo[1])
+            cached = self._load_parsed_cache(filepath)
+            if cached is not None:
+                self._parsed[filepath] = (signature, cached)
+                return list(cached)
         try:
             text = filepath.read_text(encoding="utf-8")
-            return parse_tle_text(text)
+            tles = parse_tle_text(text)
         except Exception as e:
             logger.error("Failed to read TLE file %s: %s", filepath, e)
             return []
+        if cacheable:
+            self._save_parsed_cache(filepath, tles)
+            self._parsed[filepath] = (signature, tles)
+            return list(tles)
+        return tles
 
     def load_from_celestrak_group(
         self,
         group_display_name: str,
         force_refresh: bool = False,
+        max_age_seconds: float = SECONDS_PER_DAY,
     ) -> list[TLEData]:
-        """Load a curated satellite group with caching."""
+        """Load a curated satellite group with caching.
+
+        The cached copy is used while it is younger than max_age_seconds.
+        """
         celestrak_key = CELESTRAK_GROUPS.get(group_display_name, group_display_name)
 
         # Check cache
         if not force_refresh and celestrak_key in self._cache_meta:
             entry = self._cache_meta[celestrak_key]
-            if not entry.is_expired and entry.file_path.exists():
+            if entry.age_seconds <= max_age_seconds and entry.file_path.exists():
                 logger.info("Using cached TLEs for %s", group_display_name)
                 return self.load_from_file(entry.file_path)
 
@@ -364,39 +608,105 @@ class TLEManager:
         """Return the curated groups dict (display name -> Celestrak key)."""
         return dict(CELESTRAK_GROUPS)
 
+    @staticmethod
+    def _parsed_cache_path(filepath: Path) -> Path:
+        return filepath.with_suffix(filepath.suffix + ".parsed.pkl")
+
+    @staticmethod
+    def _file_signature(filepath: Path) -> tuple[int, int]:
+        stat = filepath.stat()
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _load_parsed_cache(self, filepath: Path) -> Optional[list[TLEData]]:
+        """Return the pickled parse of ``filepath`` if it is still current."""
+        pkl_path = self._parsed_cache_path(filepath)
+        try:
+            if not pkl_path.exists():
+                return None
+            with open(pkl_path, "rb") as f:
+                payload = pickle.load(f)
+            if (
+                payload.get("version") != PARSED_CACHE_VERSION
+                or tuple(payload.get("signature", ())) != self._file_signature(filepath)
+            ):
+                return None
+            logger.debug("Using parsed TLE cache %s", pkl_path)
+            return payload["tles"]
+        except Exception as e:
+            logger.warning("Ignoring parsed TLE cache %s: %s", pkl_path, e)
+            return None
+
+    def _save_parsed_cache(self, filepath: Path, tles: list[TLEData]) -> None:
+        """Pickle the parse result of ``filepath`` next to it."""
+        pkl_path = self._parsed_cache_path(filepath)
+        payload = {
+            "version": PARSED_CACHE_VERSION,
+            "signature": self._file_signature(filepath),
+            "tles": tles,
+        }
+        try:
+            # Write-then-rename so readers never see a partial pickle
+            _replace_atomically(
+                pkl_path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except Exception as e:
+            logger.warning("Failed to write parsed TLE cache %s: %s", pkl_path, e)
+
     def _load_cache_metadata(self) -> None:
-        """Scan cache directory and build metadata index."""
-        for meta_file in self._cache_dir.glob("*.meta"):
+        """Load the metadata index for all cached groups.
+
+        Falls back to scanning legacy per-group ``.meta`` files when no
+        index has been written yet.
+        """
+        index_path = self._cache_dir / CACHE_INDEX_NAME
+        if index_path.exists():
+            try:
+                index = json.loads(index_path.read_text())
+            except Exception as e:
+                logger.warning("Failed to load cache index %s: %s", index_path, e)
+                index = {}
+        else:
+            index = {}
+            for meta_file in self._cache_dir.glob("*.meta"):
+                try:
+                    index[meta_file.stem] = json.loads(meta_file.read_text())
+                except Exception as e:
+                    logger.warning("Failed to load cache metadata %s: %s", meta_file, e)
+
+        for group_key, data in index.items():
             try:
-                data = json.loads(meta_file.read_text())
-                group_key = meta_file.stem
-                tle_path = self._cache_dir / f"{group_key}.tle"
                 self._cache_meta[group_key] = TLECacheEntry(
                     group_key=group_key,
-                    file_path=tle_path,
+                    file_path=self._cache_dir / f"{group_key}.tle",
                     fetched_at=datetime.fromisoformat(data["fetched_at"]),
                     tle_count=data.get("tle_count", 0),
                 )
             except Exception as e:
-                logger.warning("Failed to load cache metadata %s: %s", meta_file, e)
+                logger.warning("Invalid cache metadata for %s: %s", group_key, e)
 
     def _write_cache_metadata(
         self, group_key: str, file_path: Path, tle_count: int
     ) -> None:
-        """Write metadata JSON alongside the cached TLE file."""
-        meta_path = self._cache_dir / f"{group_key}.meta"
+        """Record a group fetch and rewrite the metadata index atomically."""
         now = datetime.now(timezone.utc)
-        data = {
-            "fetched_at": now.isoformat(),
-            "tle_count": tle_count,
-        }
-        try:
-            meta_path.write_text(json.dumps(data))
-            self._cache_meta[group_key] = TLECacheEntry(
-                group_key=group_key,
-                file_path=file_path,
-                fetched_at=now,
-                tle_count=tle_count,
-            )
-        except Exception as e:
-            logger.warning("Failed to write cache metadata: %s", e)
+        entry = TLECacheEntry(
+            group_key=group_key,
+            file_path=file_path,
+            fetched_at=now,
+            tle_count=tle_count,
+        )
+        with self._meta_lock:
+            index = {
+                key: {
+                    "fetched_at": e.fetched_at.isoformat(),
+                    "tle_count": e.tle_count,
+                }
+                for key, e in {**self._cache_meta, group_key: entry}.items()
+            }
+            index_path = self._cache_dir / CACHE_INDEX_NAME
+            try:
+                # Write-then-rename so a crash never leaves a torn index behind
+                _replace_atomically(index_path, json.dumps(index).encode())
+                self._cache_meta[group_key] = entry
+            except Exception as e:
+                logger.warning("Failed to write cache metadata: %s", e)
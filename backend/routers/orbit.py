@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
@@ -150,13 +150,19 @@ def ground_track(
         "name": tle.name,
         "points": [
             {
-                "datetime_utc": p.datetime_utc.isoformat(),
-                "latitude": p.latitude,
-                "longitude": p.longitude,
-                "altitude_km": p.altitude,
-                "in_shadow": p.in_shadow,
+                "datetime_utc": dt.replace(tzinfo=timezone.utc).isoformat(),
+                "latitude": lat,
+                "longitude": lon,
+                "altitude_km": alt,
+                "in_shadow": shadow,
             }
-            for p in track
+            for dt, lat, lon, alt, shadow in zip(
+                track.datetimes.tolist(),
+                track.latitudes.tolist(),
+                track.longitudes.tolist(),
+                track.altitudes.tolist(),
+                track.in_shadow.tolist(),
+            )
         ],
     }
 
@@ -25,7 +25,7 @@ from sgp4.api import Satrec, jday
 from core.propagator import OrbitalPropagator
 from core.tle_parser import TLEData
 from utils.constants import MU_EARTH, R_EARTH
-from utils.time_utils import datetime_to_jd
+from utils.time_utils import offset_time_grid
 
 from .collision_probability import compute_collision_probability, classify_threat_level
 from .uncertainty_model import (
@@ -133,13 +133,9 @@ def screen_asset(
     detection_envelope_km = coarse_step * 15.0 + distance_threshold_km
 
     # Build JD arrays for coarse grid
-    jd_coarse = np.zeros(n_coarse)
-    fr_coarse = np.zeros(n_coarse)
-    for i in range(n_coarse):
-        dt = start_dt + timedelta(seconds=i * coarse_step)
-        jd_val = datetime_to_jd(dt)
-        jd_coarse[i] = jd_val.jd
-        fr_coarse[i] = jd_val.fr
+    jd_coarse, fr_coarse = offset_time_grid(
+        start_dt, np.arange(n_coarse) * coarse_step
+    )
 
     # Pre-propagate primary asset (vectorized SGP4)
     primary_sat = Satrec.twoline2rv(asset_tle.line1, asset_tle.line2)
@@ -210,13 +206,9 @@ def screen_asset(
             fine_end = min(total_seconds, center_sec + 2 * coarse_step)
             n_fine = int((fine_end - fine_start) / fine_step) + 1
 
-            jd_fine = np.zeros(n_fine)
-            fr_fine = np.zeros(n_fine)
-            for i in range(n_fine):
-                dt = start_dt + timedelta(seconds=fine_start + i * fine_step)
-                jd_val = datetime_to_jd(dt)
-                jd_fine[i] = jd_val.jd
-                fr_fine[i] = jd_val.fr
+            jd_fine, fr_fine = offset_time_grid(
+                start_dt, fine_start + np.arange(n_fine) * fine_step
+            )
 
             # Propagate both on fine grid
             pf_err, pf_pos, _ = primary_sat.sgp4_array(jd_fine, fr_fine)
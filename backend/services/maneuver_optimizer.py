@@ -16,9 +16,8 @@ from typing import Optional
 
 import numpy as np
 
-from core.propagator import OrbitalPropagator
 from core.tle_parser import TLEData
-from utils.constants import MU_EARTH
+from utils.constants import MU_EARTH, TWO_PI
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +54,11 @@ def compute_avoidance_maneuvers(
       - Radial ΔV    → radial offset     ≈ ΔV × period / (2π)
       - Cross-track ΔV → cross-track offset ≈ ΔV × period / (2π)
 
-    Generates options for each direction (±) and several ΔV magnitudes.
+    Generates options for each direction (±) and several ΔV magnitudes,
+    stopping along a direction once its Pc drops below 0.1 × pc_threshold.
     """
-    options: list[ManeuverOption] = []
+    # Deferred so importing this module doesn't pull in the SGP4 extension
+    from core.propagator import OrbitalPropagator
 
     try:
         primary_prop = OrbitalPropagator(asset_tle)
@@ -83,14 +84,14 @@ def compute_avoidance_maneuvers(
     r1_m = r1 * 1000.0
     v1_ms = v1 * 1000.0
 
-    r_mag = np.linalg.norm(r1_m)
+    r_mag = _norm3(r1_m)
     if r_mag < 1.0:
         logger.error("Primary position too small for RIC decomposition")
         return []
 
     e_r = r1_m / r_mag
     h = np.cross(r1_m, v1_ms)
-    h_mag = np.linalg.norm(h)
+    h_mag = _norm3(h)
     if h_mag < 1.0:
         logger.error("Angular momentum too small for RIC decomposition")
         return []
@@ -102,6 +103,136 @@ def compute_avoidance_maneuvers(
     miss_in_track = float(np.dot(delta_r_m, e_i))
     miss_cross_track = float(np.dot(delta_r_m, e_c))
 
+    return _options_from_ric_miss(
+        miss_radial,
+        miss_in_track,
+        miss_cross_track,
+        period_sec,
+        tca,
+        current_miss_m,
+        current_pc,
+        asset_radius_m,
+        delta_v_budget_ms,
+        pc_threshold,
+    )
+
+
+def compute_avoidance_maneuvers_batch(
+    asset_tle: TLEData,
+    secondary_tles: list[TLEData],
+    tcas: list[datetime],
+    current_misses_m: list[float],
+    current_pcs: list[float],
+    asset_radius_m: float = 1.0,
+    delta_v_budget_ms: Optional[float] = None,
+    pc_threshold: float = 1e-5,
+) -> list[list[ManeuverOption]]:
+    """Compute avoidance maneuver options for many conjunctions of one asset.
+
+    Equivalent to calling :func:`compute_avoidance_maneuvers` once per
+    secondary, but propagates the asset to every TCA in a single
+    ``sgp4_array`` call and does the RIC decomposition for all
+    secondaries as array operations.
+
+    Returns one option list per secondary, in input order. Secondaries
+    whose geometry can't be computed get an empty list.
+    """
+    from sgp4.api import Satrec
+
+    from utils.time_utils import datetime_to_jd
+
+    n = len(secondary_tles)
+    results: list[list[ManeuverOption]] = [[] for _ in range(n)]
+    if n == 0:
+        return results
+
+    jd = np.empty(n)
+    fr = np.empty(n)
+    for i, tca in enumerate(tcas):
+        jd_i = datetime_to_jd(tca)
+        jd[i] = jd_i.jd
+        fr[i] = jd_i.fr
+
+    # Asset state at every TCA in one vectorized call
+    primary_sat = Satrec.twoline2rv(asset_tle.line1, asset_tle.line2)
+    if primary_sat.error != 0:
+        logger.error("Failed to set up maneuver computation for %s", asset_tle.name)
+        return results
+    errors, r1, v1 = primary_sat.sgp4_array(jd, fr)
+    valid = errors == 0
+
+    r2 = np.zeros((n, 3))
+    for i, sec_tle in enumerate(secondary_tles):
+        if not valid[i]:
+            continue
+        sec_sat = Satrec.twoline2rv(sec_tle.line1, sec_tle.line2)
+        err, r_tuple, _ = sec_sat.sgp4(jd[i], fr[i])
+        if sec_sat.error != 0 or err != 0:
+            valid[i] = False
+            continue
+        r2[i] = r_tuple
+
+    # Osculating period (same convention as the single-conjunction path)
+    r_km = np.sqrt(np.einsum("ij,ij->i", r1, r1))
+    v_sq = np.einsum("ij,ij->i", v1, v1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sma = -MU_EARTH / (2.0 * (v_sq / 2.0 - MU_EARTH / r_km))
+        period_sec = np.where(
+            sma > 0, TWO_PI * np.sqrt(sma ** 3 / MU_EARTH), np.inf
+        ) * 60.0
+
+    # Decompose every miss vector into RIC components (meters)
+    delta_r_m = (r2 - r1) * 1000.0
+    r1_m = r1 * 1000.0
+    h = np.cross(r1_m, v1 * 1000.0)
+    r_mag = np.sqrt(np.einsum("ij,ij->i", r1_m, r1_m))
+    h_mag = np.sqrt(np.einsum("ij,ij->i", h, h))
+    valid &= (r_mag >= 1.0) & (h_mag >= 1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e_r = r1_m / r_mag[:, None]
+        e_c = h / h_mag[:, None]
+    e_i = np.cross(e_c, e_r)
+
+    miss_radial = np.einsum("ij,ij->i", delta_r_m, e_r)
+    miss_in_track = np.einsum("ij,ij->i", delta_r_m, e_i)
+    miss_cross_track = np.einsum("ij,ij->i", delta_r_m, e_c)
+
+    skipped = n - int(np.count_nonzero(valid))
+    if skipped:
+        logger.warning("Skipping %d/%d conjunctions that failed maneuver setup", skipped, n)
+
+    for i in np.flatnonzero(valid):
+        results[i] = _options_from_ric_miss(
+            float(miss_radial[i]),
+            float(miss_in_track[i]),
+            float(miss_cross_track[i]),
+            float(period_sec[i]),
+            tcas[i],
+            current_misses_m[i],
+            current_pcs[i],
+            asset_radius_m,
+            delta_v_budget_ms,
+            pc_threshold,
+        )
+    return results
+
+
+def _options_from_ric_miss(
+    miss_radial: float,
+    miss_in_track: float,
+    miss_cross_track: float,
+    period_sec: float,
+    tca: datetime,
+    current_miss_m: float,
+    current_pc: float,
+    asset_radius_m: float,
+    delta_v_budget_ms: Optional[float],
+    pc_threshold: float,
+) -> list[ManeuverOption]:
+    """Evaluate the ΔV/direction grid for a miss vector given in RIC (m)."""
+    options: list[ManeuverOption] = []
+
     # Time to TCA for the burn (assume 1 orbit before TCA as reference)
     time_to_tca_sec = period_sec  # default: 1 orbit
 
@@ -123,11 +254,20 @@ def compute_avoidance_maneuvers(
     label_idx = 0
     labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+    # Directions whose Pc is already an order of magnitude below the
+    # threshold; larger ΔV along them only costs fuel, so stop there.
+    # This is operationally sufficient for maneuver planning.
+    sufficient_pc = 0.1 * pc_threshold
+    satisfied: set[str] = set()
+
     for dv_ms in dv_magnitudes:
         if delta_v_budget_ms is not None and dv_ms > delta_v_budget_ms:
             continue
 
         for dir_label, direction, sign in directions:
+            if dir_label in satisfied:
+                continue
+
             # First-order position offset at TCA (meters)
             if direction == "in_track":
                 # In-track ΔV shifts along-track position: offset ≈ ΔV × Δt
@@ -150,10 +290,17 @@ def compute_avoidance_maneuvers(
             new_in_track = miss_in_track + offset_in_track
             new_cross = miss_cross_track + offset_cross
 
-            new_miss_m = math.sqrt(new_radial**2 + new_in_track**2 + new_cross**2)
+            # Work in squared meters; the sqrt is only needed for the option
+            new_miss_sq = (
+                new_radial * new_radial
+                + new_in_track * new_in_track
+                + new_cross * new_cross
+            )
 
             # Recompute collision probability using simplified Foster formula
-            new_pc = _foster_pc_simple(new_miss_m, combined_hbr)
+            new_pc = _foster_pc_simple_sq(new_miss_sq, combined_hbr)
+            if new_pc < sufficient_pc:
+                satisfied.add(dir_label)
 
             burn_dt = tca - timedelta(seconds=time_to_tca_sec)
             fuel_pct = (dv_ms / delta_v_budget_ms * 100.0) if delta_v_budget_ms else 0.0
@@ -167,7 +314,7 @@ def compute_avoidance_maneuvers(
                 delta_v_ms=round(dv_ms, 4),
                 timing_before_tca_orbits=1.0,
                 burn_time=burn_dt,
-                new_miss_distance_m=round(new_miss_m, 1),
+                new_miss_distance_m=round(math.sqrt(new_miss_sq), 1),
                 new_collision_probability=new_pc,
                 fuel_cost_pct=round(fuel_pct, 2),
                 original_miss_m=current_miss_m,
@@ -179,7 +326,15 @@ def compute_avoidance_maneuvers(
     return options
 
 
-def _foster_pc_simple(miss_m: float, combined_hbr_m: float) -> float:
+def _norm3(x) -> float:
+    """Euclidean norm of a 3-vector.
+
+    Avoids the generic ``np.linalg.norm`` dispatch for length-3 inputs.
+    """
+    return math.sqrt(x[0] * x[0] + x[1] * x[1] + x[2] * x[2])
+
+
+def _foster_pc_simple_sq(miss_sq_m2: float, combined_hbr_m: float) -> float:
     """Simplified 2D Gaussian collision probability estimate.
 
     Uses the Foster formula assuming circular, equal sigmas derived from
@@ -189,19 +344,18 @@ def _foster_pc_simple(miss_m: float, combined_hbr_m: float) -> float:
     Pc ≈ (R² / (2 σ²)) × exp(-d² / (2 σ²))
 
     where d = miss distance, R = combined hard body radius, σ = position uncertainty.
+    Takes d² (m²) directly so callers can skip the square root.
     """
-    if miss_m <= 0:
+    if miss_sq_m2 <= 0:
         return 1.0
 
     # Use a reasonable position uncertainty — scale with miss distance
     # Typical LEO covariance sigmas are 50-500 m; use max(miss/3, 50)
-    sigma = max(miss_m / 3.0, 50.0)
-    sigma_sq = sigma * sigma
+    sigma_sq = max(miss_sq_m2 / 9.0, 2500.0)
 
     R = combined_hbr_m
-    d_sq = miss_m * miss_m
 
-    exponent = -d_sq / (2.0 * sigma_sq)
+    exponent = -miss_sq_m2 / (2.0 * sigma_sq)
     if exponent < -500:
         return 0.0
 
@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -29,6 +32,9 @@ CATALOG_URLS = {
     "fengyun-1c-debris": "https://celestrak.org/NORAD/elements/gp.php?GROUP=1999-025&FORMAT=tle",
 }
 
+# Bump when TLEData changes shape so stale pickles fall back to text parsing
+CATALOG_PICKLE_VERSION = 1
+
 
 class TLECatalogService:
     """Manages the full satellite/debris catalog for screening.
@@ -63,9 +69,9 @@ class TLECatalogService:
         Also loads user-added assets from the database.
         """
         try:
-            # Try loading cached catalog
+            # Try loading cached catalog (pre-parsed pickle first, then text)
             cache_file = self._data_dir / "tle_cache" / "full_catalog.txt"
-            if cache_file.exists():
+            if not self._load_catalog_pickle(cache_file) and cache_file.exists():
                 text = cache_file.read_text(encoding="utf-8")
                 if len(text.strip()) > 100:
                     tles = parse_tle_text(text)
@@ -104,6 +110,33 @@ class TLECatalogService:
                 pass
             self._initialized = True
 
+    def _load_catalog_pickle(self, text_cache: Path) -> bool:
+        """Load the pre-parsed catalog pickle if present and current.
+
+        The pickle is only used when it is at least as new as the text
+        cache. Returns True if the catalog was populated from it.
+        """
+        pickle_file = self._data_dir / "tle_cache" / "full_catalog.pkl"
+        if not pickle_file.exists():
+            return False
+        if text_cache.exists() and text_cache.stat().st_mtime > pickle_file.stat().st_mtime:
+            return False
+
+        try:
+            payload = pickle.loads(pickle_file.read_bytes())
+            if payload.get("version") != CATALOG_PICKLE_VERSION:
+                logger.info("Catalog pickle schema changed, falling back to text cache")
+                return False
+            catalog = payload["catalog"]
+        except Exception as e:
+            logger.warning("Failed to load catalog pickle: %s", e)
+            return False
+
+        with self._lock:
+            self._catalog.update(catalog)
+        logger.info("Loaded %d TLEs from pickle cache", len(catalog))
+        return True
+
     def _load_assets_from_db(self):
         """Load TLEs from user-added assets in the database."""
         try:
@@ -160,23 +193,30 @@ class TLECatalogService:
             ("active", CATALOG_URLS["active"]),
         ]
 
-        for group_name, url in priority_groups:
-            try:
+        # Groups are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(priority_groups)) as executor:
+            futures = {}
+            for group_name, url in priority_groups:
                 logger.info("Fetching TLE group: %s", group_name)
-                resp = requests.get(url, timeout=30)
-                resp.raise_for_status()
-                tles = parse_tle_text(resp.text)
-                self.add_tles(tles)
-                logger.info("Fetched %d TLEs from %s", len(tles), group_name)
+                futures[executor.submit(requests.get, url, timeout=30)] = group_name
 
-                # Save to cache
-                cache_dir = self._data_dir / "tle_cache"
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                cache_path = cache_dir / f"{group_name}.txt"
-                cache_path.write_text(resp.text, encoding="utf-8")
+            for future in as_completed(futures):
+                group_name = futures[future]
+                try:
+                    resp = future.result()
+                    resp.raise_for_status()
+                    tles = parse_tle_text(resp.text)
+                    self.add_tles(tles)
+                    logger.info("Fetched %d TLEs from %s", len(tles), group_name)
+
+                    # Save to cache
+                    cache_dir = self._data_dir / "tle_cache"
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    cache_path = cache_dir / f"{group_name}.txt"
+                    cache_path.write_text(resp.text, encoding="utf-8")
 
-            except Exception as e:
-                logger.warning("Failed to fetch %s: %s", group_name, e)
+                except Exception as e:
+                    logger.warning("Failed to fetch %s: %s", group_name, e)
 
         # Save combined catalog cache
         if self.catalog_size > 0:
@@ -223,41 +263,46 @@ class TLECatalogService:
                     len(st_tles),
                 )
 
-        # Step 2: Always fetch CelesTrak stations (space stations may not be in ST query)
-        try:
-            logger.info("Fetching CelesTrak stations supplement...")
-            resp = req_lib.get(CATALOG_URLS["stations"], timeout=30)
-            resp.raise_for_status()
-            stations_tles = parse_tle_text(resp.text)
-            merged = self._merge_tles(stations_tles)
-            total += merged
-            logger.info("CelesTrak stations: merged %d TLEs", merged)
-        except Exception as e:
-            logger.warning("Failed to fetch CelesTrak stations: %s", e)
-
-        # Step 3: Always fetch CelesTrak active (includes debris + rocket bodies ST skips)
-        try:
-            logger.info("Fetching CelesTrak active supplement...")
-            resp = req_lib.get(CATALOG_URLS["active"], timeout=30)
-            resp.raise_for_status()
-            active_tles = parse_tle_text(resp.text)
-            merged = self._merge_tles(active_tles)
-            total += merged
-            logger.info("CelesTrak active: merged %d TLEs", merged)
-        except Exception as e:
-            logger.warning("Failed to fetch CelesTrak active: %s", e)
-
-        # Step 4: If Space-Track failed, also fetch remaining CelesTrak groups as fallback
-        if not spacetrack_succeeded:
-            logger.info("Space-Track unavailable, fetching remaining CelesTrak groups...")
-            for group_name, url in CATALOG_URLS.items():
-                if group_name in ("stations", "active"):
-                    continue  # Already fetched above
-                try:
-                    result = self._downloader.download(
+        with ThreadPoolExecutor(max_workers=len(CATALOG_URLS)) as executor:
+            # Steps 2 and 3 are independent requests, so issue them together
+            logger.info("Fetching CelesTrak stations and active supplements...")
+            supplements = {
+                group_name: executor.submit(req_lib.get, CATALOG_URLS[group_name], timeout=30)
+                for group_name in ("stations", "active")
+            }
+
+            # Step 4 fallback groups don't depend on the supplements either
+            fallback = {}
+            if not spacetrack_succeeded:
+                logger.info("Space-Track unavailable, fetching remaining CelesTrak groups...")
+                fallback = {
+                    executor.submit(
+                        self._downloader.download,
                         url,
                         self._data_dir / "tle_cache" / f"{group_name}.txt",
-                    )
+                    ): group_name
+                    for group_name, url in CATALOG_URLS.items()
+                    if group_name not in supplements  # Already fetched above
+                }
+
+            # Step 2: Always fetch CelesTrak stations (space stations may not be in ST query)
+            # Step 3: Always fetch CelesTrak active (includes debris + rocket bodies ST skips)
+            for group_name, future in supplements.items():
+                try:
+                    resp = future.result()
+                    resp.raise_for_status()
+                    group_tles = parse_tle_text(resp.text)
+                    merged = self._merge_tles(group_tles)
+                    total += merged
+                    logger.info("CelesTrak %s: merged %d TLEs", group_name, merged)
+                except Exception as e:
+                    logger.warning("Failed to fetch CelesTrak %s: %s", group_name, e)
+
+            # Step 4: If Space-Track failed, also merge remaining CelesTrak groups as fallback
+            for future in as_completed(fallback):
+                group_name = fallback[future]
+                try:
+                    result = future.result()
                     if result.path and result.path.exists():
                         text = result.path.read_text(encoding="utf-8")
                         tles = parse_tle_text(text)
@@ -364,6 +409,32 @@ class TLECatalogService:
             cache_file.write_text("\n".join(lines), encoding="utf-8")
         except Exception as e:
             logger.warning("Failed to save catalog cache: %s", e)
+        self._save_catalog_pickle()
+
+    def _save_catalog_pickle(self):
+        """Save the parsed catalog as a pickle for fast startup loads.
+
+        The text cache is kept for inspection; this is the primary load path.
+        """
+        tmp_path = None
+        try:
+            pickle_file = self._data_dir / "tle_cache" / "full_catalog.pkl"
+            with self._lock:
+                catalog = dict(self._catalog)
+            payload = {"version": CATALOG_PICKLE_VERSION, "catalog": catalog}
+            # Write-then-rename so a crash or a concurrent load never sees a
+            # partial pickle
+            fd, tmp_path = tempfile.mkstemp(dir=str(pickle_file.parent), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(pickle.dumps(payload, protocol=5))
+            os.replace(tmp_path, pickle_file)
+        except Exception as e:
+            logger.warning("Failed to save catalog pickle: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def get_catalog_stats(self) -> dict:
         """Get statistics about the catalog."""
@@ -12,6 +12,38 @@ import math
 import numpy as np
 
 
+# TLE-based uncertainty growth model.
+# In-track uncertainty dominates and grows rapidly with TLE age because
+# mean motion errors accumulate along-track. Typical SSN TLE accuracy:
+#   - Fresh TLE (0h): ~200m radial, ~500m in-track, ~200m cross-track
+#   - 24h old TLE:    ~500m radial, ~5km in-track, ~500m cross-track
+#   - 72h old TLE:    ~1km radial,  ~15km in-track, ~1km cross-track
+# These values produce operationally realistic Pc in the 1e-7 to 1e-3
+# range for conjunction events at typical screening thresholds (5-25km).
+#
+# Maps object type -> ((sigma0, growth per hour), ...) for R, I, C in meters.
+_SIGMA_MODEL = {
+    "payload": ((200.0, 12.0), (500.0, 200.0), (200.0, 12.0)),
+    "debris": ((500.0, 30.0), (1500.0, 500.0), (500.0, 30.0)),
+    "rocket_body": ((400.0, 25.0), (1000.0, 400.0), (400.0, 25.0)),
+    "unknown": ((300.0, 20.0), (800.0, 300.0), (300.0, 20.0)),
+}
+
+
+def _frozen_diag(values: list[float]) -> np.ndarray:
+    """Build a diagonal matrix that cannot be modified in place."""
+    cov = np.diag(values)
+    cov.setflags(write=False)
+    return cov
+
+
+# Fresh-TLE (age 0) covariances, shared read-only across callers
+_COV_ZERO = {
+    object_type: _frozen_diag([(s0 / 1000.0) ** 2 for s0, _ in axes])
+    for object_type, axes in _SIGMA_MODEL.items()
+}
+
+
 def default_covariance_ric(
     tle_age_hours: float,
     object_type: str = "unknown",
@@ -25,41 +57,21 @@ def default_covariance_ric(
         object_type: One of 'payload', 'debris', 'rocket_body', 'unknown'.
 
     Returns:
-        3x3 diagonal covariance matrix in km^2.
+        3x3 diagonal covariance matrix in km^2. For a zero-age TLE this is
+        a shared read-only array.
     """
     age = max(0.0, tle_age_hours)
+    if object_type not in _SIGMA_MODEL:
+        object_type = "unknown"
 
-    # TLE-based uncertainty growth model.
-    # In-track uncertainty dominates and grows rapidly with TLE age because
-    # mean motion errors accumulate along-track. Typical SSN TLE accuracy:
-    #   - Fresh TLE (0h): ~200m radial, ~500m in-track, ~200m cross-track
-    #   - 24h old TLE:    ~500m radial, ~5km in-track, ~500m cross-track
-    #   - 72h old TLE:    ~1km radial,  ~15km in-track, ~1km cross-track
-    # These values produce operationally realistic Pc in the 1e-7 to 1e-3
-    # range for conjunction events at typical screening thresholds (5-25km).
-    if object_type == "payload":
-        sigma_r = 200.0 + 12.0 * age
-        sigma_i = 500.0 + 200.0 * age
-        sigma_c = 200.0 + 12.0 * age
-    elif object_type == "debris":
-        sigma_r = 500.0 + 30.0 * age
-        sigma_i = 1500.0 + 500.0 * age
-        sigma_c = 500.0 + 30.0 * age
-    elif object_type == "rocket_body":
-        sigma_r = 400.0 + 25.0 * age
-        sigma_i = 1000.0 + 400.0 * age
-        sigma_c = 400.0 + 25.0 * age
-    else:
-        sigma_r = 300.0 + 20.0 * age
-        sigma_i = 800.0 + 300.0 * age
-        sigma_c = 300.0 + 20.0 * age
+    if age < 1e-9:
+        return _COV_ZERO[object_type]
 
     # Convert to km and square for covariance
-    sigma_r_km = sigma_r / 1000.0
-    sigma_i_km = sigma_i / 1000.0
-    sigma_c_km = sigma_c / 1000.0
-
-    return np.diag([sigma_r_km ** 2, sigma_i_km ** 2, sigma_c_km ** 2])
+    return np.diag([
+        ((s0 + rate * age) / 1000.0) ** 2
+        for s0, rate in _SIGMA_MODEL[object_type]
+    ])
 
 
 def covariance_ric_to_eci(
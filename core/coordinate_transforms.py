@@ -11,6 +11,10 @@ All angles in radians internally unless suffixed with _deg.
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache
+from typing import Optional
+
 import numpy as np
 
 from utils.constants import (
@@ -25,24 +29,30 @@ from utils.constants import (
 # ECI <-> ECEF
 # =============================================================================
 
-def eci_to_ecef(position_eci: np.ndarray, gmst: float) -> np.ndarray:
+def eci_to_ecef(
+    position_eci: np.ndarray,
+    gmst: float,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """Rotate ECI (TEME) to ECEF by Greenwich Mean Sidereal Time.
 
     Args:
         position_eci: [x, y, z] in km
         gmst: Greenwich Mean Sidereal Time in radians
+        out: optional preallocated length-3 buffer to write into
 
     Returns:
         [x, y, z] in km (ECEF)
     """
-    cos_g = np.cos(gmst)
-    sin_g = np.sin(gmst)
-    x, y, z = position_eci[0], position_eci[1], position_eci[2]
-    return np.array([
-        cos_g * x + sin_g * y,
-        -sin_g * x + cos_g * y,
-        z,
-    ])
+    cos_g = math.cos(gmst)
+    sin_g = math.sin(gmst)
+    x, y, z = float(position_eci[0]), float(position_eci[1]), float(position_eci[2])
+    if out is None:
+        out = np.empty(3)
+    out[0] = cos_g * x + sin_g * y
+    out[1] = -sin_g * x + cos_g * y
+    out[2] = z
+    return out
 
 
 def ecef_to_eci(position_ecef: np.ndarray, gmst: float) -> np.ndarray:
@@ -55,34 +65,49 @@ def ecef_to_eci(position_ecef: np.ndarray, gmst: float) -> np.ndarray:
     Returns:
         [x, y, z] in km (ECI)
     """
-    cos_g = np.cos(gmst)
-    sin_g = np.sin(gmst)
-    x, y, z = position_ecef[0], position_ecef[1], position_ecef[2]
-    return np.array([
-        cos_g * x - sin_g * y,
-        sin_g * x + cos_g * y,
-        z,
-    ])
+    cos_g = math.cos(gmst)
+    sin_g = math.sin(gmst)
+    x, y, z = float(position_ecef[0]), float(position_ecef[1]), float(position_ecef[2])
+    out = np.empty(3)
+    out[0] = cos_g * x - sin_g * y
+    out[1] = sin_g * x + cos_g * y
+    out[2] = z
+    return out
 
 
 def eci_to_ecef_batch(
-    positions_eci: np.ndarray, gmst_array: np.ndarray
+    positions_eci: np.ndarray,
+    gmst_array: np.ndarray,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Vectorized ECI to ECEF conversion.
 
     Args:
         positions_eci: shape (N, 3) ECI positions in km
         gmst_array: shape (N,) GMST values in radians
+        out: optional preallocated (N, 3) buffer to write into
 
     Returns:
         shape (N, 3) ECEF positions in km
     """
-    cos_g = np.cos(gmst_array)
-    sin_g = np.sin(gmst_array)
-
-    result = np.empty_like(positions_eci)
-    result[:, 0] = cos_g * positions_eci[:, 0] + sin_g * positions_eci[:, 1]
-    result[:, 1] = -sin_g * positions_eci[:, 0] + cos_g * positions_eci[:, 1]
+    # cos/sin are evaluated once per epoch; the rotation is then written
+    # straight into the output columns with a single scratch array. The
+    # arithmetic follows the positions' dtype (float32 trails stay float32).
+    dtype = positions_eci.dtype
+    cos_g = np.cos(gmst_array).astype(dtype, copy=False)
+    sin_g = np.sin(gmst_array).astype(dtype, copy=False)
+    x = positions_eci[:, 0]
+    y = positions_eci[:, 1]
+
+    result = np.empty_like(positions_eci) if out is None else out
+    res_x = result[:, 0]
+    res_y = result[:, 1]
+    scratch = np.multiply(sin_g, y)
+    np.multiply(cos_g, x, out=res_x)
+    res_x += scratch
+    np.multiply(sin_g, x, out=scratch)
+    np.multiply(cos_g, y, out=res_y)
+    res_y -= scratch
     result[:, 2] = positions_eci[:, 2]
     return result
 
@@ -102,29 +127,30 @@ def ecef_to_geodetic(
     Returns:
         (latitude_deg, longitude_deg, altitude_km)
     """
-    x, y, z = position_ecef[0], position_ecef[1], position_ecef[2]
+    # Scalar math.* calls avoid NumPy's per-call dispatch on 0-d values
+    x, y, z = float(position_ecef[0]), float(position_ecef[1]), float(position_ecef[2])
     a = R_EARTH_EQUATORIAL
     e2 = ECCENTRICITY_SQ
 
-    lon = np.arctan2(y, x)
-    p = np.sqrt(x ** 2 + y ** 2)
+    lon = math.atan2(y, x)
+    p = math.sqrt(x * x + y * y)
 
     # Initial estimate
-    lat = np.arctan2(z, p * (1.0 - e2))
+    lat = math.atan2(z, p * (1.0 - e2))
 
     # Bowring iteration (converges in 2-3 iterations)
     for _ in range(5):
-        sin_lat = np.sin(lat)
-        n = a / np.sqrt(1.0 - e2 * sin_lat ** 2)
-        lat_new = np.arctan2(z + e2 * n * sin_lat, p)
+        sin_lat = math.sin(lat)
+        n = a / math.sqrt(1.0 - e2 * sin_lat * sin_lat)
+        lat_new = math.atan2(z + e2 * n * sin_lat, p)
         if abs(lat_new - lat) < 1e-12:
             break
         lat = lat_new
 
     # Altitude
-    sin_lat = np.sin(lat)
-    cos_lat = np.cos(lat)
-    n = a / np.sqrt(1.0 - e2 * sin_lat ** 2)
+    sin_lat = math.sin(lat)
+    cos_lat = math.cos(lat)
+    n = a / math.sqrt(1.0 - e2 * sin_lat * sin_lat)
 
     if abs(cos_lat) > 1e-10:
         alt = p / cos_lat - n
@@ -134,6 +160,15 @@ def ecef_to_geodetic(
     return (lat * RAD_TO_DEG, lon * RAD_TO_DEG, alt)
 
 
+def _prime_vertical_radius_into(sin_lat: np.ndarray, out: np.ndarray) -> None:
+    """Write N = a / sqrt(1 - e² sin²(lat)) into ``out`` without temporaries."""
+    np.multiply(sin_lat, sin_lat, out=out)
+    out *= -ECCENTRICITY_SQ
+    out += 1.0
+    np.sqrt(out, out=out)
+    np.divide(R_EARTH_EQUATORIAL, out, out=out)
+
+
 def ecef_to_geodetic_batch(
     positions_ecef: np.ndarray,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -143,27 +178,82 @@ def ecef_to_geodetic_batch(
         positions_ecef: shape (N, 3) ECEF positions in km
 
     Returns:
-        (latitudes_deg, longitudes_deg, altitudes_km) each shape (N,)
+        (latitudes_deg, longitudes_deg, altitudes_km) each shape (N,),
+        float32 for float32 input and float64 otherwise
+    """
+    # One contiguous (SoA) copy of the columns, then in-place ufuncs into a
+    # few preallocated buffers instead of fresh temporaries per iteration.
+    dtype = np.float32 if positions_ecef.dtype == np.float32 else np.float64
+    x, y, z = np.ascontiguousarray(positions_ecef.T, dtype=dtype)
+
+    lon = np.arctan2(y, x)
+    lon *= RAD_TO_DEG
+    lat, alt = _latitude_altitude_batch(np.hypot(x, y), z)
+    return (lat, lon, alt)
+
+
+def eci_to_geodetic_batch(
+    positions_eci: np.ndarray,
+    gmst_array: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ECI to geodetic for N positions, without an ECEF buffer.
+
+    The ECI -> ECEF rotation is about the z axis, so it leaves z and the
+    equatorial distance hypot(x, y) unchanged and only shifts longitude
+    by -GMST. Latitude and altitude are therefore solved directly from
+    the ECI columns. Equivalent to ecef_to_geodetic_batch applied to
+    eci_to_ecef_batch, to rounding.
+
+    Args:
+        positions_eci: shape (N, 3) ECI positions in km
+        gmst_array: shape (N,) GMST values in radians
+
+    Returns:
+        (latitudes_deg, longitudes_deg, altitudes_km) each shape (N,),
+        float32 for float32 input and float64 otherwise
+    """
+    dtype = np.float32 if positions_eci.dtype == np.float32 else np.float64
+    x, y, z = np.ascontiguousarray(positions_eci.T, dtype=dtype)
+
+    # GMST is subtracted at its own (float64) precision, then wrapped
+    # to [-pi, pi)
+    lon = np.subtract(np.arctan2(y, x), gmst_array)
+    lon += math.pi
+    lon %= 2.0 * math.pi
+    lon -= math.pi
+    lon *= RAD_TO_DEG
+    lon = lon.astype(dtype, copy=False)
+    lat, alt = _latitude_altitude_batch(np.hypot(x, y), z)
+    return (lat, lon, alt)
+
+
+def _latitude_altitude_batch(
+    p: np.ndarray, z: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bowring iteration on equatorial distance p and z (km).
+
+    Returns (latitudes_deg, altitudes_km).
     """
-    x = positions_ecef[:, 0]
-    y = positions_ecef[:, 1]
-    z = positions_ecef[:, 2]
     a = R_EARTH_EQUATORIAL
     e2 = ECCENTRICITY_SQ
 
-    lon = np.arctan2(y, x)
-    p = np.sqrt(x ** 2 + y ** 2)
     lat = np.arctan2(z, p * (1.0 - e2))
 
+    sin_lat = np.empty_like(lat)
+    n = np.empty_like(lat)
+
     # Fixed iteration count for vectorization (no branching)
     for _ in range(5):
-        sin_lat = np.sin(lat)
-        n = a / np.sqrt(1.0 - e2 * sin_lat ** 2)
-        lat = np.arctan2(z + e2 * n * sin_lat, p)
-
-    sin_lat = np.sin(lat)
+        np.sin(lat, out=sin_lat)
+        _prime_vertical_radius_into(sin_lat, n)
+        n *= e2
+        n *= sin_lat
+        n += z
+        np.arctan2(n, p, out=lat)
+
+    np.sin(lat, out=sin_lat)
     cos_lat = np.cos(lat)
-    n = a / np.sqrt(1.0 - e2 * sin_lat ** 2)
+    _prime_vertical_radius_into(sin_lat, n)
 
     alt = np.where(
         np.abs(cos_lat) > 1e-10,
@@ -171,11 +261,15 @@ def ecef_to_geodetic_batch(
         np.abs(z) / np.maximum(np.abs(sin_lat), 1e-20) - n * (1.0 - e2),
     )
 
-    return (lat * RAD_TO_DEG, lon * RAD_TO_DEG, alt)
+    lat *= RAD_TO_DEG
+    return (lat, alt)
 
 
 def geodetic_to_ecef(
-    lat_deg: float, lon_deg: float, alt_km: float
+    lat_deg: float,
+    lon_deg: float,
+    alt_km: float,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Convert geodetic to ECEF coordinates.
 
@@ -183,6 +277,7 @@ def geodetic_to_ecef(
         lat_deg: latitude in degrees
         lon_deg: longitude in degrees
         alt_km: altitude above WGS84 ellipsoid in km
+        out: optional preallocated length-3 buffer to write into
 
     Returns:
         [x, y, z] in km
@@ -192,14 +287,16 @@ def geodetic_to_ecef(
     a = R_EARTH_EQUATORIAL
     e2 = ECCENTRICITY_SQ
 
-    sin_lat = np.sin(lat)
-    cos_lat = np.cos(lat)
-    n = a / np.sqrt(1.0 - e2 * sin_lat ** 2)
+    sin_lat = math.sin(lat)
+    cos_lat = math.cos(lat)
+    n = a / math.sqrt(1.0 - e2 * sin_lat * sin_lat)
 
-    x = (n + alt_km) * cos_lat * np.cos(lon)
-    y = (n + alt_km) * cos_lat * np.sin(lon)
-    z = (n * (1.0 - e2) + alt_km) * sin_lat
-    return np.array([x, y, z])
+    if out is None:
+        out = np.empty(3)
+    out[0] = (n + alt_km) * cos_lat * math.cos(lon)
+    out[1] = (n + alt_km) * cos_lat * math.sin(lon)
+    out[2] = (n * (1.0 - e2) + alt_km) * sin_lat
+    return out
 
 
 def geodetic_to_cartesian_render(
@@ -219,40 +316,82 @@ def geodetic_to_cartesian_render(
     r = scale * (1.0 + alt_km / R_EARTH_EQUATORIAL)
     lat = lat_deg * DEG_TO_RAD
     lon = lon_deg * DEG_TO_RAD
-    x = r * np.cos(lat) * np.cos(lon)
-    y = r * np.cos(lat) * np.sin(lon)
-    z = r * np.sin(lat)
+    cos_lat = math.cos(lat)
+    x = r * cos_lat * math.cos(lon)
+    y = r * cos_lat * math.sin(lon)
+    z = r * math.sin(lat)
     return np.array([x, y, z])
 
 
 def eci_to_render_coords(
-    position_eci: np.ndarray, scale: float = 1.0
+    position_eci: np.ndarray,
+    scale: float = 1.0,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Convert ECI position (km) to rendering coordinates.
 
     Maps so that Earth radius = scale. Simply divides by R_EARTH_EQUATORIAL.
+    Writes into ``out`` when given instead of allocating.
     """
-    return position_eci / R_EARTH_EQUATORIAL * scale
+    return np.multiply(position_eci, scale / R_EARTH_EQUATORIAL, out=out)
 
 
 def eci_to_render_coords_batch(
-    positions_eci: np.ndarray, scale: float = 1.0
+    positions_eci: np.ndarray,
+    scale: float = 1.0,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Vectorized ECI to render coordinates.
 
     Args:
         positions_eci: shape (N, 3) in km
+        out: optional preallocated (N, 3) buffer to write into (may be
+            float32 for GPU-bound points)
 
     Returns:
         shape (N, 3) in render units
     """
-    return positions_eci / R_EARTH_EQUATORIAL * scale
+    return np.multiply(
+        positions_eci, scale / R_EARTH_EQUATORIAL, out=out, casting="same_kind"
+    )
 
 
 # =============================================================================
 # Look Angles (Observer -> Satellite)
 # =============================================================================
 
+@lru_cache(maxsize=64)
+def _observer_frame(
+    lat_deg: float, lon_deg: float, alt_km: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Station ECEF position and ECEF->ENU rotation for a ground observer.
+
+    Memoized per (lat, lon, alt) since ground stations do not move; both
+    arrays are shared and read-only.
+
+    Returns:
+        (observer_ecef, rotation) with shapes (3,) and (3, 3); rows of
+        ``rotation`` are the East, North and Up unit vectors.
+    """
+    obs_ecef = geodetic_to_ecef(lat_deg, lon_deg, alt_km)
+
+    lat = lat_deg * DEG_TO_RAD
+    lon = lon_deg * DEG_TO_RAD
+    sin_lat = math.sin(lat)
+    cos_lat = math.cos(lat)
+    sin_lon = math.sin(lon)
+    cos_lon = math.cos(lon)
+
+    rotation = np.array([
+        [-sin_lon, cos_lon, 0.0],
+        [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+        [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+    ])
+    obs_ecef.setflags(write=False)
+    rotation.setflags(write=False)
+    return obs_ecef, rotation
+
+
 def compute_look_angles(
     observer_lat_deg: float,
     observer_lon_deg: float,
@@ -272,28 +411,56 @@ def compute_look_angles(
         azimuth: [0, 360) clockwise from North
         elevation: [-90, 90] above local horizon
     """
-    obs_ecef = geodetic_to_ecef(observer_lat_deg, observer_lon_deg, observer_alt_km)
-    delta = satellite_ecef - obs_ecef
-
-    lat = observer_lat_deg * DEG_TO_RAD
-    lon = observer_lon_deg * DEG_TO_RAD
-    sin_lat = np.sin(lat)
-    cos_lat = np.cos(lat)
-    sin_lon = np.sin(lon)
-    cos_lon = np.cos(lon)
-
-    dx, dy, dz = delta[0], delta[1], delta[2]
+    obs_ecef, rotation = _observer_frame(
+        observer_lat_deg, observer_lon_deg, observer_alt_km
+    )
 
     # Transform to ENU (East-North-Up)
-    east = -sin_lon * dx + cos_lon * dy
-    north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
-    up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+    east, north, up = (rotation @ (satellite_ecef - obs_ecef)).tolist()
 
-    range_km = np.sqrt(east ** 2 + north ** 2 + up ** 2)
-    elevation = np.arctan2(up, np.sqrt(east ** 2 + north ** 2)) * RAD_TO_DEG
-    azimuth = np.arctan2(east, north) * RAD_TO_DEG
+    horizontal = math.sqrt(east * east + north * north)
+    range_km = math.sqrt(horizontal * horizontal + up * up)
+    elevation = math.atan2(up, horizontal) * RAD_TO_DEG
+    azimuth = math.atan2(east, north) * RAD_TO_DEG
 
     if azimuth < 0:
         azimuth += 360.0
 
     return (azimuth, elevation, range_km)
+
+
+def compute_look_angles_batch(
+    observer_lat_deg: float,
+    observer_lon_deg: float,
+    observer_alt_km: float,
+    satellite_ecef: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized look angles from one ground observer to N satellite samples.
+
+    Args:
+        observer_lat_deg: observer latitude in degrees
+        observer_lon_deg: observer longitude in degrees
+        observer_alt_km: observer altitude in km
+        satellite_ecef: shape (N, 3) satellite ECEF positions in km
+
+    Returns:
+        (azimuths_deg, elevations_deg, ranges_km) each shape (N,)
+    """
+    obs_ecef, rotation = _observer_frame(
+        observer_lat_deg, observer_lon_deg, observer_alt_km
+    )
+
+    enu = (satellite_ecef - obs_ecef) @ rotation.T
+    east = enu[:, 0]
+    north = enu[:, 1]
+    up = enu[:, 2]
+
+    horizontal = np.hypot(east, north)
+    range_km = np.hypot(horizontal, up)
+    elevation = np.arctan2(up, horizontal)
+    elevation *= RAD_TO_DEG
+    azimuth = np.arctan2(east, north)
+    azimuth *= RAD_TO_DEG
+    azimuth[azimuth < 0] += 360.0
+
+    return (azimuth, elevation, range_km)
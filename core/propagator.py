@@ -8,18 +8,23 @@ operations for orbit trail generation.
 from __future__ import annotations
 
 import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
+from typing import Iterator
 
 import numpy as np
-from sgp4.api import Satrec, WGS72
+from sgp4.api import Satrec, SatrecArray, WGS72
 
 from core.coordinate_transforms import (
     ecef_to_geodetic,
-    ecef_to_geodetic_batch,
     eci_to_ecef,
-    eci_to_ecef_batch,
+    eci_to_geodetic_batch,
 )
+from core import propagator_cupy
 from core.orbital_mechanics import classify_orbit, state_vectors_to_elements
 from core.tle_parser import TLEData
 from utils.constants import (
@@ -30,16 +35,24 @@ from utils.constants import (
     MU_EARTH,
 )
 from utils.time_utils import (
+    JulianDate,
     compute_gmst_batch,
-    datetime_to_gmst,
     datetime_to_jd,
     generate_time_steps,
-    sun_position_eci,
+    jd_to_datetime,
+    jd_to_datetime_batch,
+    jd_to_gmst,
+    sun_position_eci_batch,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _row_norms_sq(vectors: np.ndarray) -> np.ndarray:
+    """Squared norms along the last axis in a single pass (no squared copy)."""
+    return np.einsum("...i,...i->...", vectors, vectors)
+
+
 class PropagationError(Exception):
     """Raised when SGP4 propagation fails."""
 
@@ -77,6 +90,56 @@ class PropagationResult:
     in_shadow: bool
 
 
+@dataclass(frozen=True, slots=True)
+class PropagationResultArray:
+    """Structure-of-arrays form of N PropagationResults (one array per field).
+
+    Supports len(), indexing and iteration, building each PropagationResult
+    on demand, so callers that treat it as a list keep working.
+    """
+
+    datetimes: np.ndarray  # (N,) datetime64[us], UTC
+    positions_eci: np.ndarray  # (N, 3) km
+    velocities_eci: np.ndarray  # (N, 3) km/s
+    latitudes: np.ndarray  # (N,) degrees
+    longitudes: np.ndarray  # (N,) degrees
+    altitudes: np.ndarray  # (N,) km
+    speeds: np.ndarray  # (N,) km/s
+    in_shadow: np.ndarray  # (N,) bool
+
+    @classmethod
+    def empty(cls) -> PropagationResultArray:
+        return cls(
+            datetimes=np.empty(0, dtype="datetime64[us]"),
+            positions_eci=np.empty((0, 3)),
+            velocities_eci=np.empty((0, 3)),
+            latitudes=np.empty(0),
+            longitudes=np.empty(0),
+            altitudes=np.empty(0),
+            speeds=np.empty(0),
+            in_shadow=np.empty(0, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.datetimes)
+
+    def __getitem__(self, index: int) -> PropagationResult:
+        return PropagationResult(
+            datetime_utc=self.datetimes[index].item().replace(tzinfo=timezone.utc),
+            position_eci=self.positions_eci[index],
+            velocity_eci=self.velocities_eci[index],
+            latitude=float(self.latitudes[index]),
+            longitude=float(self.longitudes[index]),
+            altitude=float(self.altitudes[index]),
+            speed=float(self.speeds[index]),
+            in_shadow=bool(self.in_shadow[index]),
+        )
+
+    def __iter__(self) -> Iterator[PropagationResult]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 @dataclass(frozen=True, slots=True)
 class OrbitalElements:
     """Osculating Keplerian elements at a given instant."""
@@ -107,19 +170,111 @@ class GroundTrackPoint:
     in_shadow: bool
 
 
+@dataclass(frozen=True, slots=True)
+class GroundTrackArray:
+    """Structure-of-arrays ground track (one array per GroundTrackPoint field).
+
+    Supports len(), indexing and iteration, building each GroundTrackPoint
+    on demand, so callers that treat it as a list keep working.
+    """
+
+    datetimes: np.ndarray  # (N,) datetime64[us], UTC
+    latitudes: np.ndarray  # (N,) degrees
+    longitudes: np.ndarray  # (N,) degrees
+    altitudes: np.ndarray  # (N,) km
+    in_shadow: np.ndarray  # (N,) bool
+
+    def __len__(self) -> int:
+        return len(self.datetimes)
+
+    def __getitem__(self, index: int) -> GroundTrackPoint:
+        return GroundTrackPoint(
+            datetime_utc=self.datetimes[index].item().replace(tzinfo=timezone.utc),
+            latitude=float(self.latitudes[index]),
+            longitude=float(self.longitudes[index]),
+            altitude=float(self.altitudes[index]),
+            in_shadow=bool(self.in_shadow[index]),
+        )
+
+    def __iter__(self) -> Iterator[GroundTrackPoint]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPropagationResult:
+    """States of several satellites on a shared time grid.
+
+    Per-satellite arrays are indexed [satellite, time]. Entries where
+    ``valid`` is False (SGP4 error at that instant) hold NaN.
+    """
+
+    times_utc: np.ndarray  # (T,) datetime64[us]
+    positions_eci: np.ndarray  # (S, T, 3) km
+    velocities_eci: np.ndarray  # (S, T, 3) km/s
+    latitudes: np.ndarray  # (S, T) degrees
+    longitudes: np.ndarray  # (S, T) degrees
+    altitudes: np.ndarray  # (S, T) km
+    speeds: np.ndarray  # (S, T) km/s
+    in_shadow: np.ndarray  # (S, T) bool
+    valid: np.ndarray  # (S, T) bool
+
+
+@lru_cache(maxsize=4096)
+def _sun_direction_at_minute(minute: int) -> tuple[float, float, float]:
+    """Unit ECI Sun vector at a whole minute of Julian Date.
+
+    The Sun moves ~0.0007 deg per minute, far below the shadow model's
+    accuracy, so per-frame shadow checks share one cached direction.
+    """
+    day, minute_of_day = divmod(minute, 1440)
+    sun = sun_position_eci_batch(
+        np.array([float(day)]), np.array([minute_of_day / 1440.0])
+    )[0]
+    x, y, z = sun.tolist()
+    norm = math.sqrt(x * x + y * y + z * z)
+    return (x / norm, y / norm, z / norm)
+
+
+def _sun_direction(jd: JulianDate) -> tuple[float, float, float]:
+    return _sun_direction_at_minute(math.floor(jd.jd * 1440.0 + jd.fr * 1440.0))
+
+
+@lru_cache(maxsize=16384)
+def _satrec_from_lines(line1: str, line2: str) -> tuple[Satrec, int]:
+    """SGP4 initialization, memoized so re-opening a group skips it.
+
+    Returns the Satrec with its init error code. The Satrec is shared by
+    every propagator for these lines, and each sgp4 call overwrites its
+    error attribute, so only the code captured here reflects init.
+    """
+    satrec = Satrec.twoline2rv(line1, line2)
+    return satrec, satrec.error
+
+
 class OrbitalPropagator:
     """SGP4-based orbital propagation engine."""
 
-    def __init__(self, tle_data: TLEData):
-        """Initialize SGP4 satellite object from TLE data."""
+    def __init__(self, tle_data: TLEData, dtype: np.dtype = np.float64):
+        """Initialize SGP4 satellite object from TLE data.
+
+        ``dtype`` sets the precision of the state arrays produced by
+        propagate_range; np.float32 halves memory traffic for display-only
+        paths (trails, ground tracks). SGP4 and the time grid stay float64.
+        """
         self._tle = tle_data
-        self._satellite = Satrec.twoline2rv(tle_data.line1, tle_data.line2)
+        self._dtype = np.dtype(dtype)
+        self._satellite, init_error = _satrec_from_lines(
+            tle_data.line1, tle_data.line2
+        )
+        # Scratch ECEF vector for single-point propagation (never returned)
+        self._ecef_buf = np.empty(3)
 
-        if self._satellite.error != 0:
+        if init_error != 0:
             raise PropagationError(
                 f"SGP4 init failed for {tle_data.name}: "
-                f"{PropagationError.error_message(self._satellite.error)}",
-                error_code=self._satellite.error,
+                f"{PropagationError.error_message(init_error)}",
+                error_code=init_error,
                 satellite_name=tle_data.name,
             )
 
@@ -137,6 +292,35 @@ class OrbitalPropagator:
             dt = dt.replace(tzinfo=timezone.utc)
 
         jd = datetime_to_jd(dt)
+        return self._propagate_at(dt, jd, jd_to_gmst(jd), _sun_direction(jd))
+
+    def propagate_jd(
+        self,
+        jd: float,
+        fr: float,
+        gmst: float | None = None,
+        sun_hat: tuple[float, float, float] | None = None,
+    ) -> PropagationResult:
+        """Propagate to a split Julian Date, skipping the datetime conversion.
+
+        For per-frame updates of many satellites at the same instant the
+        caller can compute gmst (radians) and sun_hat (unit ECI Sun vector)
+        once and pass them to every call.
+        """
+        split = JulianDate(jd=jd, fr=fr)
+        if gmst is None:
+            gmst = jd_to_gmst(split)
+        if sun_hat is None:
+            sun_hat = _sun_direction(split)
+        return self._propagate_at(jd_to_datetime(split), split, gmst, sun_hat)
+
+    def _propagate_at(
+        self,
+        dt: datetime,
+        jd: JulianDate,
+        gmst: float,
+        sun_hat: tuple[float, float, float],
+    ) -> PropagationResult:
         error, r_tuple, v_tuple = self._satellite.sgp4(jd.jd, jd.fr)
 
         if error != 0:
@@ -147,16 +331,18 @@ class OrbitalPropagator:
                 satellite_name=self._tle.name,
             )
 
-        pos_eci = np.array(r_tuple)
-        vel_eci = np.array(v_tuple)
+        # One (2, 3) allocation; the returned vectors are row views of it
+        state = np.array((r_tuple, v_tuple))
+        pos_eci = state[0]
+        vel_eci = state[1]
 
         # Convert to geodetic
-        gmst = datetime_to_gmst(dt)
-        pos_ecef = eci_to_ecef(pos_eci, gmst)
+        pos_ecef = eci_to_ecef(pos_eci, gmst, out=self._ecef_buf)
         lat, lon, alt = ecef_to_geodetic(pos_ecef)
 
-        speed = float(np.linalg.norm(vel_eci))
-        in_shadow = self._is_in_shadow(pos_eci, dt)
+        vx, vy, vz = v_tuple
+        speed = math.sqrt(vx * vx + vy * vy + vz * vz)
+        in_shadow = self._is_in_shadow(pos_eci, sun_hat)
 
         return PropagationResult(
             datetime_utc=dt,
@@ -174,10 +360,12 @@ class OrbitalPropagator:
         start: datetime,
         end: datetime,
         step_seconds: float = 60.0,
-    ) -> list[PropagationResult]:
+    ) -> PropagationResultArray:
         """Batch propagation using numpy vectorization.
 
-        Performance-critical path for orbit trail generation.
+        Performance-critical path for orbit trail generation. Returns the
+        states as arrays; indexing or iterating the result still yields
+        PropagationResult objects.
         """
         if start.tzinfo is None:
             start = start.replace(tzinfo=timezone.utc)
@@ -197,7 +385,7 @@ class OrbitalPropagator:
             logger.warning(
                 "All propagation points failed for %s", self._tle.name
             )
-            return []
+            return PropagationResultArray.empty()
 
         if n_valid < n:
             logger.warning(
@@ -206,58 +394,118 @@ class OrbitalPropagator:
                 n,
                 self._tle.name,
             )
-
-        # Get valid data
-        valid_pos = positions[valid]
-        valid_vel = velocities[valid]
-        valid_jd = jd_arr[valid]
-        valid_fr = fr_arr[valid]
+            positions = positions[valid]
+            velocities = velocities[valid]
+            jd_arr = jd_arr[valid]
+            fr_arr = fr_arr[valid]
+
+        # The result owns these buffers; indexing it hands out row views
+        # rather than per-point copies. When every point is valid the
+        # sgp4 output is used as-is (no boolean-mask copies).
+        valid_pos = positions.astype(self._dtype, copy=False)
+        valid_vel = velocities.astype(self._dtype, copy=False)
+        valid_jd = jd_arr
+        valid_fr = fr_arr
 
         # Vectorized GMST computation
         gmst_arr = compute_gmst_batch(valid_jd, valid_fr)
 
-        # Vectorized ECI -> ECEF -> Geodetic
-        ecef_arr = eci_to_ecef_batch(valid_pos, gmst_arr)
-        lats, lons, alts = ecef_to_geodetic_batch(ecef_arr)
+        # Vectorized ECI -> Geodetic (fused; no intermediate ECEF array)
+        lats, lons, alts = eci_to_geodetic_batch(valid_pos, gmst_arr)
 
         # Speed
-        speeds = np.linalg.norm(valid_vel, axis=1)
+        speeds = np.sqrt(_row_norms_sq(valid_vel))
 
         # Shadow detection (use single sun position for efficiency)
         mid_jd = datetime_to_jd(start + (end - start) / 2)
-        from utils.time_utils import jd_to_datetime
-        mid_dt = jd_to_datetime(mid_jd)
-        sun_pos = sun_position_eci(mid_dt)
-        shadows = self._is_in_shadow_batch(valid_pos, sun_pos)
+        shadows = self._is_in_shadow_batch(valid_pos, _sun_direction(mid_jd))
 
-        # Build results
-        results: list[PropagationResult] = []
+        # Step times spread evenly from start to end, as datetime64[us]
         total_seconds = (end - start).total_seconds()
-        step_count = n_valid
-
-        for i in range(n_valid):
-            # Compute datetime for this step
-            frac = i / max(1, step_count - 1) if step_count > 1 else 0
-            dt_i = start + timedelta(seconds=frac * total_seconds)
-
-            results.append(
-                PropagationResult(
-                    datetime_utc=dt_i,
-                    position_eci=valid_pos[i].copy(),
-                    velocity_eci=valid_vel[i].copy(),
-                    latitude=float(lats[i]),
-                    longitude=float(lons[i]),
-                    altitude=float(alts[i]),
-                    speed=float(speeds[i]),
-                    in_shadow=bool(shadows[i]),
-                )
+        frac = np.arange(n_valid) / max(1, n_valid - 1)
+        offsets_us = np.rint(frac * (total_seconds * 1e6)).astype(np.int64)
+        start_us = np.datetime64(
+            start.astimezone(timezone.utc).replace(tzinfo=None), "us"
+        )
+
+        return PropagationResultArray(
+            datetimes=start_us + offsets_us.astype("timedelta64[us]"),
+            positions_eci=valid_pos,
+            velocities_eci=valid_vel,
+            latitudes=lats,
+            longitudes=lons,
+            altitudes=alts,
+            speeds=speeds,
+            in_shadow=shadows,
+        )
+
+    @staticmethod
+    def propagate_range_many(
+        propagators: list[OrbitalPropagator],
+        start: datetime,
+        end: datetime,
+        step_seconds: float = 60.0,
+    ) -> BatchPropagationResult:
+        """Propagate many satellites over one time grid in a single batch.
+
+        Convenience wrapper around GroupPropagator for one-off batches.
+        """
+        return GroupPropagator(propagators).propagate_range(start, end, step_seconds)
+
+    @classmethod
+    def build_group(cls, tles: list[TLEData]) -> GroupPropagator:
+        """Build a GroupPropagator, skipping TLEs that SGP4 rejects."""
+        propagators = []
+        for tle in tles:
+            try:
+                propagators.append(cls(tle))
+            except PropagationError as e:
+                logger.warning("Skipping %s in group: %s", tle.name, e)
+        return GroupPropagator(propagators)
+
+    def propagate_positions(
+        self,
+        start: datetime,
+        end: datetime,
+        step_seconds: float = 60.0,
+        dtype: np.dtype = np.float32,
+    ) -> np.ndarray:
+        """ECI positions (km) over a time range as a compact (N, 3) array.
+
+        Lightweight counterpart of propagate_range for orbit trails: no
+        geodetic conversion, shadow test or per-point result objects.
+        Failed points are dropped. float32 (~1 m at LEO radii) is ample
+        for rendering and halves the memory handed to the GPU.
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+
+        jd_arr, fr_arr = generate_time_steps(start, end, step_seconds)
+        errors, positions, _ = self._satellite.sgp4_array(jd_arr, fr_arr)
+
+        valid = errors == 0
+        if not valid.all():
+            logger.warning(
+                "%d/%d propagation points failed for %s",
+                len(valid) - int(valid.sum()),
+                len(valid),
+                self._tle.name,
             )
+            positions = positions[valid]
+        return positions.astype(dtype, copy=False)
 
-        return results
+    def get_orbital_elements(
+        self, dt: datetime, result: PropagationResult | None = None
+    ) -> OrbitalElements:
+        """Compute osculating Keplerian elements from state vectors.
 
-    def get_orbital_elements(self, dt: datetime) -> OrbitalElements:
-        """Compute osculating Keplerian elements from state vectors."""
-        result = self.propagate(dt)
+        result may be passed when a propagation at dt is already in hand,
+        saving a second SGP4 evaluation.
+        """
+        if result is None:
+            result = self.propagate(dt)
         elements = state_vectors_to_elements(
             result.position_eci, result.velocity_eci
         )
@@ -283,7 +531,7 @@ class OrbitalPropagator:
         start: datetime,
         periods: float = 1.0,
         steps: int = 360,
-    ) -> list[GroundTrackPoint]:
+    ) -> GroundTrackArray:
         """Generate lat/lon ground track for N orbital periods."""
         period_s = self._tle.orbital_period_seconds
         duration = period_s * periods
@@ -292,36 +540,189 @@ class OrbitalPropagator:
 
         results = self.propagate_range(start, end, step_seconds)
 
-        return [
-            GroundTrackPoint(
-                datetime_utc=r.datetime_utc,
-                latitude=r.latitude,
-                longitude=r.longitude,
-                altitude=r.altitude,
-                in_shadow=r.in_shadow,
-            )
-            for r in results
-        ]
+        # Views of the propagation arrays; no per-point objects are built
+        return GroundTrackArray(
+            datetimes=results.datetimes,
+            latitudes=results.latitudes,
+            longitudes=results.longitudes,
+            altitudes=results.altitudes,
+            in_shadow=results.in_shadow,
+        )
 
-    def _is_in_shadow(self, position_eci: np.ndarray, dt: datetime) -> bool:
+    def _is_in_shadow(
+        self, position_eci: np.ndarray, sun_hat: tuple[float, float, float]
+    ) -> bool:
         """Cylindrical Earth shadow model for a single point."""
-        sun_pos = sun_position_eci(dt)
-        sun_hat = sun_pos / np.linalg.norm(sun_pos)
+        sx, sy, sz = sun_hat
+        x, y, z = float(position_eci[0]), float(position_eci[1]), float(position_eci[2])
 
-        proj = np.dot(position_eci, sun_hat)
+        proj = x * sx + y * sy + z * sz
         if proj > 0:
             return False
 
-        perp = position_eci - proj * sun_hat
-        perp_dist = np.linalg.norm(perp)
-        return perp_dist < R_EARTH
+        perp_sq = x * x + y * y + z * z - proj * proj
+        return perp_sq < R_EARTH * R_EARTH
 
     def _is_in_shadow_batch(
-        self, positions_eci: np.ndarray, sun_pos: np.ndarray
+        self, positions_eci: np.ndarray, sun_hat: tuple[float, float, float]
     ) -> np.ndarray:
-        """Vectorized shadow check for N positions."""
-        sun_hat = sun_pos / np.linalg.norm(sun_pos)
-        proj = positions_eci @ sun_hat
-        perp = positions_eci - np.outer(proj, sun_hat)
-        perp_dist = np.linalg.norm(perp, axis=1)
-        return (proj <= 0) & (perp_dist < R_EARTH)
+        """Vectorized shadow check for N positions given the unit Sun vector."""
+        proj = positions_eci @ np.asarray(sun_hat)
+        # |perp|^2 = |r|^2 - proj^2, so no (N, 3) perpendicular array is built
+        perp_sq = _row_norms_sq(positions_eci)
+        perp_sq -= proj * proj
+        return (proj <= 0) & (perp_sq < R_EARTH * R_EARTH)
+
+
+class GroupPropagator:
+    """Batch propagator for a fixed set of satellites.
+
+    The SatrecArray is assembled once, so repeated batch propagations of
+    the same group (e.g. trail refreshes) reuse it.
+    """
+
+    def __init__(self, propagators: list[OrbitalPropagator]):
+        if not propagators:
+            raise ValueError("GroupPropagator needs at least one propagator")
+        self._propagators = list(propagators)
+        self._satellites = SatrecArray([p.satellite for p in self._propagators])
+
+    @property
+    def propagators(self) -> list[OrbitalPropagator]:
+        return self._propagators
+
+    def __len__(self) -> int:
+        return len(self._propagators)
+
+    def propagate_state_jd(
+        self, jd: float, fr: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Raw SGP4 ECI state of every satellite at one instant.
+
+        No frame conversions, for callers that only need the vectors.
+
+        Returns:
+            (positions, velocities, valid) with shapes (N, 3), (N, 3) and (N,),
+            in km and km/s.
+        """
+        errors, positions, velocities = self._satellites.sgp4(
+            np.array((jd,)), np.array((fr,))
+        )
+        return positions[:, 0], velocities[:, 0], errors[:, 0] == 0
+
+    def propagate_range(
+        self,
+        start: datetime,
+        end: datetime,
+        step_seconds: float = 60.0,
+    ) -> BatchPropagationResult:
+        """Propagate the group over one time grid in a single batch.
+
+        SGP4 runs once over the whole (satellite x time) grid via
+        SatrecArray, and the GMST, ECEF, geodetic and shadow steps are
+        applied to the flattened grid, so the Python overhead is per call
+        rather than per satellite.
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+
+        jd_arr, fr_arr = generate_time_steps(start, end, step_seconds)
+        errors, positions, velocities = self._satellites.sgp4(jd_arr, fr_arr)
+
+        valid = errors == 0
+        n_failed = valid.size - int(np.count_nonzero(valid))
+        if n_failed:
+            logger.warning(
+                "%d/%d propagation points failed across %d satellites",
+                n_failed,
+                valid.size,
+                len(self._propagators),
+            )
+            positions[~valid] = np.nan
+            velocities[~valid] = np.nan
+
+        n_sats, n_times = valid.shape
+        flat_pos = positions.reshape(-1, 3)
+
+        # Satellite-major flattening: the time grid repeats once per satellite
+        gmst_arr = np.tile(compute_gmst_batch(jd_arr, fr_arr), n_sats)
+
+        # Shadow uses a single mid-range sun position, as propagate_range
+        mid_jd = datetime_to_jd(start + (end - start) / 2)
+        sun_hat = _sun_direction(mid_jd)
+
+        gpu = None
+        if len(flat_pos) >= propagator_cupy.GPU_MIN_POINTS:
+            gpu = propagator_cupy.geodetic_and_shadow(flat_pos, gmst_arr, sun_hat)
+        if gpu is not None:
+            lats, lons, alts, shadows = gpu
+        else:
+            lats, lons, alts = eci_to_geodetic_batch(flat_pos, gmst_arr)
+            shadows = self._propagators[0]._is_in_shadow_batch(flat_pos, sun_hat)
+
+        return BatchPropagationResult(
+            times_utc=jd_to_datetime_batch(jd_arr, fr_arr),
+            positions_eci=positions,
+            velocities_eci=velocities,
+            latitudes=lats.reshape(n_sats, n_times),
+            longitudes=lons.reshape(n_sats, n_times),
+            altitudes=alts.reshape(n_sats, n_times),
+            speeds=np.sqrt(_row_norms_sq(velocities)),
+            in_shadow=shadows.reshape(n_sats, n_times) & valid,
+            valid=valid,
+        )
+
+
+# Smallest satellite chunk worth handing to its own worker thread
+GROUP_CHUNK_MIN_SATELLITES = 256
+
+
+def propagate_group_range(
+    propagators: list[OrbitalPropagator],
+    start: datetime,
+    end: datetime,
+    step_seconds: float = 60.0,
+    max_workers: int | None = None,
+) -> BatchPropagationResult:
+    """Propagate many satellites over one time grid, chunked across threads.
+
+    The satellites are split into up to max_workers (default: CPU count)
+    chunks, each propagated by its own GroupPropagator on a thread pool,
+    and the per-chunk results are concatenated along the satellite axis.
+    The sgp4 extension holds the GIL, so the gain comes from overlapping
+    the NumPy frame-conversion and shadow stages, which release it.
+    Small groups are propagated inline.
+    """
+    if not propagators:
+        raise ValueError("propagate_group_range needs at least one propagator")
+
+    workers = max_workers or os.cpu_count() or 1
+    n_chunks = max(1, min(workers, len(propagators) // GROUP_CHUNK_MIN_SATELLITES))
+    if n_chunks == 1:
+        return GroupPropagator(propagators).propagate_range(start, end, step_seconds)
+
+    bounds = np.linspace(0, len(propagators), n_chunks + 1).astype(int)
+    groups = [
+        GroupPropagator(propagators[lo:hi])
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+    with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+        parts = list(
+            executor.map(
+                lambda g: g.propagate_range(start, end, step_seconds), groups
+            )
+        )
+
+    return BatchPropagationResult(
+        times_utc=parts[0].times_utc,
+        positions_eci=np.concatenate([p.positions_eci for p in parts]),
+        velocities_eci=np.concatenate([p.velocities_eci for p in parts]),
+        latitudes=np.concatenate([p.latitudes for p in parts]),
+        longitudes=np.concatenate([p.longitudes for p in parts]),
+        altitudes=np.concatenate([p.altitudes for p in parts]),
+        speeds=np.concatenate([p.speeds for p in parts]),
+        in_shadow=np.concatenate([p.in_shadow for p in parts]),
+        valid=np.concatenate([p.valid for p in parts]),
+    )
@@ -0,0 +1,126 @@
+"""Optional CuPy (CUDA) path for large batch-propagation post-processing.
+
+After SGP4, the ECI -> geodetic conversion and the shadow test are
+independent per point. For mega-constellation grids (>= GPU_MIN_POINTS)
+they run here as one fused elementwise kernel: positions go to the GPU
+once, and only latitude, longitude, altitude and the shadow mask come
+back. SGP4 itself stays on the CPU.
+
+Disabled unless CuPy is importable and SENTINEL_USE_CUPY=1 is set.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+
+from utils.constants import (
+    ECCENTRICITY_SQ,
+    R_EARTH,
+    R_EARTH_EQUATORIAL,
+    RAD_TO_DEG,
+)
+
+logger = logging.getLogger(__name__)
+
+# Smallest (satellite x time) grid worth the host <-> device transfers
+GPU_MIN_POINTS = 1_000_000
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+_kernel = None
+
+
+def is_enabled() -> bool:
+    """True when CuPy is installed and SENTINEL_USE_CUPY=1 is set."""
+    return cp is not None and os.environ.get("SENTINEL_USE_CUPY") == "1"
+
+
+def _geodetic_shadow_kernel():
+    """Build (once) the fused ECI -> geodetic + cylindrical shadow kernel.
+
+    Same math as eci_to_geodetic_batch (5 Bowring iterations) and
+    OrbitalPropagator._is_in_shadow_batch.
+    """
+    global _kernel
+    if _kernel is None:
+        _kernel = cp.ElementwiseKernel(
+            "float64 x, float64 y, float64 z, float64 gmst, "
+            "float64 sx, float64 sy, float64 sz",
+            "float64 lat, float64 lon, float64 alt, bool shadow",
+            f"""
+            const double a = {R_EARTH_EQUATORIAL!r};
+            const double e2 = {ECCENTRICITY_SQ!r};
+            const double two_pi = 6.283185307179586;
+            const double pi = 3.141592653589793;
+
+            double p = hypot(x, y);
+            double ln = fmod(atan2(y, x) - gmst + pi, two_pi);
+            if (ln < 0.0) ln += two_pi;
+            ln -= pi;
+
+            double la = atan2(z, p * (1.0 - e2));
+            for (int k = 0; k < 5; ++k) {{
+                double s = sin(la);
+                double n = a / sqrt(1.0 - e2 * s * s);
+                la = atan2(z + e2 * n * s, p);
+            }}
+            double s = sin(la);
+            double c = cos(la);
+            double n = a / sqrt(1.0 - e2 * s * s);
+            alt = fabs(c) > 1e-10
+                ? p / c - n
+                : fabs(z) / fmax(fabs(s), 1e-20) - n * (1.0 - e2);
+            lat = la * {RAD_TO_DEG!r};
+            lon = ln * {RAD_TO_DEG!r};
+
+            double proj = x * sx + y * sy + z * sz;
+            shadow = proj <= 0.0
+                && (x * x + y * y + z * z - proj * proj) < {R_EARTH * R_EARTH!r};
+            """,
+            "sentinel_geodetic_shadow",
+        )
+    return _kernel
+
+
+def geodetic_and_shadow(
+    positions_eci: np.ndarray,
+    gmst_array: np.ndarray,
+    sun_hat: tuple[float, float, float],
+) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Geodetic coordinates and shadow mask for N ECI positions on the GPU.
+
+    Args:
+        positions_eci: shape (N, 3) ECI positions in km
+        gmst_array: shape (N,) GMST values in radians
+        sun_hat: unit ECI Sun vector
+
+    Returns:
+        (latitudes_deg, longitudes_deg, altitudes_km, in_shadow) as host
+        arrays, or None if the GPU path is disabled or fails (callers
+        then use the NumPy path).
+    """
+    if not is_enabled():
+        return None
+
+    try:
+        pos = cp.asarray(positions_eci, dtype=cp.float64)
+        gmst = cp.asarray(gmst_array, dtype=cp.float64)
+        lat, lon, alt, shadow = _geodetic_shadow_kernel()(
+            pos[:, 0], pos[:, 1], pos[:, 2], gmst, *sun_hat
+        )
+        return (
+            cp.asnumpy(lat),
+            cp.asnumpy(lon),
+            cp.asnumpy(alt),
+            cp.asnumpy(shadow),
+        )
+    except Exception as e:
+        logger.warning("CuPy post-processing failed, using NumPy: %s", e)
+        return None
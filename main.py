@@ -69,9 +69,11 @@ def main() -> None:
     logger.info("Starting Orbital Propagator")
 
     from PyQt6.QtWidgets import QApplication, QSplashScreen
-    from PyQt6.QtGui import QPixmap, QFont, QColor, QPainter
+    from PyQt6.QtGui import QPixmap, QFont, QPainter
     from PyQt6.QtCore import Qt, QTimer
 
+    from utils.palette import BG_PRIMARY_Q, SPACE_BACKGROUND_Q, TEXT_TERTIARY_Q
+
     app = QApplication(sys.argv)
     app.setApplicationName("Orbital Propagator")
     app.setOrganizationName("OrbitalPropagator")
@@ -84,10 +86,10 @@ def main() -> None:
 
     # Create splash screen
     splash_pixmap = QPixmap(450, 280)
-    splash_pixmap.fill(QColor("#0A0A0F"))
+    splash_pixmap.fill(SPACE_BACKGROUND_Q)
 
     painter = QPainter(splash_pixmap)
-    painter.setPen(QColor("#FFFFFF"))
+    painter.setPen(BG_PRIMARY_Q)
     font = QFont("Segoe UI", 20, QFont.Weight.Bold)
     painter.setFont(font)
     painter.drawText(
@@ -97,7 +99,7 @@ def main() -> None:
     )
     font_small = QFont("Segoe UI", 11)
     painter.setFont(font_small)
-    painter.setPen(QColor("#A3A3A3"))
+    painter.setPen(TEXT_TERTIARY_Q)
     rect = splash_pixmap.rect()
     rect.moveTop(40)
     painter.drawText(
@@ -124,7 +126,7 @@ def main() -> None:
     splash.showMessage(
         "Initializing 3D scene...",
         Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
-        QColor("#A3A3A3"),
+        TEXT_TERTIARY_Q,
     )
     app.processEvents()
 
@@ -136,7 +138,7 @@ def main() -> None:
     splash.showMessage(
         "Loading satellites...",
         Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
-        QColor("#A3A3A3"),
+        TEXT_TERTIARY_Q,
     )
     app.processEvents()
 
@@ -10,12 +10,12 @@ from __future__ import annotations
 import logging
 import sys
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QKeySequence, QShortcut
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QGuiApplication, QKeySequence
 from PyQt6.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QMainWindow,
     QMenuBar,
+    QMessageBox,
     QStatusBar,
     QVBoxLayout,
     QWidget,
@@ -30,35 +31,118 @@ from PyQt6.QtWidgets import (
 
 from pyvistaqt import QtInteractor
 
+from core.propagator import GroupPropagator
 from core.tle_parser import TLEData, TLEManager, parse_tle_text
+from ui.info_panel import fix_label_size
 from ui.sidebar import SidebarWidget
 from utils.constants import SATELLITE_COLORS
+from utils.time_utils import JulianDate, unix_to_jd
 from visualization.scene import OrbitalScene
 
 logger = logging.getLogger(__name__)
 
+_perf_counter = time.perf_counter
+
+
+class PropagationJob(QRunnable):
+    """Runs SGP4 for every scene satellite at one instant on a pool thread.
+
+    Only the raw ECI states are computed here; actor updates and the
+    render happen on the GUI thread when the result is delivered through
+    done (a signal emit, so the call is queued to the receiver's thread).
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        group: GroupPropagator,
+        sat_ids: tuple[str, ...],
+        jd: JulianDate,
+        done: Callable[[object], None],
+    ):
+        super().__init__()
+        self._generation = generation
+        self._group = group
+        self._sat_ids = sat_ids
+        self._jd = jd
+        self._done = done
+
+    def run(self) -> None:
+        try:
+            states = self._group.propagate_state_jd(self._jd.jd, self._jd.fr)
+        except Exception as e:
+            logger.error("Background propagation failed: %s", e)
+            states = None
+        self._done((self._generation, self._jd, self._sat_ids, states))
+
 
 class SimulationController(QObject):
-    """Drives the simulation clock and triggers rendering updates."""
+    """Drives the simulation clock and triggers rendering updates.
+
+    The clock and the renderer run on separate timers: a cheap coarse
+    timer integrates sim_time from wall-clock deltas, and a render timer
+    at the display refresh rate propagates and redraws only when the
+    clock has moved and the window is actually on screen. SGP4 for a
+    frame runs as a PropagationJob on the thread pool; at most one job is
+    in flight, and its result is applied to the scene on the GUI thread.
+    """
 
     time_updated = pyqtSignal(object)  # emits datetime
+    slow_update = pyqtSignal(object)  # emits datetime, >= 1 s of sim time apart
+    # (generation, jd, sat_ids, states) from a finished PropagationJob
+    positions_ready = pyqtSignal(object)
+
+    # Clock integration interval (ms); only advances sim_time
+    CLOCK_INTERVAL_MS = 16
+    # Render interval used when the screen refresh rate is unknown (~30 FPS)
+    DEFAULT_RENDER_INTERVAL_MS = 33
+    MIN_RENDER_INTERVAL_MS = 4
+    # Minimum wall-clock spacing of time_updated during playback (~10 Hz);
+    # text refreshes faster than this are not perceptible
+    MIN_UI_INTERVAL_MS = 100
+    # Sim-time spacing of slow_update (orbital element refresh)
+    SLOW_UPDATE_SIM_SECONDS = 1.0
 
     def __init__(self, scene: OrbitalScene, parent=None):
         super().__init__(parent)
         self.scene = scene
-        self.sim_time = datetime.now(timezone.utc)
+        # Sim clock as a POSIX timestamp; boxed into a datetime on read
+        self._sim_epoch_s = datetime.now(timezone.utc).timestamp()
         self.warp_factor = 1.0
         self._is_playing = False
+        self._dirty = False
+        self._last_slow_update_s: Optional[float] = None
+        self._last_ui_emit = 0.0
         self._last_wall_time = 0.0
         self._frame_count = 0
         self._fps_timer = 0.0
         self._current_fps = 0.0
-
-        # Render timer: 33ms = ~30 FPS
+        self._job_in_flight = False
+        # Bumped when the clock jumps or the view closes; results of jobs
+        # submitted under an older generation are dropped on delivery
+        self._generation = 0
+
+        self._thread_pool = QThreadPool.globalInstance()
+        self.positions_ready.connect(self._apply_positions)
+
+        # Bound methods used every frame, resolved once
+        self._snapshot = scene.propagation_snapshot
+        self._scene_apply = scene.apply_positions
+        self._emit_time = self.time_updated.emit
+        self._emit_positions = self.positions_ready.emit
+
+        # Logical clock: cheap, coarse timer
+        self.clock_timer = QTimer()
+        self.clock_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.clock_timer.timeout.connect(self._advance_clock)
+        self.clock_timer.setInterval(self.CLOCK_INTERVAL_MS)
+
+        # Render timer: paced to the display refresh rate. Renders are not
+        # frame-locked, so a coarse timer is accurate enough.
         self.render_timer = QTimer()
-        self.render_timer.setTimerType(Qt.TimerType.PreciseTimer)
-        self.render_timer.timeout.connect(self._tick)
-        self.render_timer.setInterval(33)
+        self.render_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.render_timer.timeout.connect(self._render_frame)
+        self.render_timer.setInterval(self._render_interval_ms())
 
     def play(self) -> None:
         """Start the simulation."""
@@ -66,13 +150,22 @@ class SimulationController(QObject):
         self._last_wall_time = time.perf_counter()
         self._fps_timer = self._last_wall_time
         self._frame_count = 0
+        # Re-query the refresh rate: the window may have moved screens
+        self.render_timer.setInterval(self._render_interval_ms())
+        self.clock_timer.start()
         self.render_timer.start()
 
     def pause(self) -> None:
         """Pause the simulation."""
         self._is_playing = False
+        self.clock_timer.stop()
         self.render_timer.stop()
 
+    def shutdown(self) -> None:
+        """Stop the timers and drop any propagation still in flight."""
+        self.pause()
+        self._generation += 1
+
     def toggle_play_pause(self) -> None:
         if self._is_playing:
             self.pause()
@@ -94,16 +187,33 @@ class SimulationController(QObject):
     def reset_to_now(self) -> None:
         """Reset simulation time to current UTC."""
         self.sim_time = datetime.now(timezone.utc)
+        self._generation += 1
         self.time_updated.emit(self.sim_time)
+        self._emit_slow_update(force=True)
         self.scene.update(self.sim_time)
+        self._dirty = False
 
     def jump_to_time(self, dt: datetime) -> None:
         """Jump to a specific time."""
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         self.sim_time = dt
+        self._generation += 1
         self.time_updated.emit(self.sim_time)
+        self._emit_slow_update(force=True)
         self.scene.update(self.sim_time)
+        self._dirty = False
+
+    @property
+    def sim_time(self) -> datetime:
+        """Current simulation time (UTC)."""
+        return datetime.fromtimestamp(self._sim_epoch_s, timezone.utc)
+
+    @sim_time.setter
+    def sim_time(self, value: datetime) -> None:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self._sim_epoch_s = value.timestamp()
 
     @property
     def is_playing(self) -> bool:
@@ -113,31 +223,109 @@ class SimulationController(QObject):
     def fps(self) -> float:
         return self._current_fps
 
-    def _tick(self) -> None:
-        """Called every 33ms by QTimer."""
-        now = time.perf_counter()
+    def _render_interval_ms(self) -> int:
+        """Render interval matching the primary screen's refresh rate."""
+        screen = QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen is not None else 0.0
+        if refresh_hz <= 0:
+            return self.DEFAULT_RENDER_INTERVAL_MS
+        return max(self.MIN_RENDER_INTERVAL_MS, int(1000.0 / refresh_hz))
+
+    def _view_visible(self) -> bool:
+        """False while the owning window is hidden or minimized."""
+        window = self.parent()
+        if not isinstance(window, QWidget):
+            return True
+        return window.isVisible() and not window.isMinimized()
+
+    def _advance_clock(self) -> None:
+        """Integrate sim_time from the wall-clock delta (no propagation)."""
+        now = _perf_counter()
         wall_dt = now - self._last_wall_time
         self._last_wall_time = now
 
-        # FPS tracking
-        self._frame_count += 1
-        if now - self._fps_timer >= 1.0:
-            self._current_fps = self._frame_count / (now - self._fps_timer)
+        # Advance simulation time (plain float arithmetic, no datetime objects)
+        self._sim_epoch_s += wall_dt * self.warp_factor
+        self._dirty = True
+
+    def _render_frame(self) -> None:
+        """Start propagating the latest sim_time, if anything changed.
+
+        While a job is in flight the frame is skipped (and stays dirty),
+        so jobs never queue up behind a slow propagation.
+        """
+        if not self._dirty or self._job_in_flight or not self._view_visible():
+            return
+        self._dirty = False
+
+        # FPS tracking (rendered frames); counters read once into locals
+        now = _perf_counter()
+        frame_count = self._frame_count + 1
+        elapsed = now - self._fps_timer
+        if elapsed >= 1.0:
+            self._current_fps = frame_count / elapsed
             self._fps_timer = now
-            self._frame_count = 0
-
-        # Advance simulation time
-        sim_dt = wall_dt * self.warp_factor
-        self.sim_time += timedelta(seconds=sim_dt)
+            frame_count = 0
+        self._frame_count = frame_count
+
+        # Time goes down as a split JD straight from the clock
+        jd = unix_to_jd(self._sim_epoch_s)
+        sat_ids, group = self._snapshot()
+        if group is None:
+            self._apply_positions((self._generation, jd, sat_ids, None))
+            return
+        self._job_in_flight = True
+        self._thread_pool.start(
+            PropagationJob(
+                self._generation, group, sat_ids, jd, self._emit_positions
+            )
+        )
 
-        # Update scene
-        self.scene.update(self.sim_time)
-        self.time_updated.emit(self.sim_time)
+    def _apply_positions(self, result: tuple) -> None:
+        """Apply a finished propagation to the scene (GUI thread).
+
+        Results from before the last jump, reset or shutdown are stale:
+        the scene already shows a newer instant (or is gone).
+        """
+        self._job_in_flight = False
+        generation, jd, sat_ids, states = result
+        if generation != self._generation:
+            return
+        self._scene_apply(jd, sat_ids, states)
+
+        # UI text follows at a lower rate than the 3D view
+        now = _perf_counter()
+        if (now - self._last_ui_emit) * 1000.0 >= self.MIN_UI_INTERVAL_MS:
+            self._last_ui_emit = now
+            sim_time = self.sim_time
+            self._emit_time(sim_time)
+            self._emit_slow_update(sim_time=sim_time)
+
+    def _emit_slow_update(
+        self, force: bool = False, sim_time: Optional[datetime] = None
+    ) -> None:
+        """Emit slow_update once sim time has moved far enough (or if forced)."""
+        last = self._last_slow_update_s
+        epoch_s = self._sim_epoch_s
+        if (
+            force
+            or last is None
+            or abs(epoch_s - last) >= self.SLOW_UPDATE_SIM_SECONDS
+        ):
+            self._last_slow_update_s = epoch_s
+            self.slow_update.emit(sim_time or self.sim_time)
 
 
 class OrbitalPropagatorApp(QMainWindow):
     """Main application window."""
 
+    # Color-mode combo text -> OrbitRenderer color mode
+    COLOR_MODES = {
+        "Solid Color": "solid",
+        "By Altitude": "altitude",
+        "By Velocity": "velocity",
+    }
+
     def __init__(self, data_dir: Optional[Path] = None):
         super().__init__()
         self.setWindowTitle("Orbital Propagator")
@@ -146,23 +334,37 @@ class OrbitalPropagatorApp(QMainWindow):
 
         self._data_dir = data_dir or Path(__file__).parent.parent / "data"
         self._selected_sat_id: Optional[str] = None
+        self._last_displayed_second = -1
+        self._last_fps = -1.0
+        self._camera_interacting = False
 
         # Build UI
         self._build_layout()
         self._setup_menus()
         self._setup_status_bar()
-        self._setup_shortcuts()
 
         # Initialize scene
         self.scene = OrbitalScene(self.plotter)
         self.scene.initialize()
 
+        self._watch_camera_interaction()
+
         # Simulation controller
         self.sim_controller = SimulationController(self.scene, self)
+        self._setup_shortcuts()
 
         # Wire signals
         self._connect_signals()
 
+        # Import the search dialog once the window is up, so the first
+        # click on it does not pay for the import on the GUI thread
+        QTimer.singleShot(500, self._warm_imports)
+
+    @staticmethod
+    def _warm_imports() -> None:
+        """Preload modules that are otherwise imported on first use."""
+        import ui.search_dialog  # noqa: F401
+
     def _build_layout(self) -> None:
         """Create the main layout: viewport + sidebar."""
         central = QWidget()
@@ -221,37 +423,23 @@ class OrbitalPropagatorApp(QMainWindow):
         # View menu
         view_menu = menu_bar.addMenu("&View")
 
+        # toggled signals are connected in _connect_signals, once the scene exists
         self.trails_action = QAction("Orbit &Trails", self, checkable=True, checked=True)
-        self.trails_action.toggled.connect(
-            lambda v: self.scene.orbits.toggle_all(v) if hasattr(self, "scene") else None
-        )
         view_menu.addAction(self.trails_action)
 
         self.labels_action = QAction("&Labels", self, checkable=True, checked=True)
-        self.labels_action.toggled.connect(
-            lambda v: self.scene.satellites.toggle_labels(v) if hasattr(self, "scene") else None
-        )
         view_menu.addAction(self.labels_action)
 
         self.ground_track_action = QAction("&Ground Tracks", self, checkable=True)
-        self.ground_track_action.toggled.connect(
-            lambda v: self.scene.toggle_ground_tracks(v) if hasattr(self, "scene") else None
-        )
         view_menu.addAction(self.ground_track_action)
 
         view_menu.addSeparator()
 
-        axes_action = QAction("ECI &Axes", self, checkable=True)
-        axes_action.toggled.connect(
-            lambda v: self.scene.toggle_axes(v) if hasattr(self, "scene") else None
-        )
-        view_menu.addAction(axes_action)
+        self.axes_action = QAction("ECI &Axes", self, checkable=True)
+        view_menu.addAction(self.axes_action)
 
-        grid_action = QAction("Equatorial &Grid", self, checkable=True)
-        grid_action.toggled.connect(
-            lambda v: self.scene.toggle_equatorial_grid(v) if hasattr(self, "scene") else None
-        )
-        view_menu.addAction(grid_action)
+        self.grid_action = QAction("Equatorial &Grid", self, checkable=True)
+        view_menu.addAction(self.grid_action)
 
         # Help menu
         help_menu = menu_bar.addMenu("&Help")
@@ -268,67 +456,106 @@ class OrbitalPropagatorApp(QMainWindow):
         """Create status bar."""
         self.status_bar = self.statusBar()
 
-        self.time_status_label = QLabel("Sim Time: --")
+        # The per-tick readouts get fixed sizes so setText never relayouts;
+        # parented up front so the status bar stylesheet applies when measured
+        self.time_status_label = QLabel("Sim Time: --", self.status_bar)
+        fix_label_size(
+            self.time_status_label, "Sim Time: 0000/00/00 00:00:00 UTC", padding=12
+        )
         self.status_bar.addWidget(self.time_status_label, stretch=2)
 
         self.selected_status_label = QLabel("Selected: None")
         self.status_bar.addWidget(self.selected_status_label, stretch=1)
 
-        self.fps_label = QLabel("-- FPS")
+        self.fps_label = QLabel("-- FPS", self.status_bar)
+        fix_label_size(self.fps_label, "0000 FPS", padding=8)
         self.status_bar.addPermanentWidget(self.fps_label)
 
         self.status_label = QLabel("Ready")
         self.status_bar.addPermanentWidget(self.status_label)
 
     def _setup_shortcuts(self) -> None:
-        """Create keyboard shortcuts."""
-        shortcuts = {
-            "Space": self._toggle_play_pause,
-            "+": lambda: self.sim_controller.increase_warp(),
-            "=": lambda: self.sim_controller.increase_warp(),
-            "-": lambda: self.sim_controller.decrease_warp(),
-            "R": lambda: self.sim_controller.reset_to_now(),
-            "F": self._focus_selected,
-            "G": lambda: self.ground_track_action.toggle(),
-            "T": lambda: self.trails_action.toggle(),
-            "L": lambda: self.labels_action.toggle(),
-        }
-        for key, callback in shortcuts.items():
-            shortcut = QShortcut(QKeySequence(key), self)
-            shortcut.activated.connect(callback)
+        """Create keyboard shortcuts as window actions.
+
+        The View menu toggles (trails, labels, ground tracks) carry their
+        own shortcuts; the rest are actions registered on the window.
+        """
+        self.trails_action.setShortcut(QKeySequence("T"))
+        self.labels_action.setShortcut(QKeySequence("L"))
+        self.ground_track_action.setShortcut(QKeySequence("G"))
+
+        shortcuts = [
+            (("Space",), self._toggle_play_pause),
+            (("+", "="), self.sim_controller.increase_warp),
+            (("-",), self.sim_controller.decrease_warp),
+            (("R",), self.sim_controller.reset_to_now),
+            (("F",), self._focus_selected),
+        ]
+        for keys, callback in shortcuts:
+            action = QAction(self)
+            action.setShortcuts([QKeySequence(key) for key in keys])
+            action.triggered.connect(callback)
+            self.addAction(action)
 
     def _connect_signals(self) -> None:
         """Wire up all signals between components."""
+        # View menu toggles -> Scene
+        self.trails_action.toggled.connect(self.scene.orbits.toggle_all)
+        self.labels_action.toggled.connect(self.scene.satellites.toggle_labels)
+        self.ground_track_action.toggled.connect(self.scene.toggle_ground_tracks)
+        self.axes_action.toggled.connect(self.scene.toggle_axes)
+        self.grid_action.toggled.connect(self.scene.toggle_equatorial_grid)
+        for action in (
+            self.trails_action,
+            self.labels_action,
+            self.ground_track_action,
+            self.axes_action,
+            self.grid_action,
+        ):
+            # The view may be paused or idle; draw the change once
+            action.toggled.connect(lambda _checked: self.scene.request_render())
+
         # Time controls -> SimulationController
         self.sidebar.time_controls.play_toggled.connect(self._on_play_toggled)
         self.sidebar.time_controls.warp_changed.connect(self.sim_controller.set_warp)
         self.sidebar.time_controls.time_jumped.connect(self.sim_controller.jump_to_time)
 
         # SimulationController -> UI updates
-        self.sim_controller.time_updated.connect(self._on_time_updated)
+        # Queued: label and info panel updates run on the next event-loop
+        # pass instead of inside the frame that emitted them
+        self.sim_controller.time_updated.connect(
+            self._on_time_updated, Qt.ConnectionType.QueuedConnection
+        )
+        self.sim_controller.slow_update.connect(self._on_slow_update)
 
         # Satellite list -> Scene
         self.sidebar.satellite_list.satellite_toggled.connect(
             lambda sid, vis: self.scene.set_satellite_visible(sid, vis)
         )
+        self.sidebar.satellite_list.satellites_bulk_toggled.connect(
+            self.scene.set_satellites_visible
+        )
         self.sidebar.satellite_list.satellite_selected.connect(self._on_satellite_selected)
         self.sidebar.satellite_list.satellite_double_clicked.connect(
             lambda sid: self.scene.focus_on_satellite(sid)
         )
 
         # Display options -> Scene
+        self._display_handlers = self._build_display_handlers()
         self.sidebar.display_options.option_changed.connect(self._on_display_option_changed)
 
     def add_satellites_from_tle(self, tles: list[TLEData]) -> None:
         """Add multiple satellites from parsed TLE data."""
         self.status_label.setText(f"Loading {len(tles)} satellites...")
 
-        for tle in tles:
-            sat_id = self.scene.add_satellite(tle)
-            if sat_id:
-                self.sidebar.satellite_list.add_satellite(
-                    sat_id, tle.name
-                )
+        sat_ids = set(self.scene.add_satellites_bulk(tles))
+        self.sidebar.satellite_list.add_satellites_bulk(
+            [
+                (str(tle.catalog_number), tle.name)
+                for tle in tles
+                if str(tle.catalog_number) in sat_ids
+            ]
+        )
 
         self.status_label.setText(f"Loaded {len(tles)} satellites")
 
@@ -358,61 +585,124 @@ class OrbitalPropagatorApp(QMainWindow):
         else:
             self.sim_controller.pause()
 
-    def _on_time_updated(self, sim_time: datetime) -> None:
+    def _on_time_updated(self, _sim_time: datetime) -> None:
         """Update UI elements with new simulation time."""
-        self.sidebar.time_controls.update_time_display(sim_time)
-        self.time_status_label.setText(
-            f"Sim Time: {sim_time.strftime('%Y/%m/%d %H:%M:%S')} UTC"
-        )
-        self.fps_label.setText(f"{self.sim_controller.fps:.0f} FPS")
+        # Queued delivery: the emitted time may be stale, show the latest
+        sim_time = self.sim_controller.sim_time
+
+        # The clock labels only change once per displayed second
+        second = int(sim_time.timestamp())
+        if second != self._last_displayed_second:
+            self._last_displayed_second = second
+            self.sidebar.time_controls.update_time_display(sim_time)
+            self.time_status_label.setText(
+                f"Sim Time: {sim_time.year:04d}/{sim_time.month:02d}/"
+                f"{sim_time.day:02d} {sim_time.hour:02d}:{sim_time.minute:02d}:"
+                f"{sim_time.second:02d} UTC"
+            )
+        # FPS is recomputed once per second; skip the label otherwise
+        fps = self.sim_controller.fps
+        if fps != self._last_fps and self.fps_label.isVisible():
+            self._last_fps = fps
+            self.fps_label.setText(str(round(fps)) + " FPS")
+
+        # Update fast info panel fields for selected satellite
+        if self._info_panel_active():
+            data = self.scene.get_satellite_state(self._selected_sat_id, sim_time)
+            if data:
+                self.sidebar.info_panel.update_fast(data)
 
-        # Update info panel for selected satellite
-        if self._selected_sat_id:
-            data = self.scene.get_satellite_data(self._selected_sat_id, sim_time)
+    def _on_slow_update(self, sim_time: datetime) -> None:
+        """Refresh the slowly changing orbital element fields."""
+        if self._info_panel_active():
+            data = self.scene.get_satellite_elements(self._selected_sat_id, sim_time)
             if data:
-                self.sidebar.info_panel.update_data(data)
+                self.sidebar.info_panel.update_slow(data)
+
+    def _info_panel_active(self) -> bool:
+        """Whether per-tick info panel data is worth computing.
+
+        False with no selection, while the panel is hidden, or while the
+        user is dragging the camera (the panel catches up afterwards).
+        """
+        return (
+            self._selected_sat_id is not None
+            and self.sidebar.info_panel.isVisible()
+            and not self._camera_interacting
+        )
+
+    def _watch_camera_interaction(self) -> None:
+        """Track mouse-driven camera interaction on the 3D viewport."""
+
+        def on_start(*_args) -> None:
+            self._camera_interacting = True
+
+        def on_end(*_args) -> None:
+            self._camera_interacting = False
+
+        self.plotter.iren.add_observer("StartInteractionEvent", on_start)
+        self.plotter.iren.add_observer("EndInteractionEvent", on_end)
 
     def _on_satellite_selected(self, sat_id: str) -> None:
         """Handle satellite selection."""
         self._selected_sat_id = sat_id
         self.scene.satellites.select(sat_id)
-        self.selected_status_label.setText(
-            f"Selected: {self.scene._tle_data.get(sat_id, type('', (), {'name': sat_id})()).name if sat_id in self.scene._tle_data else sat_id}"
-        )
 
         # Immediately update info panel
         data = self.scene.get_satellite_data(sat_id, self.sim_controller.sim_time)
         if data:
             self.sidebar.info_panel.update_data(data)
-            self.selected_status_label.setText(f"Selected: {data['name']}")
+            name = data.state.name
+        else:
+            tle = self.scene._tle_data.get(sat_id)
+            name = tle.name if tle is not None else sat_id
+        self.selected_status_label.setText(f"Selected: {name}")
 
     def _on_display_option_changed(self, key: str, value: object) -> None:
         """Handle display option toggles."""
-        if key == "trails":
-            self.scene.orbits.toggle_all(bool(value))
+        handler = self._display_handlers.get(key)
+        if handler is None:
+            return
+        handler(value)
+
+        # Toggled actors skip their own render; draw once for the change
+        self.scene.request_render()
+
+    def _build_display_handlers(self) -> dict[str, Callable[[object], None]]:
+        """Map each display option key to the handler for its new value."""
+        scene = self.scene
+
+        def trails(value: object) -> None:
+            scene.orbits.toggle_all(bool(value))
             self.trails_action.setChecked(bool(value))
-        elif key == "ground_tracks":
-            self.scene.toggle_ground_tracks(bool(value))
+
+        def ground_tracks(value: object) -> None:
+            scene.toggle_ground_tracks(bool(value))
             self.ground_track_action.setChecked(bool(value))
-        elif key == "labels":
-            self.scene.satellites.toggle_labels(bool(value))
+
+        def labels(value: object) -> None:
+            scene.satellites.toggle_labels(bool(value))
             self.labels_action.setChecked(bool(value))
-        elif key == "velocity_vectors":
-            self.scene.satellites.toggle_velocity_vectors(bool(value))
-        elif key == "nadir_lines":
-            self.scene.satellites.toggle_nadir_lines(bool(value))
-        elif key == "grid_axes":
-            self.scene.toggle_axes(bool(value))
-            self.scene.toggle_equatorial_grid(bool(value))
-        elif key == "terminator":
-            self.scene.toggle_terminator(bool(value))
-        elif key == "color_mode":
-            mode_map = {
-                "Solid Color": "solid",
-                "By Altitude": "altitude",
-                "By Velocity": "velocity",
-            }
-            self.scene.orbits.set_color_mode(mode_map.get(str(value), "solid"))
+
+        def grid_axes(value: object) -> None:
+            scene.toggle_axes(bool(value))
+            scene.toggle_equatorial_grid(bool(value))
+
+        return {
+            "trails": trails,
+            "ground_tracks": ground_tracks,
+            "labels": labels,
+            "velocity_vectors": lambda v: scene.satellites.toggle_velocity_vectors(bool(v)),
+            "nadir_lines": lambda v: scene.satellites.toggle_nadir_lines(bool(v)),
+            "grid_axes": grid_axes,
+            "terminator": lambda v: scene.toggle_terminator(bool(v)),
+            "color_mode": self._set_color_mode,
+        }
+
+    def _set_color_mode(self, value: object) -> None:
+        self.scene.orbits.set_color_mode(
+            self.COLOR_MODES.get(str(value), "solid")
+        )
 
     def _focus_selected(self) -> None:
         """Focus camera on selected satellite."""
@@ -464,8 +754,6 @@ class OrbitalPropagatorApp(QMainWindow):
 
     def _show_about(self) -> None:
         """Show about dialog."""
-        from PyQt6.QtWidgets import QMessageBox
-
         QMessageBox.about(
             self,
             "About Orbital Propagator",
@@ -477,8 +765,6 @@ class OrbitalPropagatorApp(QMainWindow):
 
     def _show_shortcuts(self) -> None:
         """Show keyboard shortcuts dialog."""
-        from PyQt6.QtWidgets import QMessageBox
-
         text = (
             "Keyboard Shortcuts:\n\n"
             "Space    - Play / Pause\n"
@@ -498,6 +784,6 @@ class OrbitalPropagatorApp(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Clean up on close."""
-        self.sim_controller.pause()
+        self.sim_controller.shutdown()
         self.plotter.close()
         super().closeEvent(event)
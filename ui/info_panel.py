@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from operator import attrgetter
+from typing import Callable, Optional
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -14,6 +15,55 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from visualization.scene import SatelliteData, SatelliteElements, SatelliteState
+
+
+# Display format per field; values are the attributes of the views
+# returned by OrbitalScene.get_satellite_state / get_satellite_elements
+_FORMATTERS: dict[str, Callable[[object], str]] = {
+    "lat": lambda v: f"{v:+.4f}",
+    "lon": lambda v: f"{v:+.4f}",
+    "alt": lambda v: f"{v:,.1f}",
+    "vel": lambda v: f"{v:.3f}",
+    "sma": lambda v: f"{v:,.1f}",
+    "ecc": lambda v: f"{v:.6f}",
+    "inc": lambda v: f"{v:.4f}",
+    "raan": lambda v: f"{v:.4f}",
+    "aop": lambda v: f"{v:.4f}",
+    "ta": lambda v: f"{v:.4f}",
+    "period": lambda v: f"{v:.2f}",
+    "apogee": lambda v: f"{v:,.1f}",
+    "perigee": lambda v: f"{v:,.1f}",
+    "tle_age": lambda v: f"{v:.1f}",
+    "orbit_type": str,
+}
+
+
+# Fields refreshed every frame; the rest (orbital elements) are throttled
+FAST_FIELDS = frozenset({"lat", "lon", "alt", "vel"})
+
+# Widest text any value label shows (monospaced font, see theme.qss)
+_VALUE_TEMPLATE = "+000,000.000000"
+
+
+def fix_label_size(label: QLabel, template: str, padding: int = 0) -> None:
+    """Pin a label to the size of template in its styled font.
+
+    A label whose minimum and maximum sizes are equal does not ask its
+    layout to recompute on setText, so frequently updated readouts stop
+    triggering relayouts.
+    """
+    label.ensurePolished()  # apply the stylesheet font before measuring
+    metrics = label.fontMetrics()
+    margins = label.contentsMargins()
+    label.setFixedSize(
+        metrics.horizontalAdvance(template)
+        + margins.left()
+        + margins.right()
+        + padding,
+        label.sizeHint().height(),
+    )
+
 
 class InfoPanelWidget(QGroupBox):
     """Displays detailed orbital data for the selected satellite."""
@@ -70,6 +120,7 @@ class InfoPanelWidget(QGroupBox):
         for key, label, unit in field_defs:
             value_label = QLabel("--")
             value_label.setObjectName("valueLabel")
+            fix_label_size(value_label, _VALUE_TEMPLATE)
 
             if unit:
                 row_widget = QWidget()
@@ -90,42 +141,71 @@ class InfoPanelWidget(QGroupBox):
         layout.addLayout(self.data_layout)
         self.setLayout(layout)
 
-    def update_data(self, data: dict) -> None:
+        # Last text pushed to each label, so unchanged values skip setText
+        self._last_text: dict[QLabel, str] = {}
+
+        # (getter, label, formatter) resolved once for the per-tick loops
+        plan = [
+            (key, (attrgetter(key), self._fields[key], _FORMATTERS[key]))
+            for key in self._fields
+        ]
+        self._fast_plan = [entry for key, entry in plan if key in FAST_FIELDS]
+        self._slow_plan = [entry for key, entry in plan if key not in FAST_FIELDS]
+
+    def update_data(self, data: SatelliteData) -> None:
         """Update all fields with new satellite data."""
-        self.name_label.setText(data.get("name", "Unknown"))
-        norad_id = data.get("norad_id", "N/A")
-        self.norad_label.setText(f"NORAD ID: {norad_id}")
-
-        in_shadow = data.get("in_shadow", False)
-        self.shadow_label.setText("In Earth's shadow" if in_shadow else "In sunlight")
-
-        formatters = {
-            "lat": lambda v: f"{v:+.4f}",
-            "lon": lambda v: f"{v:+.4f}",
-            "alt": lambda v: f"{v:,.1f}",
-            "vel": lambda v: f"{v:.3f}",
-            "sma": lambda v: f"{v:,.1f}",
-            "ecc": lambda v: f"{v:.6f}",
-            "inc": lambda v: f"{v:.4f}",
-            "raan": lambda v: f"{v:.4f}",
-            "aop": lambda v: f"{v:.4f}",
-            "ta": lambda v: f"{v:.4f}",
-            "period": lambda v: f"{v:.2f}",
-            "apogee": lambda v: f"{v:,.1f}",
-            "perigee": lambda v: f"{v:,.1f}",
-            "tle_age": lambda v: f"{v:.1f}",
-            "orbit_type": lambda v: str(v),
-        }
-
-        for key, label in self._fields.items():
-            value = data.get(key)
-            if value is not None and key in formatters:
-                try:
-                    label.setText(formatters[key](value))
-                except (ValueError, TypeError):
-                    label.setText("--")
-            else:
-                label.setText("--")
+        self.update_fast(data.state)
+        self.update_slow(data.elements)
+
+    def update_fast(self, data: SatelliteState) -> None:
+        """Update the header and the per-frame fields (position, speed).
+
+        Repaints are suspended while the labels are written, so the panel
+        relayouts and repaints once per call; labels whose text is
+        unchanged are not touched at all.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            name = data.name
+            self._set_text(self.name_label, "Unknown" if name is None else name)
+            norad_id = data.norad_id
+            self._set_text(
+                self.norad_label,
+                f"NORAD ID: {'N/A' if norad_id is None else norad_id}",
+            )
+            self._set_text(
+                self.shadow_label,
+                "In Earth's shadow" if data.in_shadow else "In sunlight",
+            )
+
+            self._apply_plan(self._fast_plan, data)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def update_slow(self, data: SatelliteElements) -> None:
+        """Update the orbital element fields, which change slowly."""
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_plan(self._slow_plan, data)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _apply_plan(
+        self,
+        plan: list[tuple[attrgetter, QLabel, Callable[[object], str]]],
+        data: SatelliteState | SatelliteElements,
+    ) -> None:
+        for get, label, fmt in plan:
+            value = get(data)
+            self._set_text(label, "--" if value is None else fmt(value))
+
+    def _set_text(self, label: QLabel, text: str) -> None:
+        """setText only when the text actually changed."""
+        if self._last_text.get(label) != text:
+            self._last_text[label] = text
+            label.setText(text)
 
     def clear(self) -> None:
         """Reset all fields."""
@@ -134,3 +214,4 @@ class InfoPanelWidget(QGroupBox):
         self.shadow_label.setText("")
         for label in self._fields.values():
             label.setText("--")
+        self._last_text.clear()
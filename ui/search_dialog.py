@@ -7,12 +7,22 @@ satellites to the scene.
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QDialog,
@@ -21,38 +31,151 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
 from core.tle_parser import TLEData, TLEManager, parse_tle_text
-from utils.constants import CELESTRAK_BASE_URL, CELESTRAK_GROUPS
+from utils.constants import CELESTRAK_BASE_URL, CELESTRAK_GROUPS_ITEMS
 from utils.downloader import Downloader
 
 logger = logging.getLogger(__name__)
 
+# Celestrak updates group data a few times a day; a group loaded within
+# this window is served from the local cache
+GROUP_REFRESH_SECONDS = 2 * 3600
+
+# Concurrent Celestrak queries; network waits stay off the global pool,
+# which runs the per-frame propagation jobs
+MAX_QUERY_THREADS = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_tle_manager(data_dir: Path) -> TLEManager:
+    """One TLEManager (parsed TLEs, HTTP session) per data dir for all workers."""
+    return TLEManager(data_dir, Downloader(data_dir))
+
+
+@functools.lru_cache(maxsize=None)
+def _query_pool() -> QThreadPool:
+    pool = QThreadPool()
+    pool.setMaxThreadCount(MAX_QUERY_THREADS)
+    # Idle threads are kept for the app's lifetime, so a search reuses one
+    # instead of creating a thread after the default 30 s expiry
+    pool.setExpiryTimeout(-1)
+    return pool
+
 
-class CelestrakWorker(QThread):
-    """Background thread for Celestrak API queries."""
+# Qt enum values used per cell, looked up once
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_ROLE = Qt.ItemDataRole.CheckStateRole
+_CELL_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+_CHECKBOX_FLAGS = _CELL_FLAGS | Qt.ItemFlag.ItemIsUserCheckable
 
-    results_ready = pyqtSignal(list)  # list[TLEData]
-    error = pyqtSignal(str)
 
-    def __init__(self, data_dir: Path, query: str = "", group: str = ""):
+class _TLEResultsModel(QAbstractTableModel):
+    """Read-only results table over a list of TLEData.
+
+    Display text for each row arrives pre-built from the worker as a
+    (name, NORAD ID, inclination) tuple. Column 0 is a checkbox whose
+    states live in a bytearray (all checked on load).
+    """
+
+    HEADERS = ("Select", "Name", "NORAD ID", "Inclination")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tles: list[TLEData] = []
+        self._rows: list[tuple[str, str, str]] = []
+        self._checked = bytearray()
+
+    def set_tles(
+        self, tles: list[TLEData], rows: list[tuple[str, str, str]]
+    ) -> None:
+        self.beginResetModel()
+        self._tles = tles
+        self._rows = rows
+        self._checked = bytearray(b"\x01") * len(tles)
+        self.endResetModel()
+
+    def check_all(self) -> None:
+        if not self._tles:
+            return
+        self._checked = bytearray(b"\x01") * len(self._tles)
+        self.dataChanged.emit(
+            self.index(0, 0), self.index(len(self._tles) - 1, 0), [_CHECK_ROLE]
+        )
+
+    def checked_tles(self) -> list[TLEData]:
+        return [tle for tle, checked in zip(self._tles, self._checked) if checked]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tles)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        column = index.column()
+        if role == _DISPLAY_ROLE:
+            if column:
+                return self._rows[index.row()][column - 1]
+        elif role == _CHECK_ROLE and column == 0:
+            return _CHECKED if self._checked[index.row()] else _UNCHECKED
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != _CHECK_ROLE or index.column() != 0:
+            return False
+        self._checked[index.row()] = Qt.CheckState(value) == _CHECKED
+        self.dataChanged.emit(index, index, [_CHECK_ROLE])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return _CHECKBOX_FLAGS if index.column() == 0 else _CELL_FLAGS
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class CelestrakWorker(QRunnable):
+    """Thread-pool task for Celestrak API queries.
+
+    Results go out through a Signals bridge owned by the dialog, tagged
+    with the generation of the request that started the worker.
+    """
+
+    class Signals(QObject):
+        # (generation, list[TLEData], display rows)
+        results_ready = pyqtSignal(int, list, list)
+        error = pyqtSignal(int, str)  # (generation, message)
+
+    def __init__(
+        self,
+        signals: CelestrakWorker.Signals,
+        generation: int,
+        tle_manager: TLEManager,
+        query: str = "",
+        group: str = "",
+    ):
         super().__init__()
-        self._data_dir = data_dir
+        self._signals = signals
+        self._generation = generation
+        self._tle_manager = tle_manager
         self._query = query
         self._group = group
 
     def run(self) -> None:
         try:
-            downloader = Downloader(self._data_dir)
-            tle_manager = TLEManager(self._data_dir, downloader)
+            tle_manager = self._tle_manager
 
             if self._group:
                 tles = tle_manager.load_from_celestrak_group(
-                    self._group, force_refresh=True
+                    self._group, max_age_seconds=GROUP_REFRESH_SECONDS
                 )
             elif self._query.isdigit():
                 tle = tle_manager.load_from_norad_id(int(self._query))
@@ -60,10 +183,15 @@ class CelestrakWorker(QThread):
             else:
                 tles = tle_manager.search_by_name(self._query)
 
-            self.results_ready.emit(tles)
+            # Build display text here rather than on the GUI thread
+            rows = [
+                (tle.name, str(tle.catalog_number), f"{tle.inclination:.2f}")
+                for tle in tles
+            ]
+            self._signals.results_ready.emit(self._generation, tles, rows)
 
         except Exception as e:
-            self.error.emit(str(e))
+            self._signals.error.emit(self._generation, str(e))
 
 
 class CelestrakSearchDialog(QDialog):
@@ -79,7 +207,12 @@ class CelestrakSearchDialog(QDialog):
 
         self._data_dir = data_dir or Path(__file__).parent.parent / "data"
         self._results: list[TLEData] = []
-        self._worker: Optional[CelestrakWorker] = None
+
+        # Only the latest request's results are shown
+        self._generation = 0
+        self._signals = CelestrakWorker.Signals(self)
+        self._signals.results_ready.connect(self._on_results)
+        self._signals.error.connect(self._on_worker_error)
 
         self._build_ui()
 
@@ -112,8 +245,8 @@ class CelestrakSearchDialog(QDialog):
         constellation_row.addWidget(QLabel("Constellation:"))
         self.constellation_combo = QComboBox()
         self.constellation_combo.addItem("-- Select Group --")
-        for name in CELESTRAK_GROUPS:
-            self.constellation_combo.addItem(name)
+        for name, group_key in CELESTRAK_GROUPS_ITEMS:
+            self.constellation_combo.addItem(name, group_key)
         constellation_row.addWidget(self.constellation_combo, stretch=1)
 
         self.load_group_btn = QPushButton("Load Group")
@@ -124,11 +257,9 @@ class CelestrakSearchDialog(QDialog):
         layout.addLayout(constellation_row)
 
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(
-            ["Select", "Name", "NORAD ID", "Inclination"]
-        )
+        self._results_model = _TLEResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self._results_model)
         header = self.results_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
@@ -138,7 +269,7 @@ class CelestrakSearchDialog(QDialog):
         self.results_table.setColumnWidth(2, 100)
         self.results_table.setColumnWidth(3, 100)
         self.results_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QAbstractItemView.SelectionBehavior.SelectRows
         )
         layout.addWidget(self.results_table)
 
@@ -178,10 +309,7 @@ class CelestrakSearchDialog(QDialog):
         self._set_loading(True)
         self.status_label.setText("Searching...")
 
-        self._worker = CelestrakWorker(self._data_dir, query=query)
-        self._worker.results_ready.connect(self._populate_results)
-        self._worker.error.connect(self._on_search_error)
-        self._worker.start()
+        self._start_worker(query=query)
 
     def _load_constellation(self) -> None:
         """Load a predefined constellation group."""
@@ -193,42 +321,38 @@ class CelestrakSearchDialog(QDialog):
         self._set_loading(True)
         self.status_label.setText(f"Loading {group_name}...")
 
-        self._worker = CelestrakWorker(self._data_dir, group=group_name)
-        self._worker.results_ready.connect(self._populate_results)
-        self._worker.error.connect(self._on_search_error)
-        self._worker.start()
-
-    def _populate_results(self, tles: list[TLEData]) -> None:
-        """Fill the results table with TLE data."""
-        self._set_loading(False)
-        self._results = tles
-
-        self.results_table.setRowCount(len(tles))
-
-        for row, tle in enumerate(tles):
-            # Checkbox
-            cb_item = QTableWidgetItem()
-            cb_item.setFlags(
-                cb_item.flags() | Qt.ItemFlag.ItemIsUserCheckable
+        self._start_worker(group=self.constellation_combo.currentData())
+
+    def _start_worker(self, query: str = "", group: str = "") -> None:
+        """Run a query on the pool as a new generation."""
+        self._generation += 1
+        _query_pool().start(
+            CelestrakWorker(
+                self._signals,
+                self._generation,
+                _shared_tle_manager(self._data_dir),
+                query=query,
+                group=group,
             )
-            cb_item.setCheckState(Qt.CheckState.Checked)
-            self.results_table.setItem(row, 0, cb_item)
-
-            # Name
-            name_item = QTableWidgetItem(tle.name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(row, 1, name_item)
+        )
 
-            # NORAD ID
-            id_item = QTableWidgetItem(str(tle.catalog_number))
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(row, 2, id_item)
+    def _on_results(
+        self, generation: int, tles: list[TLEData], rows: list[tuple[str, str, str]]
+    ) -> None:
+        if generation == self._generation:
+            self._populate_results(tles, rows)
 
-            # Inclination
-            inc_item = QTableWidgetItem(f"{tle.inclination:.2f}")
-            inc_item.setFlags(inc_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(row, 3, inc_item)
+    def _on_worker_error(self, generation: int, error_msg: str) -> None:
+        if generation == self._generation:
+            self._on_search_error(error_msg)
 
+    def _populate_results(
+        self, tles: list[TLEData], rows: list[tuple[str, str, str]]
+    ) -> None:
+        """Show TLE data in the results table (one model reset)."""
+        self._set_loading(False)
+        self._results = tles
+        self._results_model.set_tles(tles, rows)
         self.status_label.setText(f"Found {len(tles)} satellites")
 
     def _on_search_error(self, error_msg: str) -> None:
@@ -239,20 +363,11 @@ class CelestrakSearchDialog(QDialog):
 
     def _select_all(self) -> None:
         """Select all results."""
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self._results_model.check_all()
 
     def _add_selected(self) -> None:
         """Add checked satellites and close."""
-        selected_tles: list[TLEData] = []
-
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                if row < len(self._results):
-                    selected_tles.append(self._results[row])
+        selected_tles = self._results_model.checked_tles()
 
         if selected_tles:
             self.satellites_added.emit(selected_tles)
@@ -41,9 +41,8 @@ class DisplayOptionsWidget(QGroupBox):
         for key, label, default in toggle_defs:
             cb = QCheckBox()
             cb.setChecked(default)
-            cb.toggled.connect(
-                lambda checked, k=key: self.option_changed.emit(k, checked)
-            )
+            cb.setProperty("option_key", key)
+            cb.toggled.connect(self._on_toggle)
             layout.addRow(label, cb)
             self._toggles[key] = cb
 
@@ -53,13 +52,18 @@ class DisplayOptionsWidget(QGroupBox):
         # Orbit color mode dropdown
         self.color_mode = QComboBox()
         self.color_mode.addItems(["Solid Color", "By Altitude", "By Velocity"])
-        self.color_mode.currentTextChanged.connect(
-            lambda t: self.option_changed.emit("color_mode", t)
-        )
+        self.color_mode.currentTextChanged.connect(self._on_color_mode)
         layout.addRow("Orbit Colors", self.color_mode)
 
         self.setLayout(layout)
 
+    def _on_toggle(self, checked: bool) -> None:
+        """Shared slot for every toggle; the sender carries its option key."""
+        self.option_changed.emit(self.sender().property("option_key"), checked)
+
+    def _on_color_mode(self, text: str) -> None:
+        self.option_changed.emit("color_mode", text)
+
     def get_option(self, key: str) -> bool:
         """Get current state of a toggle option."""
         if key in self._toggles:
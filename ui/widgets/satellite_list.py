@@ -2,22 +2,170 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Iterable
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QVBoxLayout,
 )
 
+# Qt enum values used per row, looked up once
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_ITEM_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable
+    | Qt.ItemFlag.ItemIsEnabled
+    | Qt.ItemFlag.ItemIsUserCheckable
+)
+
+# Item data roles
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_ROLE = Qt.ItemDataRole.CheckStateRole
+_ID_ROLE = Qt.ItemDataRole.UserRole
+_NAME_ROLE = Qt.ItemDataRole.UserRole + 1
+_CATEGORY_ROLE = Qt.ItemDataRole.UserRole + 2
+_FILTER_ROLE = Qt.ItemDataRole.UserRole + 3
+
+
+class _SatListModel(QAbstractListModel):
+    """Checkable satellite rows stored as parallel lists.
+
+    Display and filter strings are built once when a row is added; check
+    states live in a bytearray.
+    """
+
+    check_changed = pyqtSignal(str, bool)  # (sat_id, checked)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._categories: list[str] = []
+        self._labels: list[str] = []
+        # "name\ncategory": one fixed-string match covers both fields, and
+        # a search typed into a line edit can never span the newline
+        self._filter_keys: list[str] = []
+        self._checked = bytearray()
+        self._rows: dict[str, int] = {}
+
+    def append(self, entries: list[tuple[str, str, str]]) -> None:
+        """Append (sat_id, name, category) rows in one insert."""
+        if not entries:
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for row, (sat_id, name, category) in enumerate(entries, first):
+            self._ids.append(sat_id)
+            self._names.append(name)
+            self._categories.append(category)
+            self._labels.append(f"[{category}] {name}" if category else name)
+            self._filter_keys.append(f"{name}\n{category}")
+            self._rows[sat_id] = row
+        self._checked.extend(b"\x01" * len(entries))
+        self.endInsertRows()
+
+    def remove(self, sat_ids: set[str]) -> None:
+        """Remove rows by id, then reindex once.
+
+        Adjacent rows go out as one removal range, highest range first, so
+        unloading a contiguous block costs the views a single update.
+        """
+        rows = sorted(self._rows[i] for i in sat_ids)
+        ranges: list[list[int]] = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            stop = last + 1
+            del self._ids[first:stop]
+            del self._names[first:stop]
+            del self._categories[first:stop]
+            del self._labels[first:stop]
+            del self._filter_keys[first:stop]
+            del self._checked[first:stop]
+            self.endRemoveRows()
+        self._rows = {sat_id: row for row, sat_id in enumerate(self._ids)}
+
+    def row_of(self, sat_id: str) -> int:
+        return self._rows.get(sat_id, -1)
+
+    def set_checked(self, row: int, checked: bool) -> None:
+        if bool(self._checked[row]) == checked:
+            return
+        self._checked[row] = checked
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [_CHECK_ROLE])
+        self.check_changed.emit(self._ids[row], checked)
+
+    def set_rows_checked(self, rows: Iterable[int], checked: bool) -> list[str]:
+        """Set many check states with one dataChanged and no check_changed.
+
+        Returns the ids whose state actually changed.
+        """
+        state = self._checked
+        ids = self._ids
+        changed = [row for row in rows if bool(state[row]) != checked]
+        if not changed:
+            return []
+        for row in changed:
+            state[row] = checked
+        self.dataChanged.emit(
+            self.index(min(changed)), self.index(max(changed)), [_CHECK_ROLE]
+        )
+        return [ids[row] for row in changed]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        row = index.row()
+        if role == _DISPLAY_ROLE:
+            return self._labels[row]
+        if role == _CHECK_ROLE:
+            return _CHECKED if self._checked[row] else _UNCHECKED
+        if role == _ID_ROLE:
+            return self._ids[row]
+        if role == _FILTER_ROLE:
+            return self._filter_keys[row]
+        if role == _NAME_ROLE:
+            return self._names[row]
+        if role == _CATEGORY_ROLE:
+            return self._categories[row]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != _CHECK_ROLE:
+            return False
+        self.set_checked(index.row(), Qt.CheckState(value) == _CHECKED)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return _ITEM_FLAGS
+
 
 class SatelliteListWidget(QGroupBox):
     """Scrollable satellite list with checkboxes and search/filter."""
 
+    # Quiet period after the last keystroke before the filter is applied
+    FILTER_DEBOUNCE_MS = 120
+
     satellite_toggled = pyqtSignal(str, bool)  # (sat_id, visible)
+    satellites_bulk_toggled = pyqtSignal(list, bool)  # (sat_ids, visible)
     satellite_selected = pyqtSignal(str)  # sat_id
     satellite_double_clicked = pyqtSignal(str)  # sat_id (focus camera)
 
@@ -31,17 +179,37 @@ class SatelliteListWidget(QGroupBox):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Filter satellites...")
         self.search_input.setClearButtonEnabled(True)
-        self.search_input.textChanged.connect(self._filter)
+        self.search_input.textChanged.connect(self._schedule_filter)
         layout.addWidget(self.search_input)
 
-        # Satellite list
-        self.list_widget = QListWidget()
-        self.list_widget.setMinimumHeight(150)
-        self.list_widget.setMaximumHeight(300)
-        self.list_widget.currentItemChanged.connect(self._on_selection_changed)
-        self.list_widget.itemChanged.connect(self._on_item_checked)
-        self.list_widget.itemDoubleClicked.connect(self._on_double_click)
-        layout.addWidget(self.list_widget)
+        # Typing restarts the timer, so only the final text is filtered
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
+        # Satellite list: rows live in the model, filtering runs in the proxy
+        self._model = _SatListModel(self)
+        self._model.check_changed.connect(self.satellite_toggled)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setFilterRole(_FILTER_ROLE)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        # Set while the current row is changed programmatically
+        self._suppress_selected = False
+
+        self.list_view = QListView()
+        self.list_view.setModel(self._proxy)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMinimumHeight(150)
+        self.list_view.setMaximumHeight(300)
+        self.list_view.selectionModel().currentChanged.connect(
+            self._on_selection_changed
+        )
+        self.list_view.doubleClicked.connect(self._on_double_click)
+        layout.addWidget(self.list_view)
 
         # Quick actions
         btn_row = QHBoxLayout()
@@ -60,95 +228,89 @@ class SatelliteListWidget(QGroupBox):
         layout.addLayout(btn_row)
         self.setLayout(layout)
 
-        self._sat_items: dict[str, QListWidgetItem] = {}
-
     def add_satellite(
         self, sat_id: str, name: str, category: str = ""
     ) -> None:
         """Add a satellite to the list."""
-        display_text = name
-        if category:
-            display_text = f"[{category}] {name}"
+        self._model.append([(sat_id, name, category)])
 
-        item = QListWidgetItem(display_text)
-        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        item.setCheckState(Qt.CheckState.Checked)
-        item.setData(Qt.ItemDataRole.UserRole, sat_id)
-        item.setData(Qt.ItemDataRole.UserRole + 1, name)
-        item.setData(Qt.ItemDataRole.UserRole + 2, category)
-
-        self.list_widget.addItem(item)
-        self._sat_items[sat_id] = item
+    def add_satellites_bulk(self, entries: list[tuple[str, str]]) -> None:
+        """Add many (sat_id, name) rows in a single model insert."""
+        self._model.append([(sat_id, name, "") for sat_id, name in entries])
 
     def remove_satellite(self, sat_id: str) -> None:
         """Remove a satellite from the list."""
-        if sat_id in self._sat_items:
-            item = self._sat_items[sat_id]
-            row = self.list_widget.row(item)
-            self.list_widget.takeItem(row)
-            del self._sat_items[sat_id]
+        self.remove_satellites((sat_id,))
+
+    def remove_satellites(self, sat_ids: Iterable[str]) -> None:
+        """Remove many satellites, reindexing the model once."""
+        doomed = {sat_id for sat_id in sat_ids if self._model.row_of(sat_id) >= 0}
+        if doomed:
+            self._model.remove(doomed)
 
     def highlight_satellite(self, sat_id: str) -> None:
         """Programmatically select a satellite in the list."""
-        if sat_id in self._sat_items:
-            item = self._sat_items[sat_id]
-            self.list_widget.blockSignals(True)
-            self.list_widget.setCurrentItem(item)
-            self.list_widget.blockSignals(False)
+        row = self._model.row_of(sat_id)
+        if row < 0:
+            return
+        index = self._proxy.mapFromSource(self._model.index(row))
+        if not index.isValid():
+            return
+        self._suppress_selected = True
+        try:
+            self.list_view.setCurrentIndex(index)
+        finally:
+            self._suppress_selected = False
 
     def get_selected_id(self) -> str | None:
         """Get the currently selected satellite ID."""
-        item = self.list_widget.currentItem()
-        if item:
-            return item.data(Qt.ItemDataRole.UserRole)
+        index = self.list_view.currentIndex()
+        if index.isValid():
+            return index.data(_ID_ROLE)
         return None
 
-    def _filter(self, text: str) -> None:
-        """Filter satellites by search text."""
-        text_lower = text.lower()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            name = item.data(Qt.ItemDataRole.UserRole + 1) or ""
-            category = item.data(Qt.ItemDataRole.UserRole + 2) or ""
-            visible = (
-                text_lower in name.lower()
-                or text_lower in category.lower()
-                or not text
-            )
-            item.setHidden(not visible)
+    def _schedule_filter(self, text: str) -> None:
+        """Remember the latest search text and (re)start the debounce timer."""
+        self._pending_filter = text
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self._proxy.setFilterFixedString(self._pending_filter)
 
     def _on_selection_changed(
-        self, current: QListWidgetItem, previous: QListWidgetItem
+        self, current: QModelIndex, previous: QModelIndex
     ) -> None:
         """Handle satellite selection change."""
-        if current:
-            sat_id = current.data(Qt.ItemDataRole.UserRole)
+        if current.isValid() and not self._suppress_selected:
+            sat_id = current.data(_ID_ROLE)
             if sat_id:
                 self.satellite_selected.emit(sat_id)
 
-    def _on_item_checked(self, item: QListWidgetItem) -> None:
-        """Handle checkbox toggle."""
-        sat_id = item.data(Qt.ItemDataRole.UserRole)
-        checked = item.checkState() == Qt.CheckState.Checked
-        if sat_id:
-            self.satellite_toggled.emit(sat_id, checked)
-
-    def _on_double_click(self, item: QListWidgetItem) -> None:
+    def _on_double_click(self, index: QModelIndex) -> None:
         """Handle double-click to focus camera."""
-        sat_id = item.data(Qt.ItemDataRole.UserRole)
+        sat_id = index.data(_ID_ROLE)
         if sat_id:
             self.satellite_double_clicked.emit(sat_id)
 
+    def _set_visible_checked(self, checked: bool) -> None:
+        """Check or uncheck every row passing the filter, as one batch."""
+        proxy = self._proxy
+        if proxy.filterRegularExpression().pattern():
+            rows = [
+                proxy.mapToSource(proxy.index(i, 0)).row()
+                for i in range(proxy.rowCount())
+            ]
+        else:
+            # No filter: every source row is visible, skip the mapping
+            rows = range(self._model.rowCount())
+        sat_ids = self._model.set_rows_checked(rows, checked)
+        if sat_ids:
+            self.satellites_bulk_toggled.emit(sat_ids, checked)
+
     def _select_all(self) -> None:
         """Check all visible satellites."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if not item.isHidden():
-                item.setCheckState(Qt.CheckState.Checked)
+        self._set_visible_checked(True)
 
     def _select_none(self) -> None:
         """Uncheck all visible satellites."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if not item.isHidden():
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self._set_visible_checked(False)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -22,11 +23,16 @@ class TimeControlsWidget(QGroupBox):
     warp_changed = pyqtSignal(float)  # warp factor
     time_jumped = pyqtSignal(object)  # datetime to jump to
 
-    WARP_STEPS = [1, 2, 5, 10, 50, 100, 500, 1000, 5000, 10000]
+    WARP_STEPS = (1, 2, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+    # Per-step label text and factor, built once rather than per slider tick
+    WARP_LABELS = tuple(f"{step}x" for step in WARP_STEPS)
+    WARP_FACTORS = tuple(float(step) for step in WARP_STEPS)
 
     def __init__(self, parent=None):
         super().__init__("TIME CONTROLS", parent)
         self._is_playing = False
+        # (second, minute, hour, day ordinal) currently in time_display
+        self._shown_time: Optional[tuple[int, int, int, int]] = None
 
         layout = QVBoxLayout()
         layout.setSpacing(8)
@@ -87,11 +93,25 @@ class TimeControlsWidget(QGroupBox):
         self.setLayout(layout)
 
     def update_time_display(self, sim_time: datetime) -> None:
-        """Update the displayed simulation time."""
-        if sim_time.tzinfo is None:
-            sim_time = sim_time.replace(tzinfo=timezone.utc)
+        """Update the displayed simulation time (a UTC datetime, aware or naive).
+
+        Formatted straight from the fields; skipped while the displayed
+        second is unchanged.
+        """
+        shown = (sim_time.second, sim_time.minute, sim_time.hour, sim_time.toordinal())
+        if shown == self._shown_time:
+            return
+        self._shown_time = shown
         self.time_display.setText(
-            sim_time.strftime("%Y/%m/%d %H:%M:%S UTC")
+            "%04d/%02d/%02d %02d:%02d:%02d UTC"
+            % (
+                sim_time.year,
+                sim_time.month,
+                sim_time.day,
+                sim_time.hour,
+                sim_time.minute,
+                sim_time.second,
+            )
         )
 
     def set_playing(self, playing: bool) -> None:
@@ -105,9 +125,8 @@ class TimeControlsWidget(QGroupBox):
         self.play_toggled.emit(self._is_playing)
 
     def _on_warp_change(self, index: int) -> None:
-        factor = self.WARP_STEPS[index]
-        self.warp_label.setText(f"{factor}x")
-        self.warp_changed.emit(float(factor))
+        self.warp_label.setText(self.WARP_LABELS[index])
+        self.warp_changed.emit(self.WARP_FACTORS[index])
 
     def _jump_to_now(self) -> None:
         now = datetime.now(timezone.utc)
@@ -115,4 +134,4 @@ class TimeControlsWidget(QGroupBox):
 
     @property
     def current_warp(self) -> float:
-        return float(self.WARP_STEPS[self.warp_slider.value()])
+        return self.WARP_FACTORS[self.warp_slider.value()]
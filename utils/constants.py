@@ -5,6 +5,8 @@ WGS84 ellipsoid parameters are used for Earth shape modeling.
 """
 
 import math
+from collections.abc import Mapping
+from types import MappingProxyType
 
 # --- Earth Gravitational Parameters ---
 MU_EARTH: float = 398600.4418  # km^3/s^2
@@ -52,20 +54,33 @@ NASA_BLUE_MARBLE_URL: str = (
 )
 
 # --- Curated Satellite Groups ---
-CELESTRAK_GROUPS: dict[str, str] = {
-    "ISS & Crew Dragon": "stations",
-    "GPS Constellation": "gps-ops",
-    "Starlink": "starlink",
-    "Weather Satellites": "weather",
-    "Science & Hubble": "science",
-    "Geostationary": "geo",
-}
+# (display name, Celestrak group key) pairs, in menu order
+CELESTRAK_GROUPS_ITEMS: tuple[tuple[str, str], ...] = (
+    ("ISS & Crew Dragon", "stations"),
+    ("GPS Constellation", "gps-ops"),
+    ("Starlink", "starlink"),
+    ("Weather Satellites", "weather"),
+    ("Science & Hubble", "science"),
+    ("Geostationary", "geo"),
+)
+# Read-only display name -> group key view
+CELESTRAK_GROUPS: Mapping[str, str] = MappingProxyType(dict(CELESTRAK_GROUPS_ITEMS))
 
 # --- Visualization Constants ---
 EARTH_RENDER_RADIUS: float = 1.0
 SATELLITE_MARKER_RADIUS: float = 0.015
 SATELLITE_HIGHLIGHT_RADIUS: float = 0.025
 VELOCITY_VECTOR_SCALE: float = 0.1
+# Sphere tessellation (theta = phi resolution); the Earth's is picked per
+# window size from these (max window side in px, resolution) tiers
+EARTH_SPHERE_RES: int = 48
+EARTH_SPHERE_RES_TIERS: tuple[tuple[int, int], ...] = (
+    (800, 32),
+    (1600, 48),
+    (2560, 64),
+)
+EARTH_SPHERE_RES_MAX: int = 96
+SATELLITE_MARKER_RES: int = 8
 
 # --- UI Color Palette ---
 ACCENT_COLOR: str = "#2563EB"
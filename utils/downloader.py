@@ -6,16 +6,28 @@ atomic file writes, and caching support.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import re
 import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from email.utils import formatdate
 from enum import Enum, auto
 from pathlib import Path
 from typing import Callable, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 from utils.constants import CELESTRAK_BASE_URL, CELESTRAK_GROUPS, NASA_BLUE_MARBLE_URL
 
@@ -23,6 +35,30 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[int, int], None]  # (bytes_downloaded, total_bytes)
 
+# Read size for streamed downloads (fewer Python iterations and write calls)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Characters not allowed in cache file names derived from user queries
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+# Large files are fetched as parallel byte ranges when the server allows it
+RANGE_DOWNLOAD_PARTS = 8
+RANGE_DOWNLOAD_MIN_BYTES = 8 * 1024 * 1024
+
+# With requests_cache installed, Celestrak responses are cached on disk for
+# this long (Celestrak refreshes a few times a day); other hosts never are
+HTTP_CACHE_EXPIRE_SECONDS = 2 * 3600
+HTTP_CACHE_NAME = "celestrak_http"
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Best-effort page-cache hint; a no-op where posix_fadvise is missing."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
 
 class DownloadStatus(Enum):
     PENDING = auto()
@@ -50,13 +86,44 @@ class Downloader:
 
     def _get_session(self) -> requests.Session:
         """Lazy-init a requests.Session (reuses TCP connections)."""
-        if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update({
-                "User-Agent": "OrbitalPropagator/1.0"
-            })
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
         return self._session
 
+    def _create_session(self) -> requests.Session:
+        if requests_cache is not None:
+            self._data_dir.mkdir(parents=True, exist_ok=True)
+            session = requests_cache.CachedSession(
+                cache_name=str(self._data_dir / HTTP_CACHE_NAME),
+                backend="sqlite",
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after={
+                    urlsplit(CELESTRAK_BASE_URL).netloc: HTTP_CACHE_EXPIRE_SECONDS,
+                },
+                # Serve the last response when offline or Celestrak errors
+                stale_if_error=True,
+            )
+        else:
+            session = requests.Session()
+        session.headers.update({
+            "User-Agent": "OrbitalPropagator/1.0"
+        })
+        # Keep TLS connections to Celestrak warm across parallel fetches
+        # and retry transient gateway errors with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def download_tle_group(
         self,
         group_key: str,
@@ -68,7 +135,26 @@ class Downloader:
         url = f"{CELESTRAK_BASE_URL}?GROUP={celestrak_key}&FORMAT=tle"
         dest = self._data_dir / "tle_cache" / f"{celestrak_key}.tle"
         dest.parent.mkdir(parents=True, exist_ok=True)
-        return self._download_file(url, dest, progress, timeout)
+        return self._download_file(url, dest, progress, timeout, conditional=True)
+
+    def download_tle_groups(
+        self,
+        group_keys: list[str],
+        timeout: float = 30.0,
+        max_workers: int = 8,
+    ) -> dict[str, DownloadResult]:
+        """Fetch several TLE groups concurrently over the shared session.
+
+        Returns a mapping of each requested key to its DownloadResult.
+        """
+        if not group_keys:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(group_keys))) as executor:
+            futures = {
+                key: executor.submit(self.download_tle_group, key, None, timeout)
+                for key in group_keys
+            }
+            return {key: future.result() for key, future in futures.items()}
 
     def download_tle_by_name(
         self,
@@ -78,10 +164,10 @@ class Downloader:
     ) -> DownloadResult:
         """Fetch TLE for a single satellite by name."""
         url = f"{CELESTRAK_BASE_URL}?NAME={name}&FORMAT=tle"
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = _UNSAFE_NAME_RE.sub("_", name)
         dest = self._data_dir / "tle_cache" / f"name_{safe_name}.tle"
         dest.parent.mkdir(parents=True, exist_ok=True)
-        return self._download_file(url, dest, progress, timeout)
+        return self._download_file(url, dest, progress, timeout, conditional=True)
 
     def download_tle_by_norad_id(
         self,
@@ -93,7 +179,7 @@ class Downloader:
         url = f"{CELESTRAK_BASE_URL}?CATNR={norad_id}&FORMAT=tle"
         dest = self._data_dir / "tle_cache" / f"norad_{norad_id}.tle"
         dest.parent.mkdir(parents=True, exist_ok=True)
-        return self._download_file(url, dest, progress, timeout)
+        return self._download_file(url, dest, progress, timeout, conditional=True)
 
     def download_earth_texture(
         self,
@@ -110,26 +196,203 @@ class Downloader:
                 bytes_downloaded=dest.stat().st_size,
             )
         dest.parent.mkdir(parents=True, exist_ok=True)
+        result = self._download_ranged(NASA_BLUE_MARBLE_URL, dest, progress, timeout)
+        if result is not None:
+            return result
         return self._download_file(NASA_BLUE_MARBLE_URL, dest, progress, timeout)
 
+    @staticmethod
+    def _validators_path(dest: Path) -> Path:
+        return dest.with_suffix(dest.suffix + ".meta.json")
+
+    def _conditional_headers(self, dest: Path) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached file.
+
+        Without saved validators, the cached file's mtime stands in for
+        Last-Modified.
+        """
+        try:
+            mtime = dest.stat().st_mtime
+        except OSError:
+            return {}
+
+        meta_path = self._validators_path(dest)
+        meta = {}
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError) as e:
+                logger.debug("Ignoring unreadable validators %s: %s", meta_path, e)
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        headers["If-Modified-Since"] = meta.get("last_modified") or formatdate(
+            mtime, usegmt=True
+        )
+        return headers
+
+    def _save_validators(self, dest: Path, response: requests.Response) -> None:
+        """Persist the response's ETag/Last-Modified next to the cached file."""
+        meta_path = self._validators_path(dest)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        try:
+            if etag or last_modified:
+                meta_path.write_text(json.dumps({
+                    "etag": etag,
+                    "last_modified": last_modified,
+                }))
+            elif meta_path.exists():
+                meta_path.unlink()
+        except OSError as e:
+            logger.warning("Failed to write validators for %s: %s", dest, e)
+
+    def _download_ranged(
+        self,
+        url: str,
+        dest: Path,
+        progress: Optional[ProgressCallback],
+        timeout: float,
+        parts: int = RANGE_DOWNLOAD_PARTS,
+    ) -> Optional[DownloadResult]:
+        """Download a large file as parallel HTTP Range requests.
+
+        Returns None when the server does not advertise byte ranges, the
+        file is too small to benefit, or any part fails, so the caller can
+        fall back to a single streamed download.
+        """
+        session = self._get_session()
+        try:
+            head = session.head(url, allow_redirects=True, timeout=timeout)
+            head.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.debug("HEAD failed for %s, using single stream: %s", url, e)
+            return None
+
+        total = int(head.headers.get("content-length", 0))
+        if (
+            head.headers.get("Accept-Ranges", "").lower() != "bytes"
+            or total < RANGE_DOWNLOAD_MIN_BYTES
+        ):
+            return None
+
+        logger.info("Downloading %s -> %s in %d ranges", url, dest, parts)
+        part_size = -(-total // parts)
+        ranges = [
+            (start, min(start + part_size, total) - 1)
+            for start in range(0, total, part_size)
+        ]
+        progress_lock = threading.Lock()
+        downloaded = 0  # bytes received across all parts
+
+        fd, tmp_path = tempfile.mkstemp(dir=str(dest.parent), suffix=".tmp")
+
+        def fetch_range(first: int, last: int) -> None:
+            nonlocal downloaded
+            headers = {"Range": f"bytes={first}-{last}"}
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise requests.exceptions.HTTPError(
+                        f"Range request not honoured (HTTP {response.status_code})"
+                    )
+                # Range offsets count bytes as sent, so read them undecoded
+                # (iter_content would undo any Content-Encoding). Each worker
+                # writes its own region through a private handle and must
+                # fill it exactly: the file is pre-sized, so a short part
+                # would otherwise leave a hole of zeros.
+                expected = last - first + 1
+                written = 0
+                with open(tmp_path, "r+b") as f:
+                    f.seek(first)
+                    for chunk in response.raw.stream(
+                        DOWNLOAD_CHUNK_SIZE, decode_content=False
+                    ):
+                        if written + len(chunk) > expected:
+                            raise IOError(
+                                f"Range {first}-{last} sent more than {expected} bytes"
+                            )
+                        f.write(chunk)
+                        written += len(chunk)
+                        with progress_lock:
+                            downloaded += len(chunk)
+                            if progress:
+                                progress(downloaded, total)
+                if written != expected:
+                    raise IOError(
+                        f"Range {first}-{last} ended after {written} of {expected} bytes"
+                    )
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.truncate(total)
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range, a, b) for a, b in ranges]
+                for future in futures:
+                    future.result()
+
+            if downloaded != total or os.path.getsize(tmp_path) != total:
+                raise IOError(
+                    f"Joined ranges hold {downloaded} bytes, expected {total}"
+                )
+
+            with open(tmp_path, "r+b") as f:
+                os.fsync(f.fileno())
+                _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+            os.replace(tmp_path, dest)
+
+        except Exception as e:
+            logger.warning("Ranged download of %s failed, retrying as one stream: %s", url, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+
+        logger.info("Download complete: %s (%d bytes)", dest, total)
+        return DownloadResult(
+            status=DownloadStatus.COMPLETE,
+            path=dest,
+            bytes_downloaded=total,
+        )
+
     def _download_file(
         self,
         url: str,
         dest: Path,
         progress: Optional[ProgressCallback],
         timeout: float,
+        conditional: bool = False,
     ) -> DownloadResult:
-        """Core download logic with streaming and progress reporting."""
+        """Core download logic with streaming and progress reporting.
+
+        With ``conditional``, the ETag/Last-Modified validators saved from
+        the previous download are sent, and a 304 reuses the cached file.
+        """
         logger.info("Downloading %s -> %s", url, dest)
         try:
             session = self._get_session()
-            response = session.get(url, stream=True, timeout=timeout)
+            headers = self._conditional_headers(dest) if conditional else {}
+            response = session.get(url, stream=True, timeout=timeout, headers=headers)
             response.raise_for_status()
 
+            if response.status_code == 304:
+                response.close()
+                logger.info("Not modified, using cached %s", dest)
+                return DownloadResult(
+                    status=DownloadStatus.COMPLETE,
+                    path=dest,
+                    bytes_downloaded=dest.stat().st_size,
+                )
+
             # Check for Celestrak error responses
             content_type = response.headers.get("Content-Type", "")
+            body: Optional[bytes] = None
             if "text/html" in content_type and "FORMAT=tle" in url:
                 # Celestrak returns HTML on errors (e.g., no results)
+                body = response.content
                 text = response.text.strip()
                 if not text or "<html" in text.lower():
                     return DownloadResult(
@@ -145,20 +408,37 @@ class Downloader:
                 dir=str(dest.parent), suffix=".tmp"
             )
             try:
+                _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
                 with os.fdopen(fd, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
+                    if body is not None:
+                        # Already read while checking for an error page
+                        f.write(body)
+                        downloaded = len(body)
+                        if progress:
+                            progress(downloaded, total)
+                    else:
+                        # Read the urllib3 stream directly in large blocks;
+                        # decompression still happens inside urllib3.
+                        response.raw.decode_content = True
+                        while True:
+                            chunk = response.raw.read(DOWNLOAD_CHUNK_SIZE)
+                            if not chunk:
+                                break
                             f.write(chunk)
                             downloaded += len(chunk)
                             if progress:
                                 progress(downloaded, total)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # The file is read once later; drop the written pages
+                    # now that they are on disk instead of pinning cache.
+                    _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+                # Atomic rename (replaces any existing file in one step)
+                os.replace(tmp_path, dest)
 
-                # Atomic rename
-                with self._lock:
-                    tmp = Path(tmp_path)
-                    if dest.exists():
-                        dest.unlink()
-                    tmp.rename(dest)
+                if conditional:
+                    self._save_validators(dest, response)
 
             except Exception:
                 # Clean up temp file on failure
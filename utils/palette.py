@@ -0,0 +1,43 @@
+"""Shared QColor instances for the UI color palette.
+
+Each color is parsed from its hex string in utils.constants once, at
+import. This module needs PyQt6; import it from Qt code paths only.
+"""
+
+from __future__ import annotations
+
+from PyQt6.QtGui import QColor
+
+from utils.constants import (
+    ACCENT_COLOR,
+    ACCENT_HOVER,
+    BG_PRIMARY,
+    BG_SECONDARY,
+    BG_TERTIARY,
+    BORDER_LIGHT,
+    BORDER_MEDIUM,
+    SPACE_BACKGROUND,
+    STATUS_ERROR,
+    STATUS_INFO,
+    STATUS_SUCCESS,
+    STATUS_WARNING,
+    TEXT_PRIMARY,
+    TEXT_SECONDARY,
+    TEXT_TERTIARY,
+)
+
+ACCENT_COLOR_Q = QColor(ACCENT_COLOR)
+ACCENT_HOVER_Q = QColor(ACCENT_HOVER)
+BG_PRIMARY_Q = QColor(BG_PRIMARY)
+BG_SECONDARY_Q = QColor(BG_SECONDARY)
+BG_TERTIARY_Q = QColor(BG_TERTIARY)
+TEXT_PRIMARY_Q = QColor(TEXT_PRIMARY)
+TEXT_SECONDARY_Q = QColor(TEXT_SECONDARY)
+TEXT_TERTIARY_Q = QColor(TEXT_TERTIARY)
+BORDER_LIGHT_Q = QColor(BORDER_LIGHT)
+BORDER_MEDIUM_Q = QColor(BORDER_MEDIUM)
+SPACE_BACKGROUND_Q = QColor(SPACE_BACKGROUND)
+STATUS_SUCCESS_Q = QColor(STATUS_SUCCESS)
+STATUS_WARNING_Q = QColor(STATUS_WARNING)
+STATUS_ERROR_Q = QColor(STATUS_ERROR)
+STATUS_INFO_Q = QColor(STATUS_INFO)
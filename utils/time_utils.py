@@ -21,6 +21,10 @@ from utils.constants import (
     TWO_PI,
 )
 
+# Julian Date of 1970-01-01T00:00:00 UTC
+UNIX_EPOCH_JD: float = 2440587.5
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 @dataclass(frozen=True, slots=True)
 class JulianDate:
@@ -49,43 +53,35 @@ def datetime_to_jd(dt: datetime) -> JulianDate:
     return JulianDate(jd=jd_val, fr=fr_val)
 
 
+def unix_to_jd(epoch_s: float) -> JulianDate:
+    """Convert a POSIX timestamp (UTC seconds) to split Julian Date.
+
+    Plain float arithmetic, for hot paths that keep time as a timestamp
+    rather than a datetime. The split matches jday: jd is the preceding
+    midnight (x.5) and fr the fraction of the day.
+    """
+    days, seconds = divmod(epoch_s, SECONDS_PER_DAY)
+    return JulianDate(jd=UNIX_EPOCH_JD + days, fr=seconds / SECONDS_PER_DAY)
+
+
 def jd_to_datetime(jd: JulianDate) -> datetime:
     """Convert split Julian Date back to Python datetime (UTC)."""
-    total_jd = jd.full
-    # Julian Date to calendar date algorithm
-    z = int(total_jd + 0.5)
-    f = (total_jd + 0.5) - z
+    # Offset from the Unix epoch; the integer part is subtracted first so
+    # the fractional day keeps its full precision.
+    days = (jd.jd - UNIX_EPOCH_JD) + jd.fr
+    return _UNIX_EPOCH + timedelta(days=days)
 
-    if z < 2299161:
-        a = z
-    else:
-        alpha = int((z - 1867216.25) / 36524.25)
-        a = z + 1 + alpha - int(alpha / 4)
-
-    b = a + 1524
-    c = int((b - 122.1) / 365.25)
-    d = int(365.25 * c)
-    e = int((b - d) / 30.6001)
-
-    day_frac = b - d - int(30.6001 * e) + f
-    day = int(day_frac)
-    frac = day_frac - day
-
-    month = e - 1 if e < 14 else e - 13
-    year = c - 4716 if month > 2 else c - 4715
-
-    hours_frac = frac * 24.0
-    hour = int(hours_frac)
-    mins_frac = (hours_frac - hour) * 60.0
-    minute = int(mins_frac)
-    secs_frac = (mins_frac - minute) * 60.0
-    second = int(secs_frac)
-    microsecond = int((secs_frac - second) * 1e6)
-
-    return datetime(
-        year, month, day, hour, minute, second, microsecond,
-        tzinfo=timezone.utc,
-    )
+
+def jd_to_datetime_batch(
+    jd_array: np.ndarray, fr_array: np.ndarray
+) -> np.ndarray:
+    """Vectorized split Julian Date -> UTC ``datetime64[us]`` array.
+
+    Array counterpart of jd_to_datetime, rounded to the nearest microsecond.
+    """
+    days = (np.asarray(jd_array, dtype=np.float64) - UNIX_EPOCH_JD) + fr_array
+    micros = np.rint(days * (SECONDS_PER_DAY * 1e6)).astype(np.int64)
+    return micros.astype("datetime64[us]")
 
 
 def datetime_to_gmst(dt: datetime) -> float:
@@ -93,21 +89,37 @@ def datetime_to_gmst(dt: datetime) -> float:
 
     Uses the IAU 1982 GMST model for consistency with SGP4 TEME frame.
     """
-    jd = datetime_to_jd(dt)
+    return jd_to_gmst(datetime_to_jd(dt))
+
+
+def jd_to_gmst(jd: JulianDate) -> float:
+    """Compute GMST in radians from a split Julian Date."""
     return _gmst_from_jd(jd.jd, jd.fr)
 
 
 def _gmst_from_jd(jd_val: float, fr_val: float) -> float:
     """Compute GMST from Julian Date components (radians)."""
     t_ut1 = (jd_val + fr_val - 2451545.0) / 36525.0
-    gmst_sec = (
-        67310.54841
-        + (876600.0 * 3600.0 + 8640184.812866) * t_ut1
-        + 0.093104 * t_ut1 ** 2
-        - 6.2e-6 * t_ut1 ** 3
-    )
-    gmst_rad = (gmst_sec % SECONDS_PER_DAY) / SECONDS_PER_DAY * TWO_PI
-    return gmst_rad % TWO_PI
+    return _gmst_from_centuries(t_ut1)
+
+
+def _gmst_from_centuries(t_ut1):
+    """IAU 1982 GMST (radians) from Julian centuries since J2000.
+
+    Works on a float or an ndarray. The cubic is evaluated in Horner form
+    with augmented assignments, so an array input costs one buffer that
+    is updated in place rather than a temporary per term.
+    """
+    gmst = -6.2e-6 * t_ut1
+    gmst += 0.093104
+    gmst *= t_ut1
+    gmst += 876600.0 * 3600.0 + 8640184.812866
+    gmst *= t_ut1
+    gmst += 67310.54841
+    gmst %= SECONDS_PER_DAY
+    gmst *= TWO_PI / SECONDS_PER_DAY
+    gmst %= TWO_PI
+    return gmst
 
 
 def tle_epoch_to_datetime(epoch_year: int, epoch_day: float) -> datetime:
@@ -136,16 +148,35 @@ def generate_time_steps(
     total_seconds = (end - start).total_seconds()
     n_steps = max(1, int(total_seconds / step_seconds) + 1)
 
-    offsets_days = np.linspace(0, total_seconds / SECONDS_PER_DAY, n_steps)
-    jd_arr = np.full(n_steps, start_jd.jd, dtype=np.float64)
-    fr_arr = start_jd.fr + offsets_days
+    fr_arr = np.linspace(0, total_seconds / SECONDS_PER_DAY, n_steps)
+    fr_arr += start_jd.fr
+
+    # Carry whole days from fr into jd (no mask or branch needed). Works
+    # across any number of day boundaries; floor + subtract measured ~3x
+    # faster than np.divmod(fr_arr, 1.0) here.
+    jd_arr = np.floor(fr_arr)
+    fr_arr -= jd_arr
+    jd_arr += start_jd.jd
 
-    # Handle fractional overflow past 1.0
-    overflow = fr_arr >= 1.0
-    if np.any(overflow):
-        floor_vals = np.floor(fr_arr[overflow])
-        jd_arr[overflow] += floor_vals
-        fr_arr[overflow] -= floor_vals
+    return jd_arr, fr_arr
+
+
+def offset_time_grid(
+    start: datetime, offsets_seconds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split Julian Date arrays for ``start`` plus each offset in seconds.
+
+    Vectorized replacement for calling datetime_to_jd on
+    ``start + timedelta(seconds=offset)`` in a loop.
+    """
+    start_jd = datetime_to_jd(start)
+    fr_arr = np.asarray(offsets_seconds, dtype=np.float64) / SECONDS_PER_DAY
+    fr_arr += start_jd.fr
+
+    # Carry whole days from fr into jd, as generate_time_steps
+    jd_arr = np.floor(fr_arr)
+    fr_arr -= jd_arr
+    jd_arr += start_jd.jd
 
     return jd_arr, fr_arr
 
@@ -159,14 +190,7 @@ def compute_gmst_batch(
     Returns array of GMST values in radians.
     """
     t_ut1 = (jd_array + fr_array - 2451545.0) / 36525.0
-    gmst_sec = (
-        67310.54841
-        + (876600.0 * 3600.0 + 8640184.812866) * t_ut1
-        + 0.093104 * t_ut1 ** 2
-        - 6.2e-6 * t_ut1 ** 3
-    )
-    gmst_rad = (gmst_sec % SECONDS_PER_DAY) / SECONDS_PER_DAY * TWO_PI
-    return gmst_rad % TWO_PI
+    return _gmst_from_centuries(t_ut1)
 
 
 def sun_position_eci(dt: datetime) -> np.ndarray:
@@ -175,7 +199,11 @@ def sun_position_eci(dt: datetime) -> np.ndarray:
     Uses simplified solar position model accurate to ~1 degree,
     sufficient for umbra/penumbra shadow detection.
     """
-    jd = datetime_to_jd(dt)
+    return sun_position_eci_jd(datetime_to_jd(dt))
+
+
+def sun_position_eci_jd(jd: JulianDate) -> np.ndarray:
+    """sun_position_eci for a split Julian Date."""
     t = (jd.full - 2451545.0) / 36525.0
 
     # Mean longitude of Sun (degrees)
@@ -212,7 +240,26 @@ def sun_position_eci_batch(
     typically sufficient. This function is provided for longer ranges.
     """
     t = (jd_array + fr_array - 2451545.0) / 36525.0
+    return _sun_position_from_centuries(t)
+
+
+def gmst_and_sun_position_batch(
+    jd_array: np.ndarray, fr_array: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """GMST (radians) and Sun ECI position (km) for the same epochs.
+
+    Equivalent to calling compute_gmst_batch and sun_position_eci_batch,
+    but converts the Julian dates to centuries only once.
+
+    Returns:
+        (gmst, sun_eci) with shapes (N,) and (N, 3).
+    """
+    t = (jd_array + fr_array - 2451545.0) / 36525.0
+    return _gmst_from_centuries(t), _sun_position_from_centuries(t)
+
 
+def _sun_position_from_centuries(t: np.ndarray) -> np.ndarray:
+    """Vectorized Sun ECI position (km) from Julian centuries since J2000."""
     l0 = (280.46646 + 36000.76983 * t) % 360.0
     m = (357.52911 + 35999.05029 * t) % 360.0
     m_rad = m * DEG_TO_RAD
@@ -222,9 +269,10 @@ def sun_position_eci_batch(
     obliquity = (23.439 - 0.013 * t) * DEG_TO_RAD
 
     dist_km = (1.00014 - 0.01671 * np.cos(m_rad)) * AU_KM
+    dist_sin_lon = dist_km * np.sin(sun_lon)
 
     result = np.empty((len(t), 3))
     result[:, 0] = dist_km * np.cos(sun_lon)
-    result[:, 1] = dist_km * np.sin(sun_lon) * np.cos(obliquity)
-    result[:, 2] = dist_km * np.sin(sun_lon) * np.sin(obliquity)
+    result[:, 1] = dist_sin_lon * np.cos(obliquity)
+    result[:, 2] = dist_sin_lon * np.sin(obliquity)
     return result
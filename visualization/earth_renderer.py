@@ -6,7 +6,9 @@ handles rotation to match GMST, and optional day/night terminator.
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +17,9 @@ import pyvista as pv
 
 from utils.constants import (
     EARTH_RENDER_RADIUS,
+    EARTH_SPHERE_RES,
+    EARTH_SPHERE_RES_MAX,
+    EARTH_SPHERE_RES_TIERS,
     NASA_BLUE_MARBLE_URL,
     R_EARTH_EQUATORIAL,
     RAD_TO_DEG,
@@ -22,18 +27,54 @@ from utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+_X_AXIS = (1.0, 0.0, 0.0)
+_Z_AXIS = (0.0, 0.0, 1.0)
+
+
+def _cross3(a, b) -> np.ndarray:
+    """Cross product of two 3-vectors without np.cross's generic overhead."""
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+    return np.array((a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0))
+
+
+@functools.lru_cache(maxsize=4)
+def _unit_circle(n_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """Read-only (n, 1) cos/sin columns of n evenly spaced angles."""
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    cos_a = np.cos(angles)[:, None]
+    sin_a = np.sin(angles)[:, None]
+    cos_a.flags.writeable = False
+    sin_a.flags.writeable = False
+    return cos_a, sin_a
+
+
+@functools.lru_cache(maxsize=4)
+def _closed_loop_lines(n_points: int) -> np.ndarray:
+    """Polyline connectivity visiting n points and closing the loop.
+
+    Shared by every mesh built from it; VTK only reads it.
+    """
+    lines = np.empty(n_points + 2, dtype=np.int64)
+    lines[0] = n_points + 1
+    lines[1:-1] = np.arange(n_points)
+    lines[-1] = 0
+    return lines
+
 
 class EarthRenderer:
     """Manages Earth sphere mesh, texture, rotation, and terminator."""
 
     TEXTURE_CACHE_DIR = Path.home() / ".orbital_propagator" / "textures"
     TEXTURE_FILENAME = "earth_texture.jpg"
+    PROCEDURAL_TEXTURE_FILENAME = "procedural.png"
 
     def __init__(self, plotter: pv.Plotter):
         self._plotter = plotter
         self._earth_mesh: Optional[pv.PolyData] = None
         self._earth_actor = None
         self._terminator_actor = None
+        self._terminator_mesh: Optional[pv.PolyData] = None
         self._current_rotation_deg: float = 0.0
 
     def initialize(self, texture_path: Optional[Path] = None) -> None:
@@ -61,29 +102,40 @@ class EarthRenderer:
 
     def _create_earth_mesh(self) -> pv.PolyData:
         """Create a UV-mapped sphere for equirectangular texture."""
+        resolution = self._adaptive_resolution()
         sphere = pv.Sphere(
             radius=EARTH_RENDER_RADIUS,
-            theta_resolution=100,
-            phi_resolution=100,
+            theta_resolution=resolution,
+            phi_resolution=resolution,
         )
 
-        # Manual UV mapping for equirectangular projection
-        points = sphere.points
-        tex_coords = np.zeros((sphere.n_points, 2))
-
-        for i in range(sphere.n_points):
-            x, y, z = points[i]
-            # Longitude: atan2(y, x) mapped to [0, 1]
-            lon = np.arctan2(y, x)
-            tex_coords[i, 0] = 0.5 + lon / (2.0 * np.pi)
-            # Latitude: asin(z/r) mapped to [0, 1]
-            r = np.sqrt(x * x + y * y + z * z)
-            if r > 0:
-                tex_coords[i, 1] = 0.5 + np.arcsin(np.clip(z / r, -1, 1)) / np.pi
+        # Manual UV mapping for equirectangular projection, over all points
+        points = np.asarray(sphere.points, dtype=np.float64)
+        x, y, z = points[:, 0], points[:, 1], points[:, 2]
+        r = np.sqrt(x * x + y * y + z * z)
+        # Longitude: atan2(y, x) mapped to [0, 1]
+        lon = np.arctan2(y, x)
+        # Latitude: asin(z/r) mapped to [0, 1]; points at r == 0 map to 0
+        z_over_r = np.divide(z, r, out=np.zeros_like(z), where=r > 0)
+        lat = np.arcsin(np.clip(z_over_r, -1.0, 1.0))
+        tex_coords = np.empty((len(points), 2))
+        tex_coords[:, 0] = 0.5 + lon / (2.0 * np.pi)
+        tex_coords[:, 1] = np.where(r > 0, 0.5 + lat / np.pi, 0.0)
 
         sphere.active_texture_coordinates = tex_coords
         return sphere
 
+    def _adaptive_resolution(self) -> int:
+        """Sphere resolution for the plotter's current window size."""
+        try:
+            longest = max(self._plotter.window_size)
+        except (AttributeError, TypeError, ValueError):
+            return EARTH_SPHERE_RES
+        for max_side, resolution in EARTH_SPHERE_RES_TIERS:
+            if longest <= max_side:
+                return resolution
+        return EARTH_SPHERE_RES_MAX
+
     def _load_texture(self, texture_path: Optional[Path] = None) -> Optional[pv.Texture]:
         """Load texture from cache or provided path."""
         # Check provided path first
@@ -113,7 +165,18 @@ class EarthRenderer:
         return self._create_procedural_texture()
 
     def _create_procedural_texture(self) -> Optional[pv.Texture]:
-        """Generate a simple blue sphere texture as fallback."""
+        """Generate a simple blue sphere texture as fallback.
+
+        The generated image is saved to the texture cache and loaded from
+        there on later starts.
+        """
+        cache_path = self.TEXTURE_CACHE_DIR / self.PROCEDURAL_TEXTURE_FILENAME
+        if cache_path.exists():
+            try:
+                return pv.Texture(str(cache_path))
+            except Exception as e:
+                logger.warning("Failed to load cached procedural texture: %s", e)
+
         try:
             from PIL import Image, ImageDraw
 
@@ -130,6 +193,12 @@ class EarthRenderer:
             for x1, y1, x2, y2 in patches:
                 draw.ellipse([x1, y1, x2, y2], fill=(30, 100, 60))
 
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                img.save(cache_path)
+            except OSError as e:
+                logger.debug("Could not cache procedural texture: %s", e)
+
             arr = np.array(img)
             return pv.Texture(arr)
         except ImportError:
@@ -150,31 +219,42 @@ class EarthRenderer:
     def set_terminator(
         self, sun_direction: np.ndarray, visible: bool = True
     ) -> None:
-        """Show/hide day-night terminator line on Earth's surface."""
+        """Show/hide day-night terminator line on Earth's surface.
+
+        The closed polyline mesh and its actor are created once; later
+        updates overwrite the points in place, and hiding keeps both.
+        """
         if not visible:
             if self._terminator_actor is not None:
-                self._plotter.remove_actor(self._terminator_actor)
-                self._terminator_actor = None
+                self._terminator_actor.SetVisibility(False)
             return
 
         points = self._compute_terminator_points(sun_direction)
-        if points is not None:
-            if self._terminator_actor is not None:
-                self._plotter.remove_actor(self._terminator_actor)
-
-            line = pv.Spline(points, n_points=180)
-            self._terminator_actor = self._plotter.add_mesh(
-                line,
-                color="#F59E0B",
-                line_width=2,
-                name="terminator",
-            )
+        if points is None:
+            return
+
+        if self._terminator_mesh is not None and len(points) == self._terminator_mesh.n_points:
+            self._terminator_mesh.points[:] = points
+            self._terminator_mesh.Modified()
+            self._terminator_actor.SetVisibility(True)
+            return
+
+        if self._terminator_actor is not None:
+            self._plotter.remove_actor(self._terminator_actor, render=False)
+        self._terminator_mesh = pv.PolyData(points, lines=_closed_loop_lines(len(points)))
+        self._terminator_actor = self._plotter.add_mesh(
+            self._terminator_mesh,
+            color="#F59E0B",
+            line_width=2,
+            name="terminator",
+            render=False,
+        )
 
     def _compute_terminator_points(
         self, sun_dir: np.ndarray, n_points: int = 180
     ) -> Optional[np.ndarray]:
         """Compute points along the terminator circle on Earth surface."""
-        sun_norm = np.linalg.norm(sun_dir)
+        sun_norm = math.sqrt(float(sun_dir @ sun_dir))
         if sun_norm < 1e-10:
             return None
 
@@ -182,21 +262,17 @@ class EarthRenderer:
 
         # Find two perpendicular vectors
         if abs(sun_unit[2]) < 0.9:
-            perp1 = np.cross(sun_unit, np.array([0.0, 0.0, 1.0]))
+            perp1 = _cross3(sun_unit, _Z_AXIS)
         else:
-            perp1 = np.cross(sun_unit, np.array([1.0, 0.0, 0.0]))
+            perp1 = _cross3(sun_unit, _X_AXIS)
 
-        perp1 /= np.linalg.norm(perp1)
-        perp2 = np.cross(sun_unit, perp1)
+        perp1 /= math.sqrt(float(perp1 @ perp1))
+        perp2 = _cross3(sun_unit, perp1)
 
-        angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+        cos_a, sin_a = _unit_circle(n_points)
         r = EARTH_RENDER_RADIUS * 1.001  # Slightly above surface
 
-        points = np.empty((n_points, 3))
-        for i, a in enumerate(angles):
-            points[i] = r * (np.cos(a) * perp1 + np.sin(a) * perp2)
-
-        return points
+        return r * (cos_a * perp1 + sin_a * perp2)
 
     @property
     def mesh(self) -> Optional[pv.PolyData]:
@@ -7,6 +7,7 @@ by altitude, velocity, or solid color per satellite.
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -23,8 +24,11 @@ from utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Altitude color range (km) for the altitude color mode
+ALTITUDE_CLIM = (200.0, 36000.0)
 
-@dataclass
+
+@dataclass(slots=True)
 class OrbitTrail:
     """Data holder for a single orbit trail."""
 
@@ -40,11 +44,22 @@ class OrbitTrail:
 class OrbitRenderer:
     """Manages orbit trail rendering for all satellites."""
 
+    # The ground track varies slowly; longer trails are strided down to this
+    GROUND_TRACK_MAX_POINTS = 360
+
     def __init__(self, plotter: pv.Plotter):
         self._plotter = plotter
         self._trails: dict[str, OrbitTrail] = {}
         self._color_mode: str = "solid"  # solid, altitude, velocity
         self._ground_tracks: dict[str, object] = {}  # sat_id -> actor
+        self._ground_meshes: dict[str, pv.PolyData] = {}
+        # sat_id -> (source ECI trail, its sampled points projected onto
+        # the ground-track sphere); only the GMST rotation changes per tick
+        self._ground_dirs: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        # Polyline connectivity by point count; trails and ground tracks of
+        # equal length share one array (VTK only reads it)
+        self._lines_cache: dict[int, np.ndarray] = {}
+        self._altitude_lut: Optional[pv.LookupTable] = None
 
     def add_orbit(
         self,
@@ -52,6 +67,7 @@ class OrbitRenderer:
         trail_points_eci: np.ndarray,
         color: str = "#3B82F6",
         color_index: int = 0,
+        render: bool = True,
     ) -> None:
         """Add orbit trail for a satellite.
 
@@ -60,6 +76,7 @@ class OrbitRenderer:
             trail_points_eci: shape (N, 3) ECI positions in km
             color: hex color for solid mode
             color_index: index into SATELLITE_COLORS
+            render: render immediately (False when adding in bulk)
         """
         if sat_id in self._trails:
             self.remove_orbit(sat_id)
@@ -72,27 +89,33 @@ class OrbitRenderer:
         # Create polyline mesh
         mesh = self._create_trail_mesh(render_points)
 
+        # Kept for ground tracks and color-mode rebuilds; a read-only view
+        # shares the caller's buffer without copying or freezing it
+        points_eci = trail_points_eci.view()
+        points_eci.flags.writeable = False
+
         trail = OrbitTrail(
             sat_id=sat_id,
             mesh=mesh,
             points_render=render_points,
-            points_eci=trail_points_eci.copy(),
+            points_eci=points_eci,
             color=actual_color,
         )
 
         # Add to scene based on color mode
         if self._color_mode == "altitude":
-            altitudes = self._compute_altitudes(trail_points_eci)
+            altitudes = self._compute_altitudes(points_eci)
             mesh.point_data["altitude"] = altitudes
             trail.actor = self._plotter.add_mesh(
                 mesh,
                 scalars="altitude",
                 cmap="coolwarm",
-                clim=[200, 36000],
+                clim=list(ALTITUDE_CLIM),
                 line_width=2,
                 render_lines_as_tubes=True,
                 show_scalar_bar=False,
                 name=f"orbit_{sat_id}",
+                render=render,
             )
         elif self._color_mode == "velocity":
             # Velocity coloring would need velocity data
@@ -102,6 +125,7 @@ class OrbitRenderer:
                 line_width=2,
                 render_lines_as_tubes=True,
                 name=f"orbit_{sat_id}",
+                render=render,
             )
         else:
             trail.actor = self._plotter.add_mesh(
@@ -110,6 +134,7 @@ class OrbitRenderer:
                 line_width=2,
                 render_lines_as_tubes=True,
                 name=f"orbit_{sat_id}",
+                render=render,
             )
 
         self._trails[sat_id] = trail
@@ -122,9 +147,7 @@ class OrbitRenderer:
                 self._plotter.remove_actor(trail.actor)
             del self._trails[sat_id]
 
-        if sat_id in self._ground_tracks:
-            self._plotter.remove_actor(self._ground_tracks[sat_id])
-            del self._ground_tracks[sat_id]
+        self.remove_ground_track(sat_id)
 
     def update_trail(self, sat_id: str, new_points_eci: np.ndarray) -> None:
         """Update trail points in-place."""
@@ -141,23 +164,51 @@ class OrbitRenderer:
             # Point count changed, recreate
             self.remove_orbit(sat_id)
             self.add_orbit(sat_id, new_points_eci, trail.color)
+            return
 
-        trail.points_eci = new_points_eci.copy()
+        points_eci = new_points_eci.view()
+        points_eci.flags.writeable = False
+        trail.points_eci = points_eci
         trail.points_render = render_points
 
     def set_color_mode(self, mode: str) -> None:
-        """Switch all trails between altitude/velocity/solid coloring."""
+        """Switch all trails between altitude/velocity/solid coloring.
+
+        Existing actors are recolored in place through their mappers;
+        meshes and actors are kept.
+        """
+        if mode == self._color_mode:
+            return
         self._color_mode = mode
-        # Recreate all trails with new color mode
-        trails_data = {
-            sid: (t.points_eci, t.color)
-            for sid, t in self._trails.items()
-            if t.points_eci is not None
-        }
-        for sid in list(self._trails.keys()):
-            self.remove_orbit(sid)
-        for sid, (points, color) in trails_data.items():
-            self.add_orbit(sid, points, color)
+        for trail in self._trails.values():
+            if trail.actor is not None and trail.mesh is not None:
+                self._apply_color_mode(trail)
+
+    def _apply_color_mode(self, trail: OrbitTrail) -> None:
+        """Point an existing trail actor at the current color mode."""
+        mapper = trail.actor.GetMapper()
+        if self._color_mode == "altitude":
+            if "altitude" not in trail.mesh.point_data:
+                trail.mesh.point_data["altitude"] = self._compute_altitudes(
+                    trail.points_eci
+                )
+            mapper.SetLookupTable(self._get_altitude_lut())
+            mapper.SetScalarModeToUsePointFieldData()
+            mapper.SelectColorArray("altitude")
+            mapper.SetScalarRange(*ALTITUDE_CLIM)
+            mapper.ScalarVisibilityOn()
+        else:
+            # Velocity coloring would need velocity data; shown as solid
+            mapper.ScalarVisibilityOff()
+            trail.actor.GetProperty().SetColor(pv.Color(trail.color).float_rgb)
+
+    def _get_altitude_lut(self) -> pv.LookupTable:
+        """Shared altitude color map, built on first use."""
+        if self._altitude_lut is None:
+            self._altitude_lut = pv.LookupTable(
+                cmap="coolwarm", scalar_range=ALTITUDE_CLIM
+            )
+        return self._altitude_lut
 
     def set_visibility(self, sat_id: str, visible: bool) -> None:
         """Show or hide a specific orbit trail."""
@@ -181,35 +232,84 @@ class OrbitRenderer:
         gmst_rad: float,
     ) -> None:
         """Project orbit onto Earth surface."""
-        # Remove existing ground track
-        if sat_id in self._ground_tracks:
-            self._plotter.remove_actor(self._ground_tracks[sat_id])
+        self.add_ground_tracks({sat_id: eci_points}, gmst_rad)
 
-        # Rotate ECI to ECEF
-        cos_g = np.cos(gmst_rad)
-        sin_g = np.sin(gmst_rad)
-        ecef = np.empty_like(eci_points)
-        ecef[:, 0] = eci_points[:, 0] * cos_g + eci_points[:, 1] * sin_g
-        ecef[:, 1] = -eci_points[:, 0] * sin_g + eci_points[:, 1] * cos_g
-        ecef[:, 2] = eci_points[:, 2]
-
-        # Project to unit sphere surface (slightly above)
-        norms = np.linalg.norm(ecef, axis=1, keepdims=True)
-        norms = np.maximum(norms, 1e-10)
-        surface_points = ecef / norms * (EARTH_RENDER_RADIUS + 0.003)
+    def add_ground_tracks(
+        self,
+        sats_eci: dict[str, np.ndarray],
+        gmst_rad: float,
+    ) -> None:
+        """Project several orbits onto Earth surface at one GMST.
 
-        # Convert to render coordinates
-        surface_render = surface_points / R_EARTH_EQUATORIAL
+        Sampling and projection onto the sphere are cached per trail, so a
+        call only rotates the cached points by GMST and writes them into
+        the existing ground-track mesh.
+        """
+        rotation_t = self._gmst_rotation(gmst_rad).T
+        for sat_id, eci_points in sats_eci.items():
+            surface_render = self._ground_track_directions(sat_id, eci_points) @ rotation_t
+            mesh = self._ground_meshes.get(sat_id)
+            if mesh is not None and mesh.n_points == len(surface_render):
+                mesh.points[:] = surface_render
+                mesh.Modified()
+            else:
+                self._set_ground_track(sat_id, surface_render)
+
+    @classmethod
+    def _ground_track_samples(cls, eci_points: np.ndarray) -> np.ndarray:
+        """Strided view of a trail, thinned to about GROUND_TRACK_MAX_POINTS."""
+        stride = len(eci_points) // cls.GROUND_TRACK_MAX_POINTS
+        return eci_points[::stride] if stride > 1 else eci_points
+
+    def _ground_track_directions(self, sat_id: str, eci_points: np.ndarray) -> np.ndarray:
+        """Sampled trail points on the ground-track sphere, before rotation.
+
+        The rotation about z preserves lengths, so projecting before it
+        matches projecting after and can be done once per trail.
+        """
+        cached = self._ground_dirs.get(sat_id)
+        if cached is not None and cached[0] is eci_points:
+            return cached[1]
+
+        samples = self._ground_track_samples(eci_points)
+        # Project to unit sphere surface (slightly above) and convert to
+        # render coordinates in one scale per point; einsum squares and
+        # sums each row in a single pass
+        sq = np.einsum("ij,ij->i", samples, samples)
+        np.maximum(sq, 1e-20, out=sq)
+        scale = (EARTH_RENDER_RADIUS + 0.003) / R_EARTH_EQUATORIAL / np.sqrt(sq)
+        directions = (samples * scale[:, None]).astype(np.float32, copy=False)
+        self._ground_dirs[sat_id] = (eci_points, directions)
+        return directions
+
+    @staticmethod
+    def _gmst_rotation(gmst_rad: float) -> np.ndarray:
+        """ECI to ECEF rotation about z, in float32 like the mesh points."""
+        cos_g = math.cos(gmst_rad)
+        sin_g = math.sin(gmst_rad)
+        return np.array((
+            (cos_g, sin_g, 0.0),
+            (-sin_g, cos_g, 0.0),
+            (0.0, 0.0, 1.0),
+        ), dtype=np.float32)
+
+    def _set_ground_track(self, sat_id: str, surface_render: np.ndarray) -> None:
+        """Replace a satellite's ground-track actor with a new polyline."""
+        # Remove existing ground track
+        if sat_id in self._ground_tracks:
+            self._plotter.remove_actor(self._ground_tracks[sat_id], render=False)
 
         mesh = self._create_trail_mesh(surface_render)
         color = self._trails[sat_id].color if sat_id in self._trails else "#3B82F6"
 
+        self._ground_meshes[sat_id] = mesh
         self._ground_tracks[sat_id] = self._plotter.add_mesh(
             mesh,
             color=color,
             line_width=1.5,
             opacity=0.5,
             name=f"ground_{sat_id}",
+            render=False,
         )
 
     def remove_ground_track(self, sat_id: str) -> None:
@@ -217,6 +317,16 @@ class OrbitRenderer:
         if sat_id in self._ground_tracks:
             self._plotter.remove_actor(self._ground_tracks[sat_id])
             del self._ground_tracks[sat_id]
+        self._ground_meshes.pop(sat_id, None)
+        self._ground_dirs.pop(sat_id, None)
+
+    def clear_ground_tracks(self) -> None:
+        """Remove every ground track without rendering in between."""
+        for actor in self._ground_tracks.values():
+            self._plotter.remove_actor(actor, render=False)
+        self._ground_tracks.clear()
+        self._ground_meshes.clear()
+        self._ground_dirs.clear()
 
     def _create_trail_mesh(self, points: np.ndarray) -> pv.PolyData:
         """Create a polyline mesh from ordered points."""
@@ -224,12 +334,16 @@ class OrbitRenderer:
         if n < 2:
             return pv.PolyData(points)
 
-        # Build polyline connectivity
-        lines = np.empty(n + 1, dtype=np.int64)
-        lines[0] = n
-        lines[1:] = np.arange(n)
+        lines = self._lines_cache.get(n)
+        if lines is None:
+            # Build polyline connectivity
+            lines = np.empty(n + 1, dtype=np.int64)
+            lines[0] = n
+            lines[1:] = np.arange(n)
+            self._lines_cache[n] = lines
 
-        return pv.PolyData(points.astype(np.float64), lines=lines)
+        # float32 is VTK's native point type; avoid upcasting a copy
+        return pv.PolyData(points.astype(np.float32, copy=False), lines=lines)
 
     def _compute_altitudes(self, eci_points: np.ndarray) -> np.ndarray:
         """Compute altitude above Earth surface for each trail point (km)."""
@@ -1,45 +1,184 @@
 """Satellite marker rendering with labels, velocity vectors, and nadir lines.
 
-Manages satellite markers as 3D spheres at their current propagated
-positions, with toggle-able labels, velocity arrows, and nadir lines.
+Manages satellite markers as instanced 3D spheres at their current
+propagated positions, with toggle-able labels, velocity arrows, and
+nadir lines.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 import pyvista as pv
+from vtkmodules.vtkRenderingCore import vtkActor, vtkGlyph3DMapper
 
+from core.coordinate_transforms import eci_to_render_coords, eci_to_render_coords_batch
 from utils.constants import (
     EARTH_RENDER_RADIUS,
     R_EARTH_EQUATORIAL,
     SATELLITE_COLORS,
     SATELLITE_HIGHLIGHT_RADIUS,
     SATELLITE_MARKER_RADIUS,
+    SATELLITE_MARKER_RES,
     VELOCITY_VECTOR_SCALE,
 )
 
 logger = logging.getLogger(__name__)
 
+# Label anchor relative to the marker centre
+_LABEL_OFFSET = np.array([0.0, 0.0, SATELLITE_MARKER_RADIUS * 2])
+
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb8(hex_color: str) -> tuple[int, int, int]:
+    """Convert hex color to an 8-bit RGB tuple (memoized)."""
+    v = int(hex_color.lstrip("#"), 16)
+    return (v >> 16, (v >> 8) & 0xFF, v & 0xFF)
+
+
+_HIGHLIGHT_RGB8 = (255, 255, 255)
+
+
+class _MarkerCloud:
+    """All satellite markers drawn as instances of one sphere.
+
+    Positions, colors and scales live in capacity-doubling NumPy buffers
+    whose live prefix is shared with VTK; a vtkGlyph3DMapper draws one
+    sphere per point from a single actor. A hidden marker has scale 0.
+    """
+
+    def __init__(self, template: pv.PolyData, capacity: int = 64):
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        # Slots for the last id tuple passed to set_positions; reset when
+        # markers are added or removed (removal moves slots)
+        self._slots_key: Optional[tuple[str, ...]] = None
+        self._slots = np.empty(0, dtype=np.intp)
+        # float32 is VTK's native point type: shared as-is, no casts
+        self._xyz = np.zeros((capacity, 3), dtype=np.float32)
+        self._rgb = np.zeros((capacity, 3), dtype=np.uint8)
+        self._scale = np.zeros(capacity, dtype=np.float32)
+        self._cloud = pv.PolyData()
+
+        mapper = vtkGlyph3DMapper()
+        mapper.SetInputData(self._cloud)
+        mapper.SetSourceData(template)
+        mapper.OrientOff()
+        mapper.SetScaleArray("scale")
+        mapper.SetScaleModeToScaleByMagnitude()
+        mapper.ScalingOn()
+        mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray("rgb")
+        mapper.SetColorModeToDirectScalars()
+        mapper.ScalarVisibilityOn()
+
+        self.actor = vtkActor()
+        self.actor.SetMapper(mapper)
+        self.actor.GetProperty().SetInterpolationToPhong()
+
+    def add(self, sat_id: str, position: np.ndarray, rgb: tuple[int, int, int]) -> None:
+        i = len(self._ids)
+        if i == len(self._xyz):
+            self._grow()
+        self._ids.append(sat_id)
+        self._index[sat_id] = i
+        self._xyz[i] = position
+        self._rgb[i] = rgb
+        self._scale[i] = 1.0
+        self._sync()
+
+    def remove(self, sat_id: str) -> None:
+        """Drop a marker, moving the last one into its slot."""
+        i = self._index.pop(sat_id, None)
+        if i is None:
+            return
+        last = len(self._ids) - 1
+        if i != last:
+            moved = self._ids[last]
+            self._ids[i] = moved
+            self._index[moved] = i
+            self._xyz[i] = self._xyz[last]
+            self._rgb[i] = self._rgb[last]
+            self._scale[i] = self._scale[last]
+        self._ids.pop()
+        self._sync()
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Live (n, 3) view of the marker positions."""
+        return self._xyz[: len(self._ids)]
+
+    def position(self, sat_id: str) -> Optional[tuple[float, float, float]]:
+        i = self._index.get(sat_id)
+        return None if i is None else tuple(self._xyz[i].tolist())
+
+    def set_position(self, sat_id: str, position: np.ndarray) -> None:
+        self._xyz[self._index[sat_id]] = position
+        self._cloud.Modified()
 
-@dataclass
+    def set_positions(
+        self, sat_ids: tuple[str, ...], positions: np.ndarray, valid: np.ndarray
+    ) -> None:
+        """Write positions for sat_ids where valid, with one Modified.
+
+        Ids without a marker are ignored.
+        """
+        if sat_ids is not self._slots_key:
+            self._slots_key = sat_ids
+            self._slots = np.fromiter(
+                (self._index.get(sat_id, -1) for sat_id in sat_ids),
+                dtype=np.intp,
+                count=len(sat_ids),
+            )
+        write = valid & (self._slots >= 0)
+        self._xyz[self._slots[write]] = positions[write]
+        self._cloud.Modified()
+
+    def set_color(self, sat_id: str, rgb: tuple[int, int, int]) -> None:
+        self._rgb[self._index[sat_id]] = rgb
+        self._cloud.Modified()
+
+    def set_visible(self, sat_id: str, visible: bool) -> None:
+        self._scale[self._index[sat_id]] = 1.0 if visible else 0.0
+        self._cloud.Modified()
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._xyz)
+        for name in ("_xyz", "_rgb", "_scale"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def _sync(self) -> None:
+        """Point VTK at the live prefix of each buffer (views, no copies)."""
+        self._slots_key = None
+        n = len(self._ids)
+        self._cloud.points = self._xyz[:n]
+        self._cloud.point_data["rgb"] = self._rgb[:n]
+        self._cloud.point_data["scale"] = self._scale[:n]
+        self._cloud.Modified()
+
+
+@dataclass(slots=True)
 class SatelliteVisual:
     """Holds all VTK actors for one satellite."""
 
     sat_id: str
     name: str
     color: str
-    marker_mesh: Optional[pv.PolyData] = None
-    marker_actor: object = None
     label_actor: object = None
+    label_mesh: Optional[pv.PolyData] = None
     velocity_actor: object = None
     nadir_actor: object = None
+    nadir_mesh: Optional[pv.PolyData] = None
     is_selected: bool = False
     is_visible: bool = True
-    current_pos: Optional[np.ndarray] = None
 
 
 class SatelliteRenderer:
@@ -52,6 +191,8 @@ class SatelliteRenderer:
         self._show_labels: bool = True
         self._show_velocity: bool = False
         self._show_nadir: bool = False
+        self._markers: Optional[_MarkerCloud] = None
+        self._arrow_template: Optional[pv.PolyData] = None
 
     def add_satellite(
         self,
@@ -59,39 +200,26 @@ class SatelliteRenderer:
         name: str,
         position_render: np.ndarray,
         color: str = "#3B82F6",
+        render: bool = True,
     ) -> None:
-        """Create marker sphere at initial position."""
+        """Create marker sphere at initial position.
+
+        Pass render=False when adding many satellites and render once after.
+        """
         if sat_id in self._satellites:
             self.remove_satellite(sat_id)
 
-        marker = pv.Sphere(
-            radius=SATELLITE_MARKER_RADIUS,
-            center=position_render,
-            theta_resolution=12,
-            phi_resolution=12,
-        )
-
-        actor = self._plotter.add_mesh(
-            marker,
-            color=color,
-            smooth_shading=True,
-            name=f"sat_{sat_id}",
-        )
+        self._get_markers().add(sat_id, position_render, _hex_to_rgb8(color))
 
-        vis = SatelliteVisual(
-            sat_id=sat_id,
-            name=name,
-            color=color,
-            marker_mesh=marker,
-            marker_actor=actor,
-            current_pos=position_render.copy(),
-        )
+        vis = SatelliteVisual(sat_id=sat_id, name=name, color=color)
 
         # Add label if enabled
         if self._show_labels:
             self._add_label(vis)
 
         self._satellites[sat_id] = vis
+        if render:
+            self._plotter.render()
 
     def remove_satellite(self, sat_id: str) -> None:
         """Remove all actors for a satellite."""
@@ -99,7 +227,8 @@ class SatelliteRenderer:
             return
 
         vis = self._satellites[sat_id]
-        for actor in [vis.marker_actor, vis.label_actor, vis.velocity_actor, vis.nadir_actor]:
+        self._markers.remove(sat_id)
+        for actor in [vis.label_actor, vis.velocity_actor, vis.nadir_actor]:
             if actor is not None:
                 self._plotter.remove_actor(actor)
 
@@ -119,19 +248,61 @@ class SatelliteRenderer:
             return
 
         vis = self._satellites[sat_id]
-        pos_render = position_eci / R_EARTH_EQUATORIAL
+        pos_render = eci_to_render_coords(position_eci)
+
+        self._markers.set_position(sat_id, pos_render)
+        self._move_attachments(vis, pos_render, velocity_eci)
+
+    def update_positions(
+        self,
+        sat_ids: tuple[str, ...],
+        positions_eci: np.ndarray,
+        velocities_eci: np.ndarray,
+        valid: np.ndarray,
+    ) -> None:
+        """Move many markers at once; rows where valid is False are skipped.
+
+        Marker positions are written as one array operation into the
+        buffer VTK draws from, which is also the only copy of each
+        satellite's position. Satellites are visited one by one only while
+        labels, arrows or nadir lines are shown.
+        """
+        if self._markers is None:
+            return
+        # SGP4 states stay float64; render coordinates only need float32
+        positions_render = eci_to_render_coords_batch(
+            positions_eci, out=np.empty(positions_eci.shape, dtype=np.float32)
+        )
+        self._markers.set_positions(sat_ids, positions_render, valid)
+        if not (self._show_labels or self._show_velocity or self._show_nadir):
+            return
 
-        if vis.marker_mesh is not None and vis.current_pos is not None:
-            delta = pos_render - vis.current_pos
-            vis.marker_mesh.translate(delta, inplace=True)
+        satellites = self._satellites
+        move_attachments = self._move_attachments
+        for i in np.flatnonzero(valid).tolist():
+            vis = satellites.get(sat_ids[i])
+            if vis is not None:
+                move_attachments(vis, positions_render[i], velocities_eci[i])
 
-        vis.current_pos = pos_render.copy()
+    def _move_attachments(
+        self,
+        vis: SatelliteVisual,
+        pos_render: np.ndarray,
+        velocity_eci: Optional[np.ndarray],
+    ) -> None:
+        """Bring a satellite's attached actors to pos_render.
 
-        # Update label position
-        if vis.label_actor is not None:
-            self._plotter.remove_actor(vis.label_actor)
-            if self._show_labels and vis.is_visible:
-                self._add_label(vis)
+        Hidden labels are left behind; toggle_labels moves them on show.
+        """
+        # Update label position in place when its point set is reachable
+        if self._show_labels:
+            if vis.label_mesh is not None:
+                np.add(pos_render, _LABEL_OFFSET, out=vis.label_mesh.points[0])
+                vis.label_mesh.Modified()
+            elif vis.label_actor is not None:
+                self._plotter.remove_actor(vis.label_actor, render=False)
+                if vis.is_visible:
+                    self._add_label(vis)
 
         # Update velocity vector
         if self._show_velocity and velocity_eci is not None and vis.is_visible:
@@ -147,28 +318,21 @@ class SatelliteRenderer:
         if self._selected_id and self._selected_id in self._satellites:
             prev = self._satellites[self._selected_id]
             prev.is_selected = False
-            if prev.marker_actor is not None:
-                prop = prev.marker_actor.GetProperty()
-                rgb = self._hex_to_rgb(prev.color)
-                prop.SetColor(rgb[0], rgb[1], rgb[2])
+            self._markers.set_color(prev.sat_id, _hex_to_rgb8(prev.color))
 
         # Select new
         self._selected_id = sat_id
         if sat_id in self._satellites:
             vis = self._satellites[sat_id]
             vis.is_selected = True
-            if vis.marker_actor is not None:
-                prop = vis.marker_actor.GetProperty()
-                prop.SetColor(1.0, 1.0, 1.0)  # White highlight
+            self._markers.set_color(sat_id, _HIGHLIGHT_RGB8)
 
     def deselect(self) -> None:
         """Deselect current satellite."""
         if self._selected_id and self._selected_id in self._satellites:
             vis = self._satellites[self._selected_id]
             vis.is_selected = False
-            if vis.marker_actor is not None:
-                rgb = self._hex_to_rgb(vis.color)
-                vis.marker_actor.GetProperty().SetColor(rgb[0], rgb[1], rgb[2])
+            self._markers.set_color(vis.sat_id, _hex_to_rgb8(vis.color))
         self._selected_id = None
 
     def set_visibility(self, sat_id: str, visible: bool) -> None:
@@ -177,8 +341,7 @@ class SatelliteRenderer:
             return
         vis = self._satellites[sat_id]
         vis.is_visible = visible
-        if vis.marker_actor:
-            vis.marker_actor.SetVisibility(visible)
+        self._markers.set_visible(sat_id, visible)
         if vis.label_actor:
             vis.label_actor.SetVisibility(visible)
         if vis.velocity_actor:
@@ -191,9 +354,17 @@ class SatelliteRenderer:
         self._show_labels = visible
         for vis in self._satellites.values():
             if visible and vis.is_visible:
-                if vis.label_actor is None:
+                if vis.label_mesh is None:
+                    # No point set to move: rebuild at the current position
+                    if vis.label_actor is not None:
+                        self._plotter.remove_actor(vis.label_actor, render=False)
                     self._add_label(vis)
                 else:
+                    # Labels are not moved while hidden; catch up first
+                    position = self.position_of(vis.sat_id)
+                    if position is not None:
+                        np.add(position, _LABEL_OFFSET, out=vis.label_mesh.points[0])
+                        vis.label_mesh.Modified()
                     vis.label_actor.SetVisibility(True)
             elif vis.label_actor is not None:
                 vis.label_actor.SetVisibility(False)
@@ -204,7 +375,7 @@ class SatelliteRenderer:
         if not visible:
             for vis in self._satellites.values():
                 if vis.velocity_actor is not None:
-                    self._plotter.remove_actor(vis.velocity_actor)
+                    self._plotter.remove_actor(vis.velocity_actor, render=False)
                     vis.velocity_actor = None
 
     def toggle_nadir_lines(self, visible: bool) -> None:
@@ -213,15 +384,17 @@ class SatelliteRenderer:
         if not visible:
             for vis in self._satellites.values():
                 if vis.nadir_actor is not None:
-                    self._plotter.remove_actor(vis.nadir_actor)
+                    self._plotter.remove_actor(vis.nadir_actor, render=False)
                     vis.nadir_actor = None
+                    vis.nadir_mesh = None
 
     def _add_label(self, vis: SatelliteVisual) -> None:
         """Add a text label above the satellite."""
-        if vis.current_pos is None:
+        position = self.position_of(vis.sat_id)
+        if position is None:
             return
 
-        label_pos = vis.current_pos + np.array([0, 0, SATELLITE_MARKER_RADIUS * 2])
+        label_pos = np.add(position, _LABEL_OFFSET)
         point = pv.PolyData(label_pos.reshape(1, 3))
         point["labels"] = [vis.name]
 
@@ -235,7 +408,22 @@ class SatelliteRenderer:
             show_points=False,
             always_visible=True,
             name=f"label_{vis.sat_id}",
+            render=False,
         )
+        vis.label_mesh = self._label_points(vis.label_actor)
+
+    @staticmethod
+    def _label_points(label_actor) -> Optional[pv.PolyData]:
+        """The point set behind a point-label actor, to move it in place.
+
+        add_point_labels copies the points it is given into the input of
+        the label hierarchy feeding the actor's mapper.
+        """
+        try:
+            hierarchy = label_actor.GetMapper().GetInputAlgorithm()
+            return pv.wrap(hierarchy.GetInputDataObject(0, 0))
+        except AttributeError:
+            return None
 
     def _update_velocity_arrow(
         self,
@@ -243,64 +431,112 @@ class SatelliteRenderer:
         pos_render: np.ndarray,
         velocity_eci: np.ndarray,
     ) -> None:
-        """Update or create velocity vector arrow."""
-        if vis.velocity_actor is not None:
-            self._plotter.remove_actor(vis.velocity_actor)
+        """Place the satellite's velocity arrow, creating its actor once.
 
+        All arrows share one unit arrow mesh along +x; each tick only the
+        actor's position, orientation and scale change.
+        """
         vel_render = velocity_eci / R_EARTH_EQUATORIAL * VELOCITY_VECTOR_SCALE * 50
-        vel_mag = np.linalg.norm(vel_render)
+        vel_mag = math.sqrt(float(vel_render @ vel_render))
+        actor = vis.velocity_actor
         if vel_mag < 1e-10:
+            if actor is not None:
+                actor.SetVisibility(False)
             return
 
-        direction = vel_render / vel_mag
-        arrow = pv.Arrow(
-            start=pos_render,
-            direction=direction,
-            scale=vel_mag,
-            tip_length=0.2,
-            tip_radius=0.05,
-            shaft_radius=0.02,
-        )
-
-        vis.velocity_actor = self._plotter.add_mesh(
-            arrow,
-            color="#F59E0B",
-            name=f"vel_{vis.sat_id}",
-        )
+        if actor is None:
+            actor = vis.velocity_actor = self._plotter.add_mesh(
+                self._get_arrow_template(),
+                color="#F59E0B",
+                name=f"vel_{vis.sat_id}",
+                render=False,
+            )
+        else:
+            actor.SetVisibility(True)
+
+        # Rotate +x onto the velocity direction about x̂ × d
+        dx, dy, dz = (float(c) / vel_mag for c in vel_render)
+        actor.SetOrientation(0.0, 0.0, 0.0)
+        axis_norm = math.sqrt(dy * dy + dz * dz)
+        if axis_norm > 1e-12:
+            angle = math.degrees(math.atan2(axis_norm, dx))
+            actor.RotateWXYZ(angle, 0.0, -dz / axis_norm, dy / axis_norm)
+        elif dx < 0.0:
+            actor.RotateWXYZ(180.0, 0.0, 0.0, 1.0)
+        actor.SetScale(vel_mag, vel_mag, vel_mag)
+        actor.SetPosition(float(pos_render[0]), float(pos_render[1]), float(pos_render[2]))
+
+    def _get_markers(self) -> _MarkerCloud:
+        """Instanced marker cloud, added to the scene on first use."""
+        if self._markers is None:
+            template = pv.Sphere(
+                radius=SATELLITE_MARKER_RADIUS,
+                center=(0.0, 0.0, 0.0),
+                theta_resolution=SATELLITE_MARKER_RES,
+                phi_resolution=SATELLITE_MARKER_RES,
+            )
+            self._markers = _MarkerCloud(template)
+            self._plotter.add_actor(
+                self._markers.actor, name="satellite_markers", render=False
+            )
+        return self._markers
+
+    def _get_arrow_template(self) -> pv.PolyData:
+        """Unit arrow from the origin along +x, built on first use."""
+        if self._arrow_template is None:
+            self._arrow_template = pv.Arrow(
+                start=(0.0, 0.0, 0.0),
+                direction=(1.0, 0.0, 0.0),
+                scale=1.0,
+                tip_length=0.2,
+                tip_radius=0.05,
+                shaft_radius=0.02,
+            )
+        return self._arrow_template
 
     def _update_nadir_line(
         self, vis: SatelliteVisual, pos_render: np.ndarray
     ) -> None:
-        """Update nadir line from satellite to Earth surface."""
-        if vis.nadir_actor is not None:
-            self._plotter.remove_actor(vis.nadir_actor)
+        """Update nadir line from satellite to Earth surface.
 
-        pos_norm = np.linalg.norm(pos_render)
+        The two-point line mesh is created once; later ticks rewrite its
+        endpoints in place.
+        """
+        pos_norm = math.sqrt(float(pos_render @ pos_render))
         if pos_norm < 1e-10:
             return
 
-        surface_point = pos_render / pos_norm * EARTH_RENDER_RADIUS
+        surface_point = pos_render * (EARTH_RENDER_RADIUS / pos_norm)
 
-        line_points = np.array([pos_render, surface_point])
-        line = pv.Line(pos_render, surface_point)
+        if vis.nadir_mesh is not None:
+            points = vis.nadir_mesh.points
+            points[0] = pos_render
+            points[1] = surface_point
+            vis.nadir_mesh.Modified()
+            return
 
+        vis.nadir_mesh = pv.Line(pos_render, surface_point)
         vis.nadir_actor = self._plotter.add_mesh(
-            line,
+            vis.nadir_mesh,
             color="#A3A3A3",
             line_width=1,
             opacity=0.5,
             name=f"nadir_{vis.sat_id}",
+            render=False,
         )
 
-    @staticmethod
-    def _hex_to_rgb(hex_color: str) -> tuple[float, float, float]:
-        """Convert hex color to normalized RGB tuple."""
-        h = hex_color.lstrip("#")
-        return (
-            int(h[0:2], 16) / 255.0,
-            int(h[2:4], 16) / 255.0,
-            int(h[4:6], 16) / 255.0,
-        )
+    def position_of(self, sat_id: str) -> Optional[tuple[float, float, float]]:
+        """A satellite's current marker position in render units."""
+        if self._markers is None:
+            return None
+        return self._markers.position(sat_id)
+
+    @property
+    def marker_positions(self) -> np.ndarray:
+        """Live (n, 3) view of all marker positions in render units."""
+        if self._markers is None:
+            return np.empty((0, 3), dtype=np.float32)
+        return self._markers.positions
 
     @property
     def satellites(self) -> dict[str, SatelliteVisual]:
@@ -7,15 +7,19 @@ Manages camera, lighting, background, and the per-tick update cycle.
 from __future__ import annotations
 
 import logging
+import math
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import pyvista as pv
+from PyQt6.QtCore import QTimer
 
-from core.coordinate_transforms import eci_to_render_coords
-from core.propagator import OrbitalPropagator
+from core.coordinate_transforms import eci_to_render_coords_batch
+from core.propagator import GroupPropagator, OrbitalPropagator, PropagationResult
 from core.tle_parser import TLEData
 from utils.constants import (
     EARTH_RENDER_RADIUS,
@@ -23,17 +27,116 @@ from utils.constants import (
     SATELLITE_COLORS,
     SPACE_BACKGROUND,
 )
-from utils.time_utils import datetime_to_gmst, sun_position_eci
+from utils.time_utils import (
+    JulianDate,
+    datetime_to_jd,
+    jd_to_gmst,
+    sun_position_eci_jd,
+)
 from visualization.earth_renderer import EarthRenderer
 from visualization.orbit_renderer import OrbitRenderer
 from visualization.satellite_renderer import SatelliteRenderer
 
 logger = logging.getLogger(__name__)
 
+# Placeholder Sun direction for hiding the terminator (never mutated)
+_X_AXIS = np.array((1.0, 0.0, 0.0))
+_X_AXIS.flags.writeable = False
+# Camera targets shared by focus and follow modes
+_ORIGIN = (0.0, 0.0, 0.0)
+_Z_UP = (0.0, 0.0, 1.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SatelliteState:
+    """Fast-changing info panel fields for one satellite."""
+
+    name: str
+    norad_id: int
+    lat: float  # degrees
+    lon: float  # degrees
+    alt: float  # km
+    vel: float  # km/s
+    in_shadow: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SatelliteElements:
+    """Slow-changing info panel fields: orbital elements and TLE age."""
+
+    sma: float  # km
+    ecc: float
+    inc: float  # degrees
+    raan: float  # degrees
+    aop: float  # degrees
+    ta: float  # degrees
+    orbit_type: str
+    period: float  # minutes
+    apogee: float  # km
+    perigee: float  # km
+    tle_age: float  # days
+
+
+@dataclass(frozen=True, slots=True)
+class SatelliteData:
+    """Everything the info panel shows for one satellite."""
+
+    state: SatelliteState
+    elements: SatelliteElements
+
 
 class OrbitalScene:
     """Orchestrates all visualization components."""
 
+    # Fixed attribute set: no per-instance __dict__, and slot access on
+    # the per-tick path
+    __slots__ = (
+        "_plotter",
+        "earth",
+        "orbits",
+        "satellites",
+        "_propagators",
+        "_tle_data",
+        "_color_assignments",
+        "_color_index",
+        "_camera_mode",
+        "_follow_target",
+        "_show_axes",
+        "_show_grid",
+        "_show_ground_tracks",
+        "_show_terminator",
+        "_axes_actor",
+        "_grid_actor",
+        "_starfield_actor",
+        "_render_pending",
+        "_rendered_xyz",
+        "_rendered_gmst",
+        "_last_render_s",
+        "_terminator_minute",
+        "_last_invalid_log_s",
+        "_pending_trails",
+        "_trail_drain_scheduled",
+        "_group",
+        "_group_ids",
+        "_group_stale",
+        "_hidden",
+        "_last_jd",
+        "_tick_results",
+        # Qt signal connections to bound methods may hold weak references
+        "__weakref__",
+    )
+
+    # Largest per-tick movement (render units; Earth radius = 1) that does
+    # not warrant a redraw: well below a pixel at any usable zoom
+    RENDER_EPSILON = 1e-5
+    # A skipped frame is still drawn once the view is this stale, which
+    # also picks up changes made without request_render()
+    MAX_RENDER_SKIP_S = 0.2
+    # Minimum wall time between warnings about failed tick propagations
+    INVALID_LOG_INTERVAL_S = 60.0
+    # Deferred orbit trails generated per event-loop pass after an add
+    TRAILS_PER_PASS = 16
+
     def __init__(self, plotter: pv.Plotter):
         self._plotter = plotter
         self.earth = EarthRenderer(plotter)
@@ -54,6 +157,35 @@ class OrbitalScene:
         self._axes_actor = None
         self._grid_actor = None
         self._starfield_actor = None
+        self._render_pending: bool = False
+        # Marker positions and GMST as of the last tick render
+        self._rendered_xyz: Optional[np.ndarray] = None
+        self._rendered_gmst: float = 0.0
+        self._last_render_s: float = 0.0
+        # Sim minute (of Julian Date) the terminator was last drawn for
+        self._terminator_minute: Optional[int] = None
+        self._last_invalid_log_s: Optional[float] = None
+
+        # Orbit trails still to generate: sat_id -> the instant the trail is
+        # centered on, in insertion order. Drained a few per event-loop pass
+        # so a large add shows its markers at once and stays responsive.
+        self._pending_trails: dict[str, datetime] = {}
+        self._trail_drain_scheduled = False
+
+        # Batch propagator over the visible satellites, rebuilt lazily
+        # after adds, removals and visibility changes
+        self._group: Optional[GroupPropagator] = None
+        self._group_ids: tuple[str, ...] = ()
+        self._group_stale = False
+        # Hidden satellites are left out of the per-tick propagation and
+        # caught up to _last_jd (the last applied instant) when shown
+        self._hidden: set[str] = set()
+        self._last_jd: Optional[JulianDate] = None
+
+        # Single-satellite propagations for the info panel, keyed by
+        # (sat_id, sim_time) and dropped every tick; the fast and slow panel
+        # refreshes often land on the same instant and share one SGP4 call
+        self._tick_results: dict[tuple[str, datetime], PropagationResult] = {}
 
     def initialize(self, texture_path: Optional[Path] = None) -> None:
         """Set up scene: background, lighting, Earth, camera."""
@@ -67,40 +199,72 @@ class OrbitalScene:
 
         Returns sat_id on success, None on failure.
         """
-        sat_id = str(tle_data.catalog_number)
+        sat_ids = self.add_satellites_bulk([tle_data])
+        return sat_ids[0] if sat_ids else None
+
+    def add_satellites_bulk(self, tles: list[TLEData]) -> list[str]:
+        """Add many satellites with one batched propagation and one render.
 
+        Current positions for all satellites come from a single
+        GroupPropagator call; markers and trails are added without
+        intermediate renders; their orbit trails are generated afterwards,
+        a few per event-loop pass. Returns the sat_ids that were registered
+        (satellites whose SGP4 initialization fails are skipped).
+        """
+        entries: list[tuple[str, TLEData, OrbitalPropagator]] = []
+        for tle_data in tles:
+            sat_id = str(tle_data.catalog_number)
+            try:
+                propagator = OrbitalPropagator(tle_data)
+            except Exception as e:
+                logger.error("Failed to create propagator for %s: %s", tle_data.name, e)
+                continue
+
+            self._propagators[sat_id] = propagator
+            self._tle_data[sat_id] = tle_data
+            # A re-added satellite is rebuilt visible; it rejoins the tick
+            self._hidden.discard(sat_id)
+
+            # Assign color
+            color = SATELLITE_COLORS[self._color_index % len(SATELLITE_COLORS)]
+            self._color_assignments[sat_id] = color
+            self._color_index += 1
+            entries.append((sat_id, tle_data, propagator))
+
+        if not entries:
+            return []
+
+        # Propagate current positions for the whole batch at once
+        now = datetime.now(timezone.utc)
         try:
-            propagator = OrbitalPropagator(tle_data)
+            batch = GroupPropagator([p for _, _, p in entries]).propagate_range(now, now)
+            positions_render = eci_to_render_coords_batch(batch.positions_eci[:, 0])
+            valid = batch.valid[:, 0]
         except Exception as e:
-            logger.error("Failed to create propagator for %s: %s", tle_data.name, e)
-            return None
+            logger.error("Failed to propagate %d satellites: %s", len(entries), e)
+            positions_render = None
+            valid = np.zeros(len(entries), dtype=bool)
 
-        self._propagators[sat_id] = propagator
-        self._tle_data[sat_id] = tle_data
+        for k, (sat_id, tle_data, propagator) in enumerate(entries):
+            if not valid[k]:
+                # Still keep the satellite registered even if initial propagation fails
+                logger.error("Failed to propagate %s", tle_data.name)
+                continue
 
-        # Assign color
-        color = SATELLITE_COLORS[self._color_index % len(SATELLITE_COLORS)]
-        self._color_assignments[sat_id] = color
-        self._color_index += 1
-
-        # Propagate current position
-        now = datetime.now(timezone.utc)
-        try:
-            result = propagator.propagate(now)
-            pos_render = eci_to_render_coords(result.position_eci)
+            color = self._color_assignments[sat_id]
 
             # Add marker
-            self.satellites.add_satellite(sat_id, tle_data.name, pos_render, color)
+            self.satellites.add_satellite(
+                sat_id, tle_data.name, positions_render[k], color, render=False
+            )
 
-            # Generate orbit trail (one full period)
-            self._generate_orbit_trail(sat_id, propagator, now)
+            # Orbit trail (one full period) follows from the event loop
+            self._pending_trails[sat_id] = now
 
-        except Exception as e:
-            logger.error("Failed to propagate %s: %s", tle_data.name, e)
-            # Still keep the satellite registered even if initial propagation fails
-            return sat_id
-
-        return sat_id
+        self._schedule_trail_drain()
+        self._group_stale = True
+        self._plotter.render()
+        return [sat_id for sat_id, _, _ in entries]
 
     def remove_satellite(self, sat_id: str) -> None:
         """Remove a satellite from the scene."""
@@ -110,51 +274,174 @@ class OrbitalScene:
         self._propagators.pop(sat_id, None)
         self._tle_data.pop(sat_id, None)
         self._color_assignments.pop(sat_id, None)
+        self._pending_trails.pop(sat_id, None)
+        self._hidden.discard(sat_id)
+        self._group_stale = True
+        self._tick_results.clear()
 
     def update(self, sim_time: datetime) -> None:
-        """Called each tick by SimulationController."""
+        """Move everything to sim_time and redraw."""
         if sim_time.tzinfo is None:
             sim_time = sim_time.replace(tzinfo=timezone.utc)
+        self.update_jd(datetime_to_jd(sim_time))
+
+    def update_jd(self, jd: JulianDate) -> None:
+        """Propagate and redraw at jd, all on the calling thread."""
+        sat_ids, group = self.propagation_snapshot()
+        states = group.propagate_state_jd(jd.jd, jd.fr) if group else None
+        self.apply_positions(jd, sat_ids, states)
+
+    def propagation_snapshot(
+        self,
+    ) -> tuple[tuple[str, ...], Optional[GroupPropagator]]:
+        """Visible sat_ids and a GroupPropagator over them, in the same order.
+
+        Neither is mutated afterwards (changes build a new group), so a
+        worker thread can propagate them while the scene keeps changing.
+        The group is None when no satellite is visible.
+        """
+        if self._group_stale:
+            self._group_stale = False
+            hidden = self._hidden
+            visible = [
+                (sat_id, propagator)
+                for sat_id, propagator in self._propagators.items()
+                if sat_id not in hidden
+            ]
+            self._group_ids = tuple(sat_id for sat_id, _ in visible)
+            self._group = (
+                GroupPropagator([propagator for _, propagator in visible])
+                if visible
+                else None
+            )
+        return self._group_ids, self._group
+
+    def apply_positions(
+        self,
+        jd: JulianDate,
+        sat_ids: tuple[str, ...],
+        states: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]],
+    ) -> None:
+        """Move actors to states propagated at jd and redraw.
+
+        states is GroupPropagator.propagate_state_jd output for sat_ids
+        (ids removed since are ignored). Must run on the GUI thread.
+        """
+        self._tick_results.clear()
+        self._last_jd = jd
 
         # Rotate Earth
-        gmst = datetime_to_gmst(sim_time)
+        gmst = jd_to_gmst(jd)
         self.earth.rotate_to_gmst(gmst)
 
-        # Update satellite positions
-        for sat_id, propagator in self._propagators.items():
-            try:
-                result = propagator.propagate(sim_time)
-                self.satellites.update_position(
-                    sat_id,
-                    result.position_eci,
-                    result.velocity_eci,
-                )
-            except Exception:
-                pass  # Skip failed propagations silently during animation
-
-        # Update terminator if enabled
+        # Update satellite positions; failed propagations are skipped
+        if states is not None:
+            positions, velocities, valid = states
+            self.satellites.update_positions(sat_ids, positions, velocities, valid)
+            if not valid.all():
+                self._log_invalid(sat_ids, valid)
+
+        # Update terminator if enabled. The Sun moves ~0.0007 deg per
+        # minute in ECI, so the line is only recomputed once per sim minute.
         if self._show_terminator:
-            sun_pos = sun_position_eci(sim_time)
-            sun_render = sun_pos / np.linalg.norm(sun_pos)
-            self.earth.set_terminator(sun_render, visible=True)
+            minute = math.floor(jd.jd * 1440.0 + jd.fr * 1440.0)
+            if minute != self._terminator_minute:
+                self._terminator_minute = minute
+                sun_pos = sun_position_eci_jd(jd)
+                sun_render = sun_pos / math.sqrt(float(sun_pos @ sun_pos))
+                self.earth.set_terminator(sun_render, visible=True)
 
         # Update ground tracks if enabled
         if self._show_ground_tracks:
-            for sat_id, propagator in self._propagators.items():
-                if sat_id in self.orbits.trails:
-                    trail = self.orbits.trails[sat_id]
-                    if trail.points_eci is not None:
-                        self.orbits.add_ground_track(sat_id, trail.points_eci, gmst)
+            trails = self.orbits.trails
+            self.orbits.add_ground_tracks(
+                {
+                    sat_id: trails[sat_id].points_eci
+                    for sat_id in self._propagators
+                    if sat_id in trails and trails[sat_id].points_eci is not None
+                },
+                gmst,
+            )
 
         # Camera follow mode
         if self._camera_mode == "follow" and self._follow_target:
             self._update_follow_camera()
 
-        # Render
-        self._plotter.render()
+        # Render (the renderers' per-tick mutations all skip their own),
+        # unless nothing moved visibly since the last tick render
+        if self._render_pending or self._moved_since_render(gmst):
+            self._render_pending = False
+            self._plotter.render()
+            self._mark_rendered(gmst)
+
+    def _log_invalid(self, sat_ids: tuple[str, ...], valid: np.ndarray) -> None:
+        """Warn about satellites SGP4 flagged, at most once per interval."""
+        now = time.perf_counter()
+        last = self._last_invalid_log_s
+        if last is not None and now - last < self.INVALID_LOG_INTERVAL_S:
+            return
+        self._last_invalid_log_s = now
+        failed = np.flatnonzero(~valid)
+        logger.warning(
+            "SGP4 failed for %d/%d satellites (e.g. %s); their markers are held",
+            len(failed),
+            len(valid),
+            ", ".join(sat_ids[i] for i in failed[:5].tolist()),
+        )
 
-    def get_satellite_data(self, sat_id: str, sim_time: datetime) -> Optional[dict]:
+    def _moved_since_render(self, gmst: float) -> bool:
+        """Whether markers or Earth moved more than RENDER_EPSILON."""
+        if time.perf_counter() - self._last_render_s >= self.MAX_RENDER_SKIP_S:
+            return True
+        if abs(gmst - self._rendered_gmst) > self.RENDER_EPSILON:
+            return True
+        xyz = self.satellites.marker_positions
+        last = self._rendered_xyz
+        if last is None or last.shape != xyz.shape:
+            return True
+        return bool(len(xyz)) and float(np.abs(xyz - last).max()) > self.RENDER_EPSILON
+
+    def _mark_rendered(self, gmst: float) -> None:
+        """Remember the state just drawn by apply_positions."""
+        xyz = self.satellites.marker_positions
+        if self._rendered_xyz is not None and self._rendered_xyz.shape == xyz.shape:
+            np.copyto(self._rendered_xyz, xyz)
+        else:
+            self._rendered_xyz = xyz.copy()
+        self._rendered_gmst = gmst
+        self._last_render_s = time.perf_counter()
+
+    def request_render(self) -> None:
+        """Schedule a single render on the next event-loop pass.
+
+        For changes made outside update(); several requests in one pass
+        collapse into one draw.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            QTimer.singleShot(0, self._flush_render)
+
+    def _flush_render(self) -> None:
+        if self._render_pending:
+            self._render_pending = False
+            self._plotter.render()
+
+    def get_satellite_data(
+        self, sat_id: str, sim_time: datetime
+    ) -> Optional[SatelliteData]:
         """Get current orbital data for a satellite (for info panel)."""
+        state = self.get_satellite_state(sat_id, sim_time)
+        if state is None:
+            return None
+        elements = self.get_satellite_elements(sat_id, sim_time)
+        if elements is None:
+            return None
+        return SatelliteData(state=state, elements=elements)
+
+    def get_satellite_state(
+        self, sat_id: str, sim_time: datetime
+    ) -> Optional[SatelliteState]:
+        """Fast-changing info panel fields: position, speed and shadow."""
         if sat_id not in self._propagators:
             return None
 
@@ -165,37 +452,102 @@ class OrbitalScene:
         tle = self._tle_data[sat_id]
 
         try:
-            result = propagator.propagate(sim_time)
-            elements = propagator.get_orbital_elements(sim_time)
-
-            return {
-                "name": tle.name,
-                "norad_id": tle.catalog_number,
-                "lat": result.latitude,
-                "lon": result.longitude,
-                "alt": result.altitude,
-                "vel": result.speed,
-                "sma": elements.semi_major_axis,
-                "ecc": elements.eccentricity,
-                "inc": elements.inclination,
-                "raan": elements.raan,
-                "aop": elements.arg_perigee,
-                "ta": elements.true_anomaly,
-                "orbit_type": elements.orbit_type,
-                "period": elements.period / 60.0,  # Convert to minutes
-                "apogee": elements.apogee_altitude,
-                "perigee": elements.perigee_altitude,
-                "tle_age": tle.tle_age_days,
-                "in_shadow": result.in_shadow,
-            }
+            result = self._propagate_cached(sat_id, propagator, sim_time)
+            return SatelliteState(
+                name=tle.name,
+                norad_id=tle.catalog_number,
+                lat=result.latitude,
+                lon=result.longitude,
+                alt=result.altitude,
+                vel=result.speed,
+                in_shadow=result.in_shadow,
+            )
         except Exception as e:
             logger.error("Failed to get data for %s: %s", sat_id, e)
             return None
 
+    def get_satellite_elements(
+        self, sat_id: str, sim_time: datetime
+    ) -> Optional[SatelliteElements]:
+        """Slow-changing info panel fields: orbital elements and TLE age."""
+        if sat_id not in self._propagators:
+            return None
+
+        if sim_time.tzinfo is None:
+            sim_time = sim_time.replace(tzinfo=timezone.utc)
+
+        propagator = self._propagators[sat_id]
+        tle = self._tle_data[sat_id]
+
+        try:
+            elements = propagator.get_orbital_elements(
+                sim_time, self._propagate_cached(sat_id, propagator, sim_time)
+            )
+            return SatelliteElements(
+                sma=elements.semi_major_axis,
+                ecc=elements.eccentricity,
+                inc=elements.inclination,
+                raan=elements.raan,
+                aop=elements.arg_perigee,
+                ta=elements.true_anomaly,
+                orbit_type=elements.orbit_type,
+                period=elements.period / 60.0,  # Convert to minutes
+                apogee=elements.apogee_altitude,
+                perigee=elements.perigee_altitude,
+                tle_age=tle.tle_age_days,
+            )
+        except Exception as e:
+            logger.error("Failed to get data for %s: %s", sat_id, e)
+            return None
+
+    def _propagate_cached(
+        self, sat_id: str, propagator: OrbitalPropagator, sim_time: datetime
+    ) -> PropagationResult:
+        """propagator.propagate(sim_time), reused within the current tick."""
+        key = (sat_id, sim_time)
+        result = self._tick_results.get(key)
+        if result is None:
+            result = propagator.propagate(sim_time)
+            self._tick_results[key] = result
+        return result
+
     def set_satellite_visible(self, sat_id: str, visible: bool) -> None:
         """Show or hide a satellite and its orbit."""
-        self.satellites.set_visibility(sat_id, visible)
-        self.orbits.set_visibility(sat_id, visible)
+        self.set_satellites_visible([sat_id], visible)
+
+    def set_satellites_visible(self, sat_ids: list[str], visible: bool) -> None:
+        """Show or hide many satellites and their orbits."""
+        for sat_id in sat_ids:
+            self.satellites.set_visibility(sat_id, visible)
+            self.orbits.set_visibility(sat_id, visible)
+
+        # Hidden satellites drop out of the per-tick propagation
+        hidden = self._hidden
+        if visible:
+            shown = [sat_id for sat_id in sat_ids if sat_id in hidden]
+            hidden.difference_update(shown)
+            self._catch_up_positions(shown)
+            changed = bool(shown)
+        else:
+            before = len(hidden)
+            hidden.update(sat_id for sat_id in sat_ids if sat_id in self._propagators)
+            changed = len(hidden) != before
+        if changed:
+            self._group_stale = True
+        self.request_render()
+
+    def _catch_up_positions(self, sat_ids: list[str]) -> None:
+        """Move satellites shown again to the last applied instant."""
+        jd = self._last_jd
+        if jd is None or not sat_ids:
+            return
+        try:
+            group = GroupPropagator([self._propagators[sat_id] for sat_id in sat_ids])
+            positions, velocities, valid = group.propagate_state_jd(jd.jd, jd.fr)
+        except Exception as e:
+            logger.error("Failed to propagate %d shown satellites: %s", len(sat_ids), e)
+            return
+        self.satellites.update_positions(tuple(sat_ids), positions, velocities, valid)
 
     def follow_satellite(self, sat_id: str) -> None:
         """Set camera to track a satellite."""
@@ -209,14 +561,13 @@ class OrbitalScene:
 
     def focus_on_satellite(self, sat_id: str) -> None:
         """Move camera to look at a specific satellite."""
-        if sat_id in self.satellites.satellites:
-            vis = self.satellites.satellites[sat_id]
-            if vis.current_pos is not None:
-                pos = vis.current_pos
-                direction = pos / max(np.linalg.norm(pos), 1e-10)
-                cam_pos = pos + direction * 0.8
-                self._plotter.camera.position = tuple(cam_pos)
-                self._plotter.camera.focal_point = (0, 0, 0)
+        position = self.satellites.position_of(sat_id)
+        if position is not None:
+            # pos + 0.8 * unit(pos), as plain floats
+            x, y, z = position
+            scale = 1.0 + 0.8 / max(math.sqrt(x * x + y * y + z * z), 1e-10)
+            self._plotter.camera.position = (x * scale, y * scale, z * scale)
+            self._plotter.camera.focal_point = _ORIGIN
 
     def toggle_axes(self, visible: bool) -> None:
         """Toggle ECI reference axes."""
@@ -236,49 +587,69 @@ class OrbitalScene:
     def toggle_equatorial_grid(self, visible: bool) -> None:
         """Toggle equatorial plane grid."""
         self._show_grid = visible
-        if visible and self._grid_actor is None:
-            theta = np.linspace(0, 2 * np.pi, 360)
+        if self._grid_actor is not None:
+            # Built once; toggling only flips visibility
+            self._grid_actor.SetVisibility(visible)
+            self.request_render()
+        elif visible:
+            n = 360
             r = 1.5
-            points = np.column_stack([
-                r * np.cos(theta),
-                r * np.sin(theta),
-                np.zeros(360),
-            ])
-            grid_mesh = pv.PolyData(points)
-            lines = np.empty(361, dtype=np.int64)
-            lines[0] = 360
-            lines[1:] = np.arange(360)
-            grid_mesh.lines = lines
+            theta = np.linspace(0, 2 * np.pi, n)
+            # Fill x and y in place; z stays zero
+            points = np.zeros((n, 3), dtype=np.float32)
+            np.cos(theta, out=points[:, 0], casting="same_kind")
+            np.sin(theta, out=points[:, 1], casting="same_kind")
+            points[:, :2] *= r
+            lines = np.empty(n + 1, dtype=np.int64)
+            lines[0] = n
+            lines[1:] = np.arange(n)
 
             self._grid_actor = self._plotter.add_mesh(
-                grid_mesh,
+                pv.PolyData(points, lines=lines),
                 color="#404040",
                 line_width=1,
                 opacity=0.3,
                 name="eq_grid",
             )
-        elif not visible and self._grid_actor is not None:
-            self._plotter.remove_actor(self._grid_actor)
-            self._grid_actor = None
 
     def toggle_ground_tracks(self, visible: bool) -> None:
         """Toggle ground track projection."""
         self._show_ground_tracks = visible
         if not visible:
-            for sat_id in list(self.orbits._ground_tracks.keys()):
-                self.orbits.remove_ground_track(sat_id)
+            self.orbits.clear_ground_tracks()
+            self.request_render()
 
     def toggle_terminator(self, visible: bool) -> None:
         """Toggle day/night terminator line."""
         self._show_terminator = visible
+        self._terminator_minute = None
         if not visible:
-            self.earth.set_terminator(np.array([1, 0, 0]), visible=False)
+            self.earth.set_terminator(_X_AXIS, visible=False)
+
+    def _schedule_trail_drain(self) -> None:
+        if self._pending_trails and not self._trail_drain_scheduled:
+            self._trail_drain_scheduled = True
+            QTimer.singleShot(0, self._drain_pending_trails)
+
+    def _drain_pending_trails(self) -> None:
+        """Generate up to TRAILS_PER_PASS deferred trails, then yield."""
+        self._trail_drain_scheduled = False
+        pending = self._pending_trails
+        for _ in range(min(self.TRAILS_PER_PASS, len(pending))):
+            sat_id = next(iter(pending))
+            now = pending.pop(sat_id)
+            propagator = self._propagators.get(sat_id)
+            if propagator is not None:
+                self._generate_orbit_trail(sat_id, propagator, now, render=False)
+        self.request_render()
+        self._schedule_trail_drain()
 
     def _generate_orbit_trail(
         self,
         sat_id: str,
         propagator: OrbitalPropagator,
         now: datetime,
+        render: bool = True,
     ) -> None:
         """Generate full orbit trail for a satellite."""
         from datetime import timedelta
@@ -290,11 +661,10 @@ class OrbitalScene:
             end = now + timedelta(seconds=period_s / 2)
             step = max(1.0, period_s / 360)
 
-            results = propagator.propagate_range(start, end, step)
-            if results:
-                positions = np.array([r.position_eci for r in results])
+            positions = propagator.propagate_positions(start, end, step)
+            if len(positions):
                 color = self._color_assignments.get(sat_id, "#3B82F6")
-                self.orbits.add_orbit(sat_id, positions, color)
+                self.orbits.add_orbit(sat_id, positions, color, render=render)
         except Exception as e:
             logger.error("Failed to generate trail for %s: %s", sat_id, e)
 
@@ -304,18 +674,30 @@ class OrbitalScene:
 
         # Add random starfield
         n_stars = 2000
-        phi = np.random.uniform(0, 2 * np.pi, n_stars)
-        theta = np.arccos(np.random.uniform(-1, 1, n_stars))
         r = 50.0
-
-        stars = np.column_stack([
-            r * np.sin(theta) * np.cos(phi),
-            r * np.sin(theta) * np.sin(phi),
-            r * np.cos(theta),
-        ])
+        rng = np.random.default_rng()
+        # One draw for both angles, mapped in place to phi in [0, 2 pi)
+        # and cos(theta) in [-1, 1)
+        phi, cos_theta = rng.random((2, n_stars))
+        phi *= 2 * np.pi
+        cos_theta *= 2.0
+        cos_theta -= 1.0
+
+        # Uniform on the sphere: z = r cos(theta) is uniform, and the
+        # in-plane radius r sin(theta) = r sqrt(1 - cos^2) needs no
+        # arccos/sin round trip. Columns are filled in place.
+        stars = np.empty((n_stars, 3), dtype=np.float32)
+        np.cos(phi, out=stars[:, 0], casting="same_kind")
+        np.sin(phi, out=stars[:, 1], casting="same_kind")
+        np.multiply(cos_theta, r, out=stars[:, 2], casting="same_kind")
+        ring = np.square(cos_theta, out=phi)  # phi is no longer needed
+        np.subtract(1.0, ring, out=ring)
+        np.sqrt(ring, out=ring)
+        ring *= r
+        stars[:, :2] *= ring[:, None]
 
         star_cloud = pv.PolyData(stars)
-        brightness = np.random.power(3, n_stars)
+        brightness = rng.power(3, n_stars)
         star_cloud.point_data["brightness"] = brightness
 
         self._starfield_actor = self._plotter.add_mesh(
@@ -358,24 +740,22 @@ class OrbitalScene:
 
     def _update_follow_camera(self) -> None:
         """Position camera behind the followed satellite."""
-        if self._follow_target not in self.satellites.satellites:
+        position = self.satellites.position_of(self._follow_target)
+        if position is None:
             return
 
-        vis = self.satellites.satellites[self._follow_target]
-        if vis.current_pos is None:
-            return
-
-        pos = vis.current_pos
-        pos_norm = np.linalg.norm(pos)
+        # Runs every tick: plain floats, no temporary arrays
+        x, y, z = position
+        pos_norm = math.sqrt(x * x + y * y + z * z)
         if pos_norm < 1e-10:
             return
 
-        direction = pos / pos_norm
-        cam_pos = pos + direction * 0.5
-
-        self._plotter.camera.position = tuple(cam_pos)
-        self._plotter.camera.focal_point = (0, 0, 0)
-        self._plotter.camera.up = (0, 0, 1)
+        # pos + 0.5 * unit(pos)
+        scale = 1.0 + 0.5 / pos_norm
+        camera = self._plotter.camera
+        camera.position = (x * scale, y * scale, z * scale)
+        camera.focal_point = _ORIGIN
+        camera.up = _Z_UP
 
     @property
     def plotter(self) -> pv.Plotter: